@@ -10,6 +10,8 @@ You can read the full docs at https://pypdf.readthedocs.io/.
 from ._crypt_providers import crypt_provider
 from ._doc_common import DocumentInformation
 from ._encryption import PasswordType
+from ._index_cache import DirectoryIndexCache
+from ._object_cache import LRUObjectCache
 from ._page import PageObject, Transformation
 from ._reader import PdfReader
 from ._text_extraction import mult
@@ -31,8 +33,10 @@ _debug_versions = (
 )
 
 __all__ = [
+    "DirectoryIndexCache",
     "DocumentInformation",
     "ImageType",
+    "LRUObjectCache",
     "ObjectDeletionFlag",
     "PageObject",
     "PageRange",
@@ -5,7 +5,6 @@ While the codec implementation can contain details of the PDF specification,
 the module should not do any PDF parsing.
 """
 
-import io
 from abc import ABC, abstractmethod
 
 from pypdf._utils import logger_warning
@@ -53,92 +52,76 @@ class LzwCodec(Codec):
     def __init__(self, max_output_length: int = 75_000_000) -> None:
         self.max_output_length = max_output_length
 
-    def _initialize_encoding_table(self) -> None:
-        """Initialize the encoding table and state to initial conditions."""
-        self.encoding_table: dict[bytes, int] = {bytes([i]): i for i in range(256)}
-        self.next_code = self.EOD_MARKER + 1
-        self.bits_per_code = self.INITIAL_BITS_PER_CODE
-        self.max_code_value = (1 << self.bits_per_code) - 1
-
-    def _increase_next_code(self) -> None:
-        """Update bits_per_code and max_code_value if necessary."""
-        self.next_code += 1
-        if (
-            self.next_code > self.max_code_value
-            and self.bits_per_code < self.MAX_BITS_PER_CODE
-        ):
-            self.bits_per_code += 1
-            self.max_code_value = (1 << self.bits_per_code) - 1
-
     def encode(self, data: bytes) -> bytes:
         """
         Encode data using the LZW compression algorithm.
 
         Taken from PDF 1.7 specs, "7.4.4.2 Details of LZW Encoding".
-        """
-        result_codes: list[int] = []
-
-        # The encoder shall begin by issuing a clear-table code
-        result_codes.append(self.CLEAR_TABLE_MARKER)
-        self._initialize_encoding_table()
-
-        current_sequence = b""
-        for byte in data:
-            next_sequence = current_sequence + bytes([byte])
-
-            if next_sequence in self.encoding_table:
-                # Extend current sequence if already in the table
-                current_sequence = next_sequence
-            else:
-                # Output code for the current sequence
-                result_codes.append(self.encoding_table[current_sequence])
-
-                # Add the new sequence to the table if there's room
-                if self.next_code <= (1 << self.MAX_BITS_PER_CODE) - 1:
-                    self.encoding_table[next_sequence] = self.next_code
-                    self._increase_next_code()
-                else:
-                    # If the table is full, emit a clear-table command
-                    result_codes.append(self.CLEAR_TABLE_MARKER)
-                    self._initialize_encoding_table()
 
-                # Start new sequence
-                current_sequence = bytes([byte])
-
-        # Ensure everything actually is encoded
-        if current_sequence:
-            result_codes.append(self.encoding_table[current_sequence])
-        result_codes.append(self.EOD_MARKER)
-
-        return self._pack_codes_into_bytes(result_codes)
-
-    def _pack_codes_into_bytes(self, codes: list[int]) -> bytes:
-        """
-        Convert the list of result codes into a continuous byte stream, with codes packed as per the code bit-width.
-        The bit-width starts at 9 bits and expands as needed.
+        The table maps the code of a sequence and the next byte to the code of
+        the extended sequence, and the codes are packed into bytes as soon as
+        they are emitted, with a bit width growing from 9 to 12 bits.
         """
-        self._initialize_encoding_table()
-        buffer = 0
-        bits_in_buffer = 0
+        max_table_code = (1 << self.MAX_BITS_PER_CODE) - 1
         output = bytearray()
 
-        for code in codes:
-            buffer = (buffer << self.bits_per_code) | code
-            bits_in_buffer += self.bits_per_code
+        # The encoder shall begin by issuing a clear-table code
+        buffer = self.CLEAR_TABLE_MARKER
+        bits_in_buffer = bits_per_code = self.INITIAL_BITS_PER_CODE
+        encoding_table: dict[int, int] = {}
+        next_code = self.EOD_MARKER + 1
+        max_code_value = (1 << bits_per_code) - 1
+
+        view = memoryview(data).cast("B")
+        current_code = view[0] if view else -1
+        for byte in view[1:]:
+            key = (current_code << 8) | byte
+            code = encoding_table.get(key)
+            if code is not None:
+                # Extend current sequence if already in the table
+                current_code = code
+                continue
 
-            # Codes shall be packed into a continuous bit stream, high-order bit
-            # first. This stream shall then be divided into bytes, high-order bit
-            # first.
+            # Output code for the current sequence. Codes shall be packed into
+            # a continuous bit stream, high-order bit first. This stream shall
+            # then be divided into bytes, high-order bit first.
+            buffer = (buffer << bits_per_code) | current_code
+            bits_in_buffer += bits_per_code
             while bits_in_buffer >= 8:
                 bits_in_buffer -= 8
                 output.append((buffer >> bits_in_buffer) & 0xFF)
-
-            if code == self.CLEAR_TABLE_MARKER:
-                self._initialize_encoding_table()
-            elif code == self.EOD_MARKER:
-                continue
+            buffer &= 0xFF
+
+            # Add the new sequence to the table if there's room
+            if next_code <= max_table_code:
+                encoding_table[key] = next_code
+                next_code += 1
+                if next_code > max_code_value and bits_per_code < self.MAX_BITS_PER_CODE:
+                    bits_per_code += 1
+                    max_code_value = (1 << bits_per_code) - 1
             else:
-                self._increase_next_code()
+                # If the table is full, emit a clear-table command
+                buffer = (buffer << bits_per_code) | self.CLEAR_TABLE_MARKER
+                bits_in_buffer += bits_per_code
+                encoding_table = {}
+                next_code = self.EOD_MARKER + 1
+                bits_per_code = self.INITIAL_BITS_PER_CODE
+                max_code_value = (1 << bits_per_code) - 1
+
+            # Start new sequence
+            current_code = byte
+
+        # Ensure everything actually is encoded
+        if current_code >= 0:
+            buffer = (buffer << bits_per_code) | current_code
+            bits_in_buffer += bits_per_code
+            if next_code + 1 > max_code_value and bits_per_code < self.MAX_BITS_PER_CODE:
+                bits_per_code += 1
+        buffer = (buffer << bits_per_code) | self.EOD_MARKER
+        bits_in_buffer += bits_per_code
+        while bits_in_buffer >= 8:
+            bits_in_buffer -= 8
+            output.append((buffer >> bits_in_buffer) & 0xFF)
 
         # Flush any remaining bits in the buffer
         if bits_in_buffer > 0:
@@ -146,37 +129,6 @@ class LzwCodec(Codec):
 
         return bytes(output)
 
-    def _initialize_decoding_table(self) -> None:
-        self.max_code_value = (1 << self.MAX_BITS_PER_CODE) - 1
-        self.decoding_table = [bytes([i]) for i in range(self.CLEAR_TABLE_MARKER)] + [
-            b""
-        ] * (self.max_code_value - self.CLEAR_TABLE_MARKER + 1)
-        self._table_index = self.EOD_MARKER + 1
-        self._bits_to_get = 9
-
-    def _next_code_decode(self, data: bytes) -> int:
-        self._next_data: int
-        try:
-            while self._next_bits < self._bits_to_get:
-                self._next_data = (self._next_data << 8) | (
-                    data[self._byte_pointer]
-                )
-                self._byte_pointer += 1
-                self._next_bits += 8
-
-            code = (
-                self._next_data >> (self._next_bits - self._bits_to_get)
-            ) & self._and_table[self._bits_to_get - 9]
-            self._next_bits -= self._bits_to_get
-
-            # Reduce data to get rid of the overhead,
-            # which increases performance on large streams significantly.
-            self._next_data = self._next_data & 0xFFFFF
-
-            return code
-        except IndexError:
-            return self.EOD_MARKER
-
     # The following method has been converted to Python from PDFsharp:
     # https://github.com/empira/PDFsharp/blob/5fbf6ed14740bc4e16786816882d32e43af3ff5d/src/foundation/src/PDFsharp/src/PdfSharp/Pdf.Filters/LzwDecode.cs
     #
@@ -212,73 +164,95 @@ class LzwCodec(Codec):
         """
         The following code was converted to Python from the following code:
         https://github.com/empira/PDFsharp/blob/master/src/foundation/src/PDFsharp/src/PdfSharp/Pdf.Filters/LzwDecode.cs
+
+        The codes are read with a local bit buffer, and the decoded sequences
+        are stored in a preallocated table and appended to a single bytearray.
         """
-        self._and_table = [511, 1023, 2047, 4095]
-        self._table_index = 0
-        self._bits_to_get = 9
-        self._byte_pointer = 0
-        self._next_data = 0
-        self._next_bits = 0
-
-        output_stream = io.BytesIO()
-        output_length = 0
-
-        self._initialize_decoding_table()
-        self._byte_pointer = 0
-        self._next_data = 0
-        self._next_bits = 0
-        old_code = self.CLEAR_TABLE_MARKER
+        clear_table_marker = self.CLEAR_TABLE_MARKER
+        eod_marker = self.EOD_MARKER
+        max_output_length = self.max_output_length
+        max_code_value = (1 << self.MAX_BITS_PER_CODE) - 1
+        initial_table = [bytes((i,)) for i in range(clear_table_marker)] + [b""] * (
+            max_code_value - clear_table_marker + 1
+        )
+
+        decoding_table = self.decoding_table = initial_table.copy()
+        table_index = eod_marker + 1
+        bits_to_get = self.INITIAL_BITS_PER_CODE
+        next_data = 0
+        next_bits = 0
+        byte_pointer = 0
+        view = memoryview(data).cast("B")
+        data_length = len(view)
+
+        output = bytearray()
+        old_code = clear_table_marker
+        after_clear_table = False
 
         while True:
-            code = self._next_code_decode(data)
-            if code == self.EOD_MARKER:
+            # At most 7 bits are left from the previous code,
+            # thus the next code needs one or two more bytes.
+            if next_bits + 8 >= bits_to_get:
+                if byte_pointer >= data_length:
+                    break
+                next_data = (next_data << 8) | view[byte_pointer]
+                byte_pointer += 1
+                next_bits += 8
+            else:
+                if byte_pointer + 1 >= data_length:
+                    break
+                next_data = (next_data << 16) | (view[byte_pointer] << 8) | view[byte_pointer + 1]
+                byte_pointer += 2
+                next_bits += 16
+            next_bits -= bits_to_get
+            code = next_data >> next_bits
+            next_data &= (1 << next_bits) - 1
+
+            if code == eod_marker:
                 break
 
-            if code == self.CLEAR_TABLE_MARKER:
-                self._initialize_decoding_table()
-                code = self._next_code_decode(data)
-                if code == self.EOD_MARKER:
-                    break
-                output_stream.write(decoded := self.decoding_table[code])
-                old_code = code
-            elif code < self._table_index:
-                decoded = self.decoding_table[code]
-                output_stream.write(decoded)
-                if old_code != self.CLEAR_TABLE_MARKER:
-                    self._add_entry_decode(self.decoding_table[old_code], decoded[0])
-                old_code = code
+            if after_clear_table:
+                # The first code after clearing the table does not add an entry.
+                after_clear_table = False
+                decoded = decoding_table[code]
+                new_string = b""
+            elif code == clear_table_marker:
+                decoding_table = self.decoding_table = initial_table.copy()
+                table_index = eod_marker + 1
+                bits_to_get = self.INITIAL_BITS_PER_CODE
+                after_clear_table = True
+                continue
+            elif code < table_index:
+                decoded = decoding_table[code]
+                new_string = b"" if old_code == clear_table_marker else decoding_table[old_code] + decoded[:1]
             else:
                 # The code is not in the table and not one of the special codes
-                base = self.decoding_table[old_code]
+                base = decoding_table[old_code]
                 if not base:
                     raise PdfStreamError(
-                        f"LZW code {code} out of range with empty base at table index {self._table_index}."
+                        f"LZW code {code} out of range with empty base at table index {table_index}."
                     )
-                decoded = base + base[:1]
-                output_stream.write(decoded)
-                self._add_entry_decode(base, decoded[0])
-                old_code = code
+                decoded = new_string = base + base[:1]
+            output += decoded
+            old_code = code
 
-            output_length += len(decoded)
-            if output_length > self.max_output_length:
+            if new_string:
+                if table_index > max_code_value:
+                    logger_warning("Ignoring too large LZW table index.", source=__name__)
+                else:
+                    decoding_table[table_index] = new_string
+                    table_index += 1
+                    # Update the number of bits to get based on the table index
+                    if table_index == 511:
+                        bits_to_get = 10
+                    elif table_index == 1023:
+                        bits_to_get = 11
+                    elif table_index == 2047:
+                        bits_to_get = 12
+
+            if len(output) > max_output_length:
                 raise LimitReachedError(
-                    f"Limit reached while decompressing: {output_length} > {self.max_output_length}"
+                    f"Limit reached while decompressing: {len(output)} > {self.max_output_length}"
                 )
 
-        return output_stream.getvalue()
-
-    def _add_entry_decode(self, old_string: bytes, new_char: int) -> None:
-        new_string = old_string + bytes([new_char])
-        if self._table_index > self.max_code_value:
-            logger_warning("Ignoring too large LZW table index.", source=__name__)
-            return
-        self.decoding_table[self._table_index] = new_string
-        self._table_index += 1
-
-        # Update the number of bits to get based on the table index
-        if self._table_index == 511:
-            self._bits_to_get = 10
-        elif self._table_index == 1023:
-            self._bits_to_get = 11
-        elif self._table_index == 2047:
-            self._bits_to_get = 12
+        return bytes(output)
@@ -41,8 +41,9 @@ from typing import (
 )
 
 from ._encryption import Encryption
+from ._font import Font, FontCache
 from ._page import PageObject, _VirtualList
-from ._page_labels import index2label as page_index2page_label
+from ._page_labels import PageLabelLookup
 from ._utils import (
     _TraversalState,
     deprecation_with_replacement,
@@ -93,6 +94,14 @@ OUTLINE_MAX_DEPTH = 100
 PAGE_TREE_MAX_ENTRIES = 100_000
 PAGE_TREE_MAX_DEPTH = 100
 
+#: Attributes of a page which may be inherited from the ancestor nodes in the page tree.
+INHERITABLE_PAGE_ATTRIBUTES = (
+    NameObject(PG.RESOURCES),
+    NameObject(PG.MEDIABOX),
+    NameObject(PG.CROPBOX),
+    NameObject(PG.ROTATE),
+)
+
 
 def convert_to_int(d: bytes, size: int) -> Union[int, tuple[Any, ...]]:
     if size > 8:
@@ -277,6 +286,13 @@ class PdfDocCommon(ABC):
 
     _readonly: bool = False
 
+    _font_cache: Optional[FontCache] = None
+
+    # Maps id() of the pages in flattened_pages to their position
+    _page_index: Optional[dict[int, int]] = None
+
+    _page_label_lookup: Optional[PageLabelLookup] = None
+
     @property
     @abstractmethod
     def root_object(self) -> DictionaryObject:
@@ -302,6 +318,54 @@ class PdfDocCommon(ABC):
     def _info(self) -> Optional[DictionaryObject]:
         ...  # pragma: no cover
 
+    def _get_font(self, pdf_font_dict: PdfObject) -> Font:
+        """Get the font for a font dictionary of the document, see :class:`~pypdf._font.FontCache`."""
+        if self._font_cache is None:
+            self._font_cache = FontCache()
+        return self._font_cache.get(pdf_font_dict)
+
+    def _get_page_index(self, page: PageObject) -> Optional[int]:
+        """
+        Get the position of a page object within the flattened pages.
+
+        The index is keyed by identity, built on first use and kept up to date
+        when pages are appended; any other change of the pages invalidates it.
+
+        Args:
+            page: The page object to locate.
+
+        Returns:
+            The first position of this very page object, or None if it is not
+            part of the flattened pages.
+
+        """
+        if self.flattened_pages is None:
+            self._flatten(self._readonly)
+        assert self.flattened_pages is not None, "mypy"
+        for _ in range(2):
+            if self._page_index is None:
+                self._page_index = {}
+                for i, p in enumerate(self.flattened_pages):
+                    self._page_index.setdefault(id(p), i)
+            index = self._page_index.get(id(page))
+            if index is None:
+                return None
+            if index < len(self.flattened_pages) and self.flattened_pages[index] is page:
+                return index
+            # flattened_pages has been modified behind our back
+            self._page_index = None
+        return None  # pragma: no cover
+
+    def _append_flattened_page(self, page: PageObject) -> None:
+        assert self.flattened_pages is not None, "mypy"
+        if self._page_index is not None:
+            self._page_index.setdefault(id(page), len(self.flattened_pages))
+        self.flattened_pages.append(page)
+
+    def _invalidate_page_index(self) -> None:
+        """Forget the position of the pages after they have been inserted, removed or reordered."""
+        self._page_index = None
+
     @property
     def metadata(self) -> Optional[DocumentInformation]:
         """
@@ -1150,7 +1214,28 @@ class PdfDocCommon(ABC):
         This property is read-only. The labels are in the order that the pages
         appear in the document.
         """
-        return [page_index2page_label(self, i) for i in range(len(self.pages))]
+        return list(PageLabelLookup(self).iter_labels(len(self.pages)))
+
+    def get_page_label(self, page_number: int) -> str:
+        """
+        Retrieve the label of a page, as shown by PDF viewers.
+
+        The page label number tree is only processed on the first call; the
+        result is kept until the page labels are changed with
+        :meth:`PdfWriter.set_page_label<pypdf.PdfWriter.set_page_label>`
+        or ``/PageLabels`` is replaced in the catalog.
+
+        Args:
+            page_number: The page number of the page (pages begin at zero).
+
+        Returns:
+            The label of the page, e.g. "iv" or "4".
+
+        """
+        page_labels = self.root_object.get("/PageLabels")
+        if self._page_label_lookup is None or self._page_label_lookup.page_labels is not page_labels:
+            self._page_label_lookup = PageLabelLookup(self)
+        return self._page_label_lookup[page_number]
 
     @property
     def page_layout(self) -> Optional[str]:
@@ -1240,12 +1325,6 @@ class PdfDocCommon(ABC):
             traversal_state: State shared across the complete traversal.
 
         """
-        inheritable_page_attributes = (
-            NameObject(PG.RESOURCES),
-            NameObject(PG.MEDIABOX),
-            NameObject(PG.CROPBOX),
-            NameObject(PG.ROTATE),
-        )
         if inherit is None:
             inherit = {}
         if visited is None:
@@ -1262,6 +1341,7 @@ class PdfDocCommon(ABC):
             if not isinstance(pages, DictionaryObject):
                 raise PdfReadError("Invalid object in /Pages")
             self.flattened_pages = []
+            self._invalidate_page_index()
         assert pages is not None, "mypy"
 
         if PagesAttributes.TYPE in pages:
@@ -1278,7 +1358,7 @@ class PdfDocCommon(ABC):
             t = "/Pages"
 
         if t == "/Pages":
-            for attr in inheritable_page_attributes:
+            for attr in INHERITABLE_PAGE_ATTRIBUTES:
                 if attr in pages:
                     inherit[attr] = pages[attr]
             pages_reference = getattr(pages, "indirect_reference", object())
@@ -1331,8 +1411,7 @@ class PdfDocCommon(ABC):
                 if attr_in not in page_obj:
                     page_obj[attr_in] = value
 
-            # TODO: Could flattened_pages be None at this point?
-            self.flattened_pages.append(page_obj)  # type: ignore[union-attr]
+            self._append_flattened_page(page_obj)
 
     def remove_page(
         self,
@@ -1364,8 +1443,9 @@ class PdfDocCommon(ABC):
             page = p
 
         if not isinstance(page, int):
+            index = self._get_page_index(page)
             try:
-                page = self.flattened_pages.index(page)
+                page = self.flattened_pages.index(page) if index is None else index
             except ValueError:
                 logger_warning("Cannot find page in pages", source=__name__)
                 return
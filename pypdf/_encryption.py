@@ -58,6 +58,9 @@ from .generic import (
     create_string_object,
 )
 
+#: Number of crypt filters, which depend on the object number, kept by an Encryption.
+CRYPT_FILTER_CACHE_SIZE = 1024
+
 
 class CryptFilter:
     def __init__(
@@ -65,10 +68,13 @@ class CryptFilter:
         stm_crypt: CryptBase,
         str_crypt: CryptBase,
         ef_crypt: CryptBase,
+        stream_key: Optional[tuple[str, bytes]] = None,
     ) -> None:
         self.stm_crypt = stm_crypt
         self.str_crypt = str_crypt
         self.ef_crypt = ef_crypt
+        # The method and the key the data of streams is encrypted with.
+        self.stream_key = stream_key
 
     def encrypt_object(self, obj: PdfObject) -> PdfObject:
         if isinstance(obj, ByteStringObject):
@@ -80,7 +86,12 @@ class CryptFilter:
         elif isinstance(obj, StreamObject):
             obj2 = StreamObject()
             obj2.update(obj)
-            obj2.set_data(self.stm_crypt.encrypt(obj._data))
+            pending = obj._stream_crypt
+            if pending is not None and self.stream_key is not None and pending[2] == self.stream_key:
+                # The data has not been decrypted yet and is encrypted with the same key.
+                obj2._data = obj._stream_data
+            else:
+                obj2.set_data(self.stm_crypt.encrypt(obj._data))
             for key, value in obj.items():  # Don't forget the Stream dict.
                 obj2[key] = self.encrypt_object(value)
             obj = obj2
@@ -98,7 +109,9 @@ class CryptFilter:
             data = self.str_crypt.decrypt(obj.original_bytes, strict=strict)
             obj = create_string_object(data)
         elif isinstance(obj, StreamObject):
-            obj._data = self.stm_crypt.decrypt(obj._data, strict=strict)
+            if not isinstance(self.stm_crypt, CryptIdentity):
+                # The data is decrypted when it is accessed, see StreamObject._data.
+                obj._stream_crypt = (self.stm_crypt, strict, self.stream_key)
             for key, value in obj.items():  # Don't forget the Stream dict.
                 obj[key] = self.decrypt_object(value, strict=strict)
         elif isinstance(obj, DictionaryObject):
@@ -923,6 +936,9 @@ class Encryption:
         self._password_type = PasswordType.NOT_DECRYPTED
         self._key: Optional[bytes] = None
         self._are_permissions_valid: bool = True
+        # The crypt filters of the recently used objects, for the key they have been derived from.
+        self._crypt_filters: dict[tuple[int, int], CryptFilter] = {}
+        self._crypt_filters_key: Optional[bytes] = None
 
     def is_decrypted(self) -> bool:
         return self._password_type != PasswordType.NOT_DECRYPTED
@@ -932,7 +948,7 @@ class Encryption:
         if not self._is_encryption_object(obj):
             return obj
 
-        cf = self._make_crypt_filter(idnum, generation)
+        cf = self._get_crypt_filter(idnum, generation)
         return cf.encrypt_object(obj)
 
     def decrypt_object(self, obj: PdfObject, idnum: int, generation: int, *, strict: bool = True) -> PdfObject:
@@ -940,9 +956,21 @@ class Encryption:
         if not self._is_encryption_object(obj):
             return obj
 
-        cf = self._make_crypt_filter(idnum, generation)
+        cf = self._get_crypt_filter(idnum, generation)
         return cf.decrypt_object(obj, strict=strict)
 
+    def _get_crypt_filter(self, idnum: int, generation: int) -> CryptFilter:
+        if self._crypt_filters_key != self._key:
+            self._crypt_filters.clear()
+            self._crypt_filters_key = self._key
+        cf = self._crypt_filters.get((idnum, generation))
+        if cf is None:
+            cf = self._make_crypt_filter(idnum, generation)
+            if len(self._crypt_filters) >= CRYPT_FILTER_CACHE_SIZE:
+                del self._crypt_filters[next(iter(self._crypt_filters))]
+            self._crypt_filters[idnum, generation] = cf
+        return cf
+
     @staticmethod
     def _is_encryption_object(obj: PdfObject) -> bool:
         return isinstance(
@@ -1027,7 +1055,13 @@ class Encryption:
         str_crypt = self._get_crypt(self.StrF, rc4_key, aes128_key, aes256_key)
         ef_crypt = self._get_crypt(self.EFF, rc4_key, aes128_key, aes256_key)
 
-        return CryptFilter(stm_crypt, str_crypt, ef_crypt)
+        if self.StmF == "/AESV3":
+            stream_key = aes256_key
+        elif self.StmF == "/AESV2":
+            stream_key = aes128_key
+        else:
+            stream_key = rc4_key
+        return CryptFilter(stm_crypt, str_crypt, ef_crypt, (self.StmF, stream_key))
 
     @staticmethod
     def _get_crypt(
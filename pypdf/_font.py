@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import unicodedata
+from collections import OrderedDict
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, ClassVar, cast
@@ -43,6 +44,7 @@ except ImportError:
 # Limits.
 MAX_CID_WIDTH_ENTRY_COUNT = 65_536
 MAX_WIDTH_ENTRY_COUNT = 100_000
+MAX_CACHED_FONT_COUNT = 256
 
 
 # Some constants from truetype font tables that we use:
@@ -873,3 +875,67 @@ class Font:
         # Not a simple font (encoding is not a dict), and missing ToUnicode cmap (no character_map).
         # Assume we cannot use this font for text encoding.
         return False
+
+
+class FontCache:
+    """
+    Bounded cache of the fonts parsed from the font dictionaries of a document.
+
+    Fonts are keyed by the indirect reference of their font dictionary, thus
+    fonts shared by many pages are only parsed once. The least recently used
+    fonts are dropped when the limit is reached. Direct font dictionaries are
+    not cached.
+
+    The returned fonts are shared and must not be modified; copy them first.
+
+    Args:
+        max_entries: The maximum number of cached fonts.
+
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_FONT_COUNT) -> None:
+        self.max_entries = max_entries
+        self._fonts: OrderedDict[tuple[int, int], tuple[DictionaryObject, Font]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def get(self, pdf_font_dict: PdfObject) -> Font:
+        """Get the font for a font dictionary, parsing it if required."""
+        font_dict = cast(DictionaryObject, pdf_font_dict.get_object())
+        reference = getattr(font_dict, "indirect_reference", None)
+        if reference is None:
+            return Font.from_font_resource(font_dict)
+        key = (reference.idnum, reference.generation)
+        entry = self._fonts.get(key)
+        # The object might have been replaced, e.g. in a writer.
+        if entry is not None and entry[0] is font_dict:
+            self._fonts.move_to_end(key)
+            return entry[1]
+        font = Font.from_font_resource(font_dict)
+        self._fonts[key] = (font_dict, font)
+        self._fonts.move_to_end(key)
+        if len(self._fonts) > self.max_entries:
+            self._fonts.popitem(last=False)
+        return font
+
+    def clear(self) -> None:
+        self._fonts.clear()
+
+
+def get_cached_font(pdf_font_dict: PdfObject) -> Font:
+    """
+    Get the font for a font dictionary, using the font cache of its document.
+
+    Args:
+        pdf_font_dict: The font dictionary or a reference to it.
+
+    Returns:
+        The font, which is shared and must not be modified.
+
+    """
+    font_dict = cast(DictionaryObject, pdf_font_dict.get_object())
+    pdf = getattr(getattr(font_dict, "indirect_reference", None), "pdf", None)
+    if pdf is None or not hasattr(pdf, "_get_font"):
+        return Font.from_font_resource(font_dict)
+    return cast(Font, pdf._get_font(font_dict))
@@ -0,0 +1,227 @@
+"""Persistent storage for the cross-reference data of documents read from files."""
+
+import hashlib
+import os
+import struct
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ._utils import StreamType, logger_warning
+from .errors import PyPdfError
+from .generic import DictionaryObject, read_object
+
+if TYPE_CHECKING:
+    from ._reader import PdfReader
+
+#: Identifies the format of the stored data, to be changed on incompatible changes.
+_MAGIC = b"%pypdf-index-1\n"
+#: startxref, xref_index, number of xref and free entry generations, number of xref,
+#: free and object stream entries, trailer length.
+_HEADER = struct.Struct("<qqQQQQQQ")
+#: Number of bytes at the start and at the end of the file included in the key.
+_HASHED_BYTES = 65536
+
+
+class DirectoryIndexCache:
+    """
+    Storage for the cross-reference data of PDF files in a directory.
+
+    Pass an instance as ``index_cache`` to a :class:`~pypdf.PdfReader` reading
+    from a path. The first time a file is read, its cross-reference tables and
+    trailer are stored in the directory. When the unchanged file is opened
+    again, they are loaded from there instead of being parsed, which avoids
+    reading the cross-reference sections and repairing broken files again.
+    Warnings emitted while parsing are not repeated in this case.
+
+    A file is identified by its size, its modification time and a hash of its
+    first and last 64 KiB, thus the content of the file should not be changed
+    without changing its modification time.
+
+    Args:
+        directory: The directory for the stored data. It is created if needed.
+
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.directory)!r})"
+
+    def load(self, key: str) -> Optional[bytes]:
+        """
+        Load the data stored for a key.
+
+        Args:
+            key: The key of the file.
+
+        Returns:
+            The stored data, or ``None`` if there is none.
+
+        """
+        try:
+            return (self.directory / f"{key}.idx").read_bytes()
+        except OSError:
+            return None
+
+    def store(self, key: str, data: bytes) -> None:
+        """
+        Store the data for a key.
+
+        The data is written to a temporary file first, thus concurrent readers
+        never see partially written data.
+
+        Args:
+            key: The key of the file.
+            data: The data to store.
+
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            temporary_path = Path(name)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                temporary_path.replace(self.directory / f"{key}.idx")
+            except BaseException:
+                temporary_path.unlink()
+                raise
+        except OSError as exc:
+            logger_warning(
+                "Cannot store the index in %(directory)s: %(exception)s",
+                source=__name__,
+                directory=self.directory,
+                exception=exc,
+            )
+
+
+def get_index_key(path: str, stream: StreamType, strict: bool) -> str:
+    """Compute the key of a file, see :class:`DirectoryIndexCache`."""
+    stat = Path(path).stat()
+    digest = hashlib.sha256(_MAGIC)
+    digest.update(struct.pack("<QQ?", stat.st_size, stat.st_mtime_ns, strict))
+    stream.seek(0)
+    digest.update(stream.read(_HASHED_BYTES))
+    stream.seek(max(0, stat.st_size - _HASHED_BYTES))
+    digest.update(stream.read(_HASHED_BYTES))
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def dump_index(reader: "PdfReader") -> Optional[bytes]:
+    """
+    Serialize the cross-reference data of a reader.
+
+    Returns:
+        The data, or ``None`` if it contains unexpected values.
+
+    """
+    xref = [
+        value
+        for generation, entries in reader.xref.items()
+        for idnum, offset in entries.items()
+        for value in (generation, idnum, offset)
+    ]
+    free = [
+        value
+        for generation, entries in reader.xref_free_entry.items()
+        for idnum, is_free in entries.items()
+        for value in (generation, idnum, is_free)
+    ]
+    object_streams = [
+        value
+        for idnum, (stream_number, index) in reader.xref_objStm.items()
+        for value in (idnum, stream_number, index)
+    ]
+    trailer = BytesIO()
+    reader.trailer.write_to_stream(trailer)
+    trailer_data = trailer.getvalue()
+    # The generations are stored separately to keep those without entries.
+    values = [*reader.xref, *reader.xref_free_entry, *xref, *free, *object_streams]
+    try:
+        return b"".join(
+            (
+                _MAGIC,
+                _HEADER.pack(
+                    reader._startxref,
+                    reader.xref_index,
+                    len(reader.xref),
+                    len(reader.xref_free_entry),
+                    len(xref) // 3,
+                    len(free) // 3,
+                    len(object_streams) // 3,
+                    len(trailer_data),
+                ),
+                struct.pack(f"<{len(values)}Q", *values),
+                trailer_data,
+            )
+        )
+    except struct.error:
+        # For example, offsets which are not integers.
+        return None
+
+
+def load_index(reader: "PdfReader", data: bytes) -> bool:
+    """
+    Set the cross-reference data of a reader from serialized data.
+
+    Returns:
+        Whether the data was valid and has been loaded.
+
+    """
+    if not data.startswith(_MAGIC):
+        return False
+    try:
+        (
+            startxref,
+            xref_index,
+            xref_generation_count,
+            free_generation_count,
+            xref_count,
+            free_count,
+            object_stream_count,
+            trailer_length,
+        ) = _HEADER.unpack_from(data, len(_MAGIC))
+        position = len(_MAGIC) + _HEADER.size
+        generation_count = xref_generation_count + free_generation_count
+        entry_count = xref_count + free_count + object_stream_count
+        values = struct.unpack_from(f"<{generation_count + 3 * entry_count}Q", data, position)
+        position += 8 * len(values)
+        if position + trailer_length != len(data):
+            return False
+        trailer = read_object(BytesIO(data[position:]), reader)
+    except (struct.error, PyPdfError, ValueError):
+        return False
+    if not isinstance(trailer, DictionaryObject):
+        return False
+
+    xref: dict[int, dict[Any, Any]] = {generation: {} for generation in values[:xref_generation_count]}
+    free_entries: dict[int, dict[Any, Any]] = {
+        generation: {} for generation in values[xref_generation_count:generation_count]
+    }
+    object_streams: dict[int, tuple[Any, Any]] = {}
+    index = generation_count
+    try:
+        for _ in range(xref_count):
+            xref[values[index]][values[index + 1]] = values[index + 2]
+            index += 3
+        for _ in range(free_count):
+            free_entries[values[index]][values[index + 1]] = bool(values[index + 2])
+            index += 3
+    except KeyError:
+        # An entry for a generation which has not been stored.
+        return False
+    for _ in range(object_stream_count):
+        object_streams[values[index]] = (values[index + 1], values[index + 2])
+        index += 3
+
+    reader._startxref = startxref
+    reader.xref_index = xref_index
+    reader.xref = xref
+    reader.xref_free_entry = free_entries
+    reader.xref_objStm = object_streams
+    reader.trailer = trailer
+    return True
@@ -0,0 +1,248 @@
+"""Bounded cache for the objects parsed by a PdfReader."""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from typing import Any, Optional, cast
+
+from .generic import PdfObject, StreamObject
+
+_CacheKey = tuple[Any, Any]
+
+#: Rough per-object overhead used when estimating the size of cached objects.
+_OBJECT_OVERHEAD = 64
+#: Nested direct objects below this depth are not inspected when estimating sizes.
+_MAX_ESTIMATE_DEPTH = 16
+
+
+def _estimate_size(obj: Any, depth: int = 0) -> tuple[int, int]:
+    """
+    Estimate the memory used by an object.
+
+    Returns:
+        The estimated size in bytes, and the part of it used by decoded stream
+        data which can be dropped and recomputed.
+
+    """
+    if depth > _MAX_ESTIMATE_DEPTH:
+        return _OBJECT_OVERHEAD, 0
+    decoded_size = 0
+    size = _OBJECT_OVERHEAD
+    if isinstance(obj, StreamObject):
+        size += len(obj._stream_data)
+        decoded_self = getattr(obj, "decoded_self", None)
+        if decoded_self is not None:
+            decoded_size = len(decoded_self._stream_data) + _OBJECT_OVERHEAD
+            size += decoded_size
+    if isinstance(obj, dict):
+        for value in obj.values():
+            size += _OBJECT_OVERHEAD + _estimate_size(value, depth + 1)[0]
+    elif isinstance(obj, list):
+        for value in obj:
+            size += _estimate_size(value, depth + 1)[0]
+    elif isinstance(obj, (bytes, str)):
+        size += len(obj)
+    return size, decoded_size
+
+
+class LRUObjectCache(MutableMapping[_CacheKey, Optional[PdfObject]]):
+    """
+    Bounded storage for the objects parsed by a :class:`~pypdf.PdfReader`.
+
+    Pass an instance as ``object_cache`` to the reader to limit the memory
+    used when walking large documents. When a limit is exceeded, decoded
+    stream data of the least recently used streams is dropped first, then
+    the least recently used objects are evicted. Evicted objects are read
+    again from the cross-reference table when they are requested.
+
+    Evicted objects which are still referenced elsewhere stay available,
+    thus requesting them again returns the same instance. Objects replaced
+    or created through the reader are never evicted, but modifications of
+    parsed objects are only kept as long as the object is referenced.
+
+    Looking up an object updates the order of the entries, thus all accesses
+    are serialized by a lock: the cache can be shared by the threads of
+    :meth:`PdfReader.prefetch() <pypdf.PdfReader.prefetch>`.
+
+    Args:
+        max_bytes: Approximate upper bound of the memory used by the
+            cached objects, in bytes.
+        max_entries: Maximum number of cached objects.
+
+    """
+
+    def __init__(
+        self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None
+    ) -> None:
+        if max_bytes is None and max_entries is None:
+            raise ValueError("At least one of max_bytes and max_entries must be set")
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        #: Number of lookups served from the cache.
+        self.hits = 0
+        #: Number of lookups for objects not in the cache.
+        self.misses = 0
+        #: Number of evicted objects.
+        self.evictions = 0
+
+        self._entries: OrderedDict[_CacheKey, Optional[PdfObject]] = OrderedDict()
+        self._sizes: dict[_CacheKey, int] = {}
+        self._decoded_sizes: OrderedDict[_CacheKey, int] = OrderedDict()
+        self._pinned: set[_CacheKey] = set()
+        self._evicted: weakref.WeakValueDictionary[_CacheKey, PdfObject] = weakref.WeakValueDictionary()
+        self._size = 0
+        # Decoded stream data is usually created after the object has been
+        # cached, thus the last returned object is measured again later.
+        self._last_key: Optional[_CacheKey] = None
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks cannot be copied, for example when deep copying pages.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def size(self) -> int:
+        """Estimated memory used by the cached objects, in bytes."""
+        return self._size
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_bytes={self.max_bytes}, max_entries={self.max_entries}, "
+            f"entries={len(self._entries)}, size={self._size}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+    def pin(self, key: _CacheKey) -> None:
+        """Never evict the object stored for ``key``, e.g. because it cannot be read again."""
+        with self._lock:
+            self._pinned.add(key)
+
+    def get(self, key: _CacheKey, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._remeasure_last()
+                self._entries.move_to_end(key)
+                if key in self._decoded_sizes:
+                    self._decoded_sizes.move_to_end(key)
+                self._last_key = key
+                self.hits += 1
+                return self._entries[key]
+            obj = self._evicted.pop(key, None)
+            if obj is not None:
+                self.hits += 1
+                self[key] = obj
+                return obj
+            self.misses += 1
+            return default
+
+    def __getitem__(self, key: _CacheKey) -> Optional[PdfObject]:
+        with self._lock:
+            if key not in self:
+                self.misses += 1
+                raise KeyError(key)
+            return cast(Optional[PdfObject], self.get(key))
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries or key in self._evicted
+
+    def __setitem__(self, key: _CacheKey, obj: Optional[PdfObject]) -> None:
+        with self._lock:
+            self._remeasure_last()
+            if key in self._entries:
+                self._forget(key)
+            self._evicted.pop(key, None)
+            self._entries[key] = obj
+            self._measure(key)
+            self._last_key = key
+            self._shrink()
+
+    def __delitem__(self, key: _CacheKey) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._forget(key)
+                del self._entries[key]
+            else:
+                del self._evicted[key]
+            self._pinned.discard(key)
+
+    def __iter__(self) -> Iterator[_CacheKey]:
+        with self._lock:
+            keys = list(self._entries)
+            keys += [key for key in list(self._evicted.keys()) if key not in self._entries]
+        yield from keys
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries) + sum(1 for key in list(self._evicted.keys()) if key not in self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._decoded_sizes.clear()
+            self._pinned.clear()
+            self._evicted.clear()
+            self._size = 0
+            self._last_key = None
+
+    def _measure(self, key: _CacheKey) -> None:
+        size, decoded_size = _estimate_size(self._entries[key])
+        self._sizes[key] = size
+        self._size += size
+        if decoded_size:
+            self._decoded_sizes[key] = decoded_size
+
+    def _forget(self, key: _CacheKey) -> None:
+        self._size -= self._sizes.pop(key, 0)
+        self._decoded_sizes.pop(key, None)
+
+    def _remeasure_last(self) -> None:
+        key = self._last_key
+        self._last_key = None
+        if key is not None and key in self._entries:
+            old_size = self._sizes[key]
+            self._forget(key)
+            self._measure(key)
+            if self._sizes[key] > old_size:
+                self._shrink()
+
+    def _over_limit(self) -> bool:
+        return (self.max_bytes is not None and self._size > self.max_bytes) or (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        )
+
+    def _shrink(self) -> None:
+        if not self._over_limit():
+            return
+        # Decoded stream data can be recomputed from the raw data cheaply.
+        while self.max_bytes is not None and self._size > self.max_bytes and self._decoded_sizes:
+            key, decoded_size = self._decoded_sizes.popitem(last=False)
+            stream = self._entries[key]
+            stream.decoded_self = None  # type: ignore[union-attr]
+            self._sizes[key] -= decoded_size
+            self._size -= decoded_size
+        if not self._over_limit():
+            return
+        for key in list(self._entries):
+            if key in self._pinned:
+                continue
+            obj = self._entries.pop(key)
+            self._forget(key)
+            self.evictions += 1
+            if obj is not None:
+                try:
+                    self._evicted[key] = obj
+                except TypeError:
+                    # Some objects like NumberObject do not support weak references.
+                    pass
+            if not self._over_limit():
+                break
@@ -29,7 +29,7 @@
 
 import math
 from collections.abc import Iterable, Iterator, Sequence
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import asdict, dataclass
 from decimal import Decimal
 from io import BytesIO
@@ -44,7 +44,7 @@ from typing import (
     overload,
 )
 
-from ._font import Font
+from ._font import Font, get_cached_font
 from ._protocols import PdfCommonDocProtocol
 from ._text_extraction import (
     _layout_mode,
@@ -1122,6 +1122,21 @@ class PageObject(DictionaryObject):
             return ContentStream(resolved_object, pdf)
         return None
 
+    def iter_content_operations(self) -> Iterator[tuple[Any, bytes]]:
+        """
+        Iterate over the operations of the page contents.
+
+        The contents are parsed while iterating, which keeps the memory usage
+        low for complex pages. See :meth:`~pypdf.generic.ContentStream.iter_operations`.
+
+        Yields:
+            ``(operands, operator)`` tuples, in the order of the content stream.
+
+        """
+        content = self.get_contents()
+        if content is not None:
+            yield from content.iter_operations()
+
     def replace_contents(
         self, content: Union[ContentStream, EncodedStreamObject, ArrayObject, None]
     ) -> None:
@@ -1737,18 +1752,21 @@ class PageObject(DictionaryObject):
         """
         content = self.get_contents()
         if content is not None:
-            content_obj = content.flate_encode(level)
-            try:
-                content.indirect_reference.pdf._objects[  # type: ignore[union-attr]
-                    content.indirect_reference.idnum - 1  # type: ignore[union-attr]
-                ] = content_obj
-            except AttributeError:
-                if self.indirect_reference is not None and hasattr(
-                    self.indirect_reference.pdf, "_add_object"
-                ):
-                    self.replace_contents(content_obj)
-                else:
-                    raise ValueError("Page must be part of a PdfWriter")
+            self._set_compressed_contents(content, content.flate_encode(level))
+
+    def _set_compressed_contents(self, content: ContentStream, content_obj: EncodedStreamObject) -> None:
+        """Replace the contents of the page by their compressed version."""
+        try:
+            content.indirect_reference.pdf._objects[  # type: ignore[union-attr]
+                content.indirect_reference.idnum - 1  # type: ignore[union-attr]
+            ] = content_obj
+        except AttributeError:
+            if self.indirect_reference is not None and hasattr(
+                self.indirect_reference.pdf, "_add_object"
+            ):
+                self.replace_contents(content_obj)
+            else:
+                raise ValueError("Page must be part of a PdfWriter")
 
     @property
     def page_number(self) -> Optional[int]:
@@ -1761,9 +1779,12 @@ class PageObject(DictionaryObject):
         """
         if self.indirect_reference is None:
             return None
+        pdf = self.indirect_reference.pdf
+        index = pdf._get_page_index(self) if hasattr(pdf, "_get_page_index") else None
+        if index is not None:
+            return int(index)
         try:
-            lst = self.indirect_reference.pdf.pages
-            return int(lst.index(self))
+            return int(pdf.pages.index(self))
         except ValueError:
             return None
 
@@ -1854,10 +1875,13 @@ class PageObject(DictionaryObject):
                 try:
                     font_resource_object = cast(DictionaryObject, font_resources_dict[font_resource].get_object())
                     font_resources[font_resource] = font_resource_object
-                    fonts[font_resource] = Font.from_font_resource(font_resource_object)
+                    font = get_cached_font(font_resource_object)
                     # Override space width, if applicable
-                    if fonts[font_resource].character_widths.get(fonts[font_resource].space_char, 0) == 0:
-                        fonts[font_resource].space_width = space_width
+                    if font.character_widths.get(font.space_char, 0) == 0:
+                        # The font might be shared through the font cache.
+                        font = copy(font)
+                        font.space_width = space_width
+                    fonts[font_resource] = font
                 except (AttributeError, TypeError):
                     pass
 
@@ -1876,7 +1900,7 @@ class PageObject(DictionaryObject):
         # Initialize the extractor with the necessary parameters
         extractor.initialize_extraction(orientations, visitor_text, font_resources, fonts)
 
-        for operands, operator in content.operations:
+        for operands, operator in content.iter_operations():
             if visitor_operand_before is not None:
                 visitor_operand_before(operator, operands, extractor.cm_matrix, extractor.tm_matrix)
             # Multiple operators are handled here
@@ -2055,7 +2079,7 @@ class PageObject(DictionaryObject):
             resources_dict: Any = obj.get(PG.RESOURCES, {})
             if "/Font" in resources_dict and self.pdf is not None:
                 for font_name in resources_dict["/Font"]:
-                    fonts[font_name] = Font.from_font_resource(resources_dict["/Font"][font_name])
+                    fonts[font_name] = get_cached_font(resources_dict["/Font"][font_name])
 
             if "/Parent" not in obj:
                 break
@@ -2106,9 +2130,7 @@ class PageObject(DictionaryObject):
                 "utf-8"
             )
 
-        ops = iter(
-            ContentStream(self["/Contents"].get_object(), self.pdf, "bytes").operations
-        )
+        ops = ContentStream(self["/Contents"].get_object(), self.pdf, "bytes").iter_operations()
         bt_groups = _layout_mode.text_show_operations(
             ops, fonts, strip_rotated, debug_path
         )
@@ -2476,24 +2498,34 @@ class _VirtualList(Sequence[PageObject]):
             "/Parent", None
         )
         first = True
+        visited: set[int] = set()
         while parent is not None:
             parent = cast(DictionaryObject, parent.get_object())
+            if id(parent) in visited:
+                break
+            visited.add(id(parent))
             try:
-                i = cast(ArrayObject, parent["/Kids"]).index(ind)
-                del cast(ArrayObject, parent["/Kids"])[i]
-                first = False
-                try:
-                    assert ind is not None
-                    del ind.pdf.flattened_pages[index]  # case of page in a Reader
-                except Exception:  # pragma: no cover
-                    pass
+                if ind is not None:
+                    i = cast(ArrayObject, parent["/Kids"]).index(ind)
+                    del cast(ArrayObject, parent["/Kids"])[i]
+                if first:
+                    first = False
+                    try:
+                        assert ind is not None
+                        del ind.pdf.flattened_pages[index]  # case of page in a Reader
+                        ind.pdf._invalidate_page_index()
+                    except Exception:  # pragma: no cover
+                        pass
                 if "/Count" in parent:
                     parent[NameObject("/Count")] = NumberObject(
                         cast(int, parent["/Count"]) - 1
                     )
-                if len(cast(ArrayObject, parent["/Kids"])) == 0:
+                if ind is not None and len(cast(ArrayObject, parent["/Kids"])) == 0:
                     # No more objects in this part of this subtree
                     ind = parent.indirect_reference
+                else:
+                    # Only the /Count of the ancestors has to be updated.
+                    ind = None
                 parent = parent.get("/Parent", None)
             except ValueError:  # from index
                 if first:
@@ -58,6 +58,8 @@ a       Lowercase letters (a to z for the first 26 pages,
                            aa to zz for the next 26, and so on)
 """
 
+import sys
+from bisect import bisect_right
 from collections.abc import Callable, Iterator
 from typing import Optional, cast
 
@@ -68,6 +70,7 @@ from .generic import (
     DictionaryObject,
     NullObject,
     NumberObject,
+    PdfObject,
     is_null_or_none,
 )
 
@@ -124,6 +127,16 @@ def number2lowercase_letter(number: int) -> str:
     return number2uppercase_letter(number).lower()
 
 
+_NUMBERING_STYLES: dict[Optional[str], Callable[[int], str]] = {
+    None: lambda _: "",
+    "/D": str,
+    "/R": number2uppercase_roman_numeral,
+    "/r": number2lowercase_roman_numeral,
+    "/A": number2uppercase_letter,
+    "/a": number2lowercase_letter,
+}
+
+
 def get_label_from_nums(dictionary_object: DictionaryObject, index: int) -> str:
     # [Nums] shall be an array of the form
     #   [ key_1 value_1 key_2 value_2 ... key_n value_n ]
@@ -150,20 +163,17 @@ def get_label_from_nums(dictionary_object: DictionaryObject, index: int) -> str:
         if nums[i + 2] > index:
             break
         i += 2
-    m: dict[Optional[str], Callable[[int], str]] = {
-        None: lambda _: "",
-        "/D": str,
-        "/R": number2uppercase_roman_numeral,
-        "/r": number2lowercase_roman_numeral,
-        "/A": number2uppercase_letter,
-        "/a": number2lowercase_letter,
-    }
+    return _label_from_value(value, start_index, index)
+
+
+def _label_from_value(value: Optional[PdfObject], start_index: int, index: int) -> str:
+    """Get the label of a page from the page label dictionary of its range starting at start_index."""
     # if /Nums array is not following the specification or if /Nums is empty
     if not isinstance(value, dict):
         return str(index + 1)  # Fallback
     start = value.get("/St", 1)
     prefix = cast(str, value.get("/P", ""))
-    mapping_function = m.get(value.get("/S"))
+    mapping_function = _NUMBERING_STYLES.get(value.get("/S"))
     if mapping_function is None:
         # Unknown /S numbering style; fall back to the page position.
         logger_warning(
@@ -241,6 +251,140 @@ def index2label(reader: PdfCommonDocProtocol, index: int) -> str:
     return str(index + 1)  # Fallback if neither /Nums nor /Kids is in the number_tree
 
 
+class PageLabelLookup:
+    """
+    The page labels of a document, computed from a single walk of the number tree.
+
+    The number tree is flattened once into sorted ranges of page indices, each
+    one associated with its page label dictionary. Labels can then be looked up
+    by bisection or produced sequentially for all pages, instead of walking the
+    number tree again for every page as :func:`index2label` does.
+
+    Number trees which do not follow the specification closely enough for this,
+    e.g. with unsorted keys or overlapping limits, are handled by
+    :func:`index2label` for every page.
+
+    Args:
+        reader: The document.
+
+    """
+
+    def __init__(self, reader: PdfCommonDocProtocol) -> None:
+        self.reader = reader
+        self.page_labels = cast(DictionaryObject, reader.root_object).get("/PageLabels")
+        # Start of each range, and the start index and page label dictionary
+        # applying to it. None marks the pages not covered by the number tree.
+        self._starts: list[int] = []
+        self._entries: list[Optional[tuple[int, Optional[PdfObject]]]] = []
+        try:
+            self._regular = self._flatten()
+        except (AttributeError, KeyError, TypeError):
+            self._regular = False
+
+    def _flatten(self) -> bool:
+        root = cast(DictionaryObject, self.reader.root_object)
+        if "/PageLabels" not in root:
+            self._add_range(0, (0, None))
+            return True
+        number_tree = cast(DictionaryObject, root["/PageLabels"].get_object())
+        self._add_range(0, None)
+        if "/Nums" in number_tree:
+            return self._add_leaf(number_tree, 0, sys.maxsize)
+        if "/Kids" in number_tree and not isinstance(number_tree["/Kids"], NullObject):
+            return self._add_kids(number_tree, 0, sys.maxsize, 0)
+        return True
+
+    def _add_range(self, start: int, entry: Optional[tuple[int, Optional[PdfObject]]]) -> None:
+        self._starts.append(start)
+        self._entries.append(entry)
+
+    def _add_kids(self, number_tree: DictionaryObject, low: int, high: int, level: int) -> bool:
+        previous_high = -1
+        for kid in cast(list[DictionaryObject], number_tree["/Kids"]):
+            limits = kid.get("/Limits", NullObject()).get_object()
+            if not isinstance(limits, list) or len(limits) < 2:
+                logger_warning(
+                    "Ignoring kid with missing or malformed /Limits in /PageLabels.",
+                    source=__name__,
+                )
+                continue
+            kid_low, kid_high = limits[0], limits[1]
+            if not isinstance(kid_low, int) or not isinstance(kid_high, int):
+                return False
+            if kid_low > kid_high:
+                continue  # never matches any page
+            if kid_low <= previous_high:
+                return False  # overlapping kids: the first matching one wins
+            previous_high = kid_high
+            kid_low, kid_high = max(low, kid_low), min(high, kid_high)
+            if kid_low > kid_high:
+                continue
+            if not is_null_or_none(kid.get("/Kids", None)):
+                if level + 1 >= 100 or not self._add_kids(kid, kid_low, kid_high, level + 1):
+                    return False
+            elif not self._add_leaf(kid, kid_low, kid_high):
+                return False
+        return True
+
+    def _add_leaf(self, number_tree: DictionaryObject, low: int, high: int) -> bool:
+        nums = cast(ArrayObject, number_tree["/Nums"])
+        if len(nums) % 2 != 0:
+            logger_warning(
+                "Ignoring last /Nums key without a value.", source=__name__
+            )
+        keys = [nums[i] for i in range(0, len(nums) - 1, 2)]
+        if not all(isinstance(key, int) for key in keys) or keys != sorted(keys):
+            return False
+        if not keys:
+            self._add_range(low, (0, None))
+        else:
+            # The first entry also applies to the pages before its key
+            first = max(0, bisect_right(keys, low) - 1)
+            self._add_range(low, (keys[first], nums[2 * first + 1].get_object()))
+            for i in range(first + 1, len(keys)):
+                if keys[i] > high:
+                    break
+                self._add_range(keys[i], (keys[i], nums[2 * i + 1].get_object()))
+        if high < sys.maxsize:
+            self._add_range(high + 1, None)
+        return True
+
+    def _label(self, range_index: int, index: int) -> str:
+        entry = self._entries[range_index]
+        if entry is None:
+            logger_warning("Could not reliably determine page label for %(index)d.", source=__name__, index=index)
+            return str(index + 1)  # Fallback
+        return _label_from_value(entry[1], entry[0], index)
+
+    def __getitem__(self, index: int) -> str:
+        """Get the label of the page at the given index."""
+        if not self._regular:
+            return index2label(self.reader, index)
+        return self._label(max(0, bisect_right(self._starts, index) - 1), index)
+
+    def iter_labels(self, page_count: int) -> Iterator[str]:
+        """
+        Produce the labels of the first pages in order.
+
+        Args:
+            page_count: The number of pages.
+
+        Yields:
+            The label of each page.
+
+        """
+        if not self._regular:
+            for index in range(page_count):
+                yield index2label(self.reader, index)
+            return
+        starts = self._starts
+        range_index = 0
+        for index in range(page_count):
+            while range_index + 1 < len(starts) and starts[range_index + 1] <= index:
+                range_index += 1
+            yield self._label(range_index, index)
+
+
 def nums_insert(
     key: NumberObject,
     value: DictionaryObject,
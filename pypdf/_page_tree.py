@@ -0,0 +1,186 @@
+"""Access to single pages of a document without flattening the whole page tree."""
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+from ._doc_common import INHERITABLE_PAGE_ATTRIBUTES, PAGE_TREE_MAX_DEPTH, PAGE_TREE_MAX_ENTRIES
+from ._page import PageObject
+from .constants import PageAttributes as PG
+from .constants import PagesAttributes as PA
+from .errors import LimitReachedError
+from .generic import ArrayObject, DictionaryObject, IndirectObject, NumberObject, PdfObject
+
+if TYPE_CHECKING:
+    from ._doc_common import PdfDocCommon
+
+
+class LazyPageTree:
+    """
+    Locate pages by descending the page tree with the /Count of its nodes.
+
+    Only the nodes on the path to a requested page are read, and only the
+    requested pages are materialized, in the same way as
+    :meth:`~pypdf._doc_common.PdfDocCommon._flatten` does. For every node, the
+    index of the first page of each kid which has been looked at is cached.
+
+    Whenever the tree cannot be used safely, for example because a /Count does
+    not match the kids of a node or the tree is cyclic, ``None`` is returned and
+    the caller has to flatten the page tree instead.
+
+    Args:
+        pdf: The document the page tree belongs to.
+
+    """
+
+    def __init__(self, pdf: "PdfDocCommon") -> None:
+        self.pdf = pdf
+        # Index of the first page of the scanned kids of a node, followed by the
+        # number of pages in these kids, by the reference of the node.
+        self._starts: dict[tuple[int, int], list[int]] = {}
+        # The materialized pages by index, and the index of these pages by id().
+        self.pages: dict[int, PageObject] = {}
+        self._indices: dict[int, int] = {}
+        self._entry_count = 0
+
+    def get_num_pages(self) -> Optional[int]:
+        """Get the number of pages declared by the root of the page tree."""
+        root = self.pdf.root_object.get("/Pages")
+        if root is None:
+            return None
+        root = root.get_object()
+        if not isinstance(root, DictionaryObject) or self._get_type(root) != "/Pages":
+            return None
+        return self._get_count(root)
+
+    def get_page(self, page_number: int) -> Optional[PageObject]:
+        """
+        Get a page, materializing it on first access.
+
+        Args:
+            page_number: The index of the page, starting at zero.
+
+        Returns:
+            The page, or ``None`` if the page tree has to be flattened to find it.
+
+        """
+        page = self.pages.get(page_number)
+        if page is not None:
+            return page
+        count = self.get_num_pages()
+        if count is None or not 0 <= page_number < count:
+            return None
+        node = self.pdf.root_object["/Pages"]
+        assert isinstance(node, DictionaryObject), "mypy"
+        inherit: dict[str, Any] = {}
+        visited = {id(node)}
+        index = page_number
+        for _ in range(PAGE_TREE_MAX_DEPTH + 1):
+            for attr in INHERITABLE_PAGE_ATTRIBUTES:
+                if attr in node:
+                    inherit[attr] = node[attr]
+            found = self._find_kid(node, index)
+            if found is None:
+                return None
+            kid, index = found
+            obj = kid.get_object()
+            assert isinstance(obj, DictionaryObject), "mypy"
+            if self._get_type(obj) == "/Page":
+                return self._materialize(page_number, kid, obj, inherit)
+            if id(obj) in visited:
+                return None
+            visited.add(id(obj))
+            node = obj
+        return None
+
+    def get_page_index(self, page: PageObject) -> Optional[int]:
+        """Get the index of a page materialized by :meth:`get_page`."""
+        return self._indices.get(id(page))
+
+    def _materialize(
+        self, page_number: int, kid: PdfObject, obj: DictionaryObject, inherit: dict[str, Any]
+    ) -> PageObject:
+        page = PageObject(self.pdf, kid if isinstance(kid, IndirectObject) else None)
+        if not self.pdf._readonly:
+            page.update(obj)
+        for attr, value in inherit.items():
+            if attr not in page:
+                page[attr] = value
+        self.pages[page_number] = page
+        self._indices[id(page)] = page_number
+        return page
+
+    def _find_kid(self, node: DictionaryObject, index: int) -> Optional[tuple[PdfObject, int]]:
+        """
+        Find the kid of a node containing a page.
+
+        Args:
+            node: A /Pages node.
+            index: The index of the page within the pages below the node.
+
+        Returns:
+            The kid and the index of the page within the pages below the kid.
+
+        """
+        kids = node.get(PA.KIDS)
+        kids = None if kids is None else kids.get_object()
+        if not isinstance(kids, ArrayObject):
+            return None
+        reference = getattr(node, "indirect_reference", None)
+        key = None if reference is None else (reference.idnum, reference.generation)
+        starts = self._starts.get(key, [0]) if key is not None else [0]
+        while starts[-1] <= index:
+            if len(starts) > len(kids):
+                # The /Count of the node is larger than the number of pages in it.
+                return None
+            kid = kids[len(starts) - 1]
+            if reference is not None and getattr(kid, "indirect_reference", None) == reference:
+                return None
+            count = self._get_kid_count(kid.get_object())
+            if count is None:
+                return None
+            self._entry_count += 1
+            if self._entry_count > PAGE_TREE_MAX_ENTRIES:
+                raise LimitReachedError(
+                    f"Maximum page tree entry limit reached: {self._entry_count} > {PAGE_TREE_MAX_ENTRIES}."
+                )
+            starts.append(starts[-1] + count)
+        if len(starts) == len(kids) + 1 and starts[-1] != self._get_count(node):
+            return None
+        if key is not None:
+            self._starts[key] = starts
+        # Kids without pages have the same start as the next one, thus they are skipped.
+        position = bisect_right(starts, index) - 1
+        return kids[position], index - starts[position]
+
+    def _get_kid_count(self, obj: Optional[PdfObject]) -> Optional[int]:
+        if not obj:
+            # Ignored when flattening as well.
+            return 0
+        if not isinstance(obj, DictionaryObject):
+            return None
+        node_type = self._get_type(obj)
+        if node_type == "/Page":
+            return 1
+        if node_type == "/Pages":
+            return self._get_count(obj)
+        if node_type is None:
+            return None
+        return 0
+
+    def _get_type(self, obj: DictionaryObject) -> Optional[str]:
+        if PA.TYPE in obj:
+            return cast(str, obj[PA.TYPE])
+        if PA.KIDS in obj:
+            return "/Pages"
+        if self.pdf.strict and not any(key in obj for key in (PG.CONTENTS, PG.MEDIABOX, PG.PARENT)):
+            # Flattening reports this error.
+            return None
+        return "/Page"
+
+    @staticmethod
+    def _get_count(node: DictionaryObject) -> Optional[int]:
+        count = node.get(PA.COUNT)
+        count = None if count is None else count.get_object()
+        if not isinstance(count, NumberObject) or count < 0:
+            return None
+        return int(count)
@@ -0,0 +1,186 @@
+"""Helpers to process the pages of a document with a pool of workers."""
+
+import math
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from io import BytesIO
+from typing import Any, Optional, Union
+
+from ._object_cache import LRUObjectCache
+from ._page import PageObject
+from ._reader import PdfReader
+from .constants import PageAttributes as PG
+from .constants import Resources as RES
+from .generic import ArrayObject, DictionaryObject, EncodedStreamObject, PdfObject, is_null_or_none
+
+#: Number of chunks each worker gets on average, to balance the load.
+CHUNKS_PER_WORKER = 4
+
+_worker_state = threading.local()
+
+
+def _initialize_worker(source: Union[str, bytes], reader_kwargs: dict[str, Any]) -> None:
+    """Open the document once per worker."""
+    object_cache = reader_kwargs.get("object_cache")
+    if object_cache is not None:
+        # Threads share the keyword arguments, but not the parsed objects.
+        reader_kwargs = {
+            **reader_kwargs,
+            "object_cache": LRUObjectCache(object_cache.max_bytes, object_cache.max_entries),
+        }
+    _worker_state.reader = PdfReader(
+        source if isinstance(source, str) else BytesIO(source), **reader_kwargs
+    )
+
+
+def _extract_text_chunk(page_indices: list[int], extract_kwargs: dict[str, Any]) -> list[tuple[int, str]]:
+    reader: PdfReader = _worker_state.reader
+    return [
+        (page_index, reader.pages[page_index].extract_text(**extract_kwargs))
+        for page_index in page_indices
+    ]
+
+
+def _create_executor(executor: str, workers: int, source: Union[str, bytes], reader_kwargs: dict[str, Any]) -> Executor:
+    if executor == "process":
+        return ProcessPoolExecutor(workers, initializer=_initialize_worker, initargs=(source, reader_kwargs))
+    if executor == "thread":
+        return ThreadPoolExecutor(workers, initializer=_initialize_worker, initargs=(source, reader_kwargs))
+    raise ValueError(f"Unknown executor {executor!r}, expected 'process' or 'thread'")
+
+
+def iter_extract_text(
+    source: Union[str, bytes],
+    reader_kwargs: dict[str, Any],
+    page_count: int,
+    extract_kwargs: dict[str, Any],
+    workers: int,
+    executor: str,
+    ordered: bool,
+) -> Iterator[tuple[int, str]]:
+    """
+    Extract the text of the pages of a document in a pool of workers.
+
+    Each worker opens the document once and handles contiguous chunks of pages.
+
+    Args:
+        source: The path of the document, or its content.
+        reader_kwargs: The keyword arguments to open the document with.
+        page_count: The number of pages of the document.
+        extract_kwargs: The keyword arguments for :meth:`PageObject.extract_text`.
+        workers: The number of workers.
+        executor: ``"process"`` or ``"thread"``.
+        ordered: Whether to yield the pages in order, or as soon as they are done.
+
+    Yields:
+        Tuples of the page index and the text of the page.
+
+    """
+    chunk_size = max(1, math.ceil(page_count / (workers * CHUNKS_PER_WORKER)))
+    chunks = [
+        list(range(start, min(start + chunk_size, page_count)))
+        for start in range(0, page_count, chunk_size)
+    ]
+    with _create_executor(executor, min(workers, len(chunks)), source, reader_kwargs) as pool:
+        futures: list[Future[list[tuple[int, str]]]] = [
+            pool.submit(_extract_text_chunk, chunk, extract_kwargs) for chunk in chunks
+        ]
+        try:
+            for future in futures if ordered else as_completed(futures):
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+#: The kinds of streams :meth:`PdfReader.prefetch` can decode.
+PREFETCH_KINDS = ("contents", "xobjects", "fonts")
+
+
+def collect_streams(pages: Iterable[PageObject], kinds: Iterable[str]) -> list[EncodedStreamObject]:
+    """
+    Collect the streams used by some pages which have not been decoded yet.
+
+    The resources of form XObjects are searched as well.
+
+    Args:
+        pages: The pages.
+        kinds: The kinds of streams, see :data:`PREFETCH_KINDS`.
+
+    Returns:
+        The streams, the largest first.
+
+    """
+    kinds = set(kinds)
+    streams: dict[int, EncodedStreamObject] = {}
+    visited: set[int] = set()
+
+    def add(obj: Any) -> Any:
+        obj = None if is_null_or_none(obj) else obj.get_object()
+        if isinstance(obj, EncodedStreamObject) and obj.decoded_self is None:
+            streams.setdefault(id(obj), obj)
+        return obj
+
+    resources_to_visit: list[Optional[PdfObject]] = []
+    for page in pages:
+        if "contents" in kinds and PG.CONTENTS in page:
+            contents = page[PG.CONTENTS]
+            for content in contents if isinstance(contents, ArrayObject) else [contents]:
+                add(content)
+        resources_to_visit.append(page.get(PG.RESOURCES))
+
+    while resources_to_visit:
+        resources = resources_to_visit.pop()
+        if resources is not None:
+            resources = resources.get_object()
+        if not isinstance(resources, DictionaryObject) or id(resources) in visited:
+            continue
+        visited.add(id(resources))
+
+        x_objects = resources.get(RES.XOBJECT)
+        if isinstance(x_objects, DictionaryObject):
+            for x_object in x_objects.values():
+                x_object = x_object.get_object()
+                if not isinstance(x_object, DictionaryObject):
+                    continue
+                if "xobjects" in kinds:
+                    add(x_object)
+                if x_object.get("/Subtype") == "/Form":
+                    resources_to_visit.append(x_object.get(PG.RESOURCES))
+
+        fonts = resources.get(RES.FONT)
+        if "fonts" in kinds and isinstance(fonts, DictionaryObject):
+            for font in fonts.values():
+                font = font.get_object()
+                if isinstance(font, DictionaryObject):
+                    add(font.get("/ToUnicode"))
+                    add(font.get("/Encoding"))
+
+    return sorted(streams.values(), key=lambda stream: len(stream._data), reverse=True)
+
+
+def _decode_stream(stream: EncodedStreamObject) -> None:
+    try:
+        stream.get_data()
+    except Exception:
+        # The error is raised again when the data is accessed.
+        pass
+
+
+def decode_streams(streams: list[EncodedStreamObject], workers: int) -> None:
+    """
+    Decode streams in a pool of threads, filling their cache of decoded data.
+
+    Args:
+        streams: The streams, each of them only once.
+        workers: The number of threads.
+
+    """
+    if workers <= 1 or len(streams) <= 1:
+        for stream in streams:
+            _decode_stream(stream)
+        return
+    with ThreadPoolExecutor(min(workers, len(streams))) as pool:
+        # Consume the results to wait for all streams.
+        list(pool.map(_decode_stream, streams))
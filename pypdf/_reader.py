@@ -30,7 +30,8 @@
 import os
 import re
 import sys
-from collections.abc import Iterable
+import threading
+from collections.abc import Iterable, Iterator, MutableMapping
 from io import BytesIO, UnsupportedOperation
 from operator import itemgetter
 from pathlib import Path
@@ -39,6 +40,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Literal,
     Optional,
     Union,
     cast,
@@ -51,10 +53,15 @@ else:
 
 from ._doc_common import PdfDocCommon, convert_to_int
 from ._encryption import Encryption, PasswordType
+from ._index_cache import DirectoryIndexCache, dump_index, get_index_key, load_index
+from ._object_cache import LRUObjectCache
+from ._page_tree import LazyPageTree
 from ._utils import (
     WHITESPACES_AS_BYTES,
+    MemoryMappedStream,
     StrByteType,
     StreamType,
+    get_stream_buffer,
     logger_warning,
     read_non_whitespace,
     read_previous_line,
@@ -115,6 +122,22 @@ class PdfReader(PdfDocCommon):
         root_object_recovery_limit: The maximum number of objects to query
             for recovering the Root object in non-strict mode. To disable
             this security measure, pass ``None``.
+        object_cache: Storage for the parsed objects. By default, all objects
+            are kept until the reader is closed. Pass a
+            :class:`~pypdf.LRUObjectCache` to bound the memory usage.
+        memory_map: If ``stream`` is a path, map the file into memory instead
+            of reading it completely. Stream data is then only copied when it
+            is accessed. The file must not be modified while the reader uses it.
+            Defaults to ``False``.
+        index_cache: If ``stream`` is a path, load the cross-reference data
+            from this storage instead of parsing it again, and store it there
+            after parsing. See :class:`~pypdf.DirectoryIndexCache`.
+        lazy_pages: Locate the requested pages with the /Count entries of the
+            page tree instead of reading the whole page tree first. Only the
+            pages which are accessed are loaded. The number of pages is taken
+            from the root of the page tree. If the page tree is found to be
+            inconsistent, it is read completely as usual.
+            Defaults to ``False``.
 
     """
 
@@ -125,12 +148,21 @@ class PdfReader(PdfDocCommon):
         password: Union[str, bytes, None] = None,
         *,
         root_object_recovery_limit: Optional[int] = 10_000,
+        memory_map: bool = False,
+        object_cache: Optional[LRUObjectCache] = None,
+        index_cache: Optional[DirectoryIndexCache] = None,
+        lazy_pages: bool = False,
     ) -> None:
         self.strict = strict
         self.flattened_pages: Optional[list[PageObject]] = None
+        self._lazy_page_tree = LazyPageTree(self) if lazy_pages else None
 
         #: Storage of parsed PDF objects.
-        self.resolved_objects: dict[tuple[Any, Any], Optional[PdfObject]] = {}
+        self.resolved_objects: MutableMapping[tuple[Any, Any], Optional[PdfObject]] = (
+            {} if object_cache is None else object_cache
+        )
+        # Serializes the reading of objects, see :meth:`prefetch`.
+        self._lock = threading.RLock()
 
         self._startxref: int = 0
         self.xref_index = 0
@@ -149,7 +181,11 @@ class PdfReader(PdfDocCommon):
 
         self._validated_root: Optional[DictionaryObject] = None
 
-        self._initialize_stream(stream)
+        # Needed to open the document again in other processes.
+        self._source_path: Optional[str] = None
+        self._memory_map = memory_map
+
+        self._initialize_stream(stream, memory_map=memory_map, index_cache=index_cache)
         self._known_objects: set[tuple[int, int]] = set()
 
         self._override_encryption = False
@@ -161,7 +197,12 @@ class PdfReader(PdfDocCommon):
 
         self._named_destinations_cache: Optional[dict[str, Destination]] = None
 
-    def _initialize_stream(self, stream: Union[StrByteType, Path]) -> None:
+    def _initialize_stream(
+        self,
+        stream: Union[StrByteType, Path],
+        memory_map: bool = False,
+        index_cache: Optional[DirectoryIndexCache] = None,
+    ) -> None:
         if hasattr(stream, "mode") and "b" not in stream.mode:
             logger_warning(
                 "PdfReader stream/file object is not in binary mode. "
@@ -169,12 +210,47 @@ class PdfReader(PdfDocCommon):
                 source=__name__,
             )
         self._stream_opened = False
+        source: StreamType
         if isinstance(stream, (str, Path)):
-            with open(stream, "rb") as fh:
-                stream = BytesIO(fh.read())
+            self._source_path = os.fspath(stream)
+            mapped_stream = self._open_memory_mapped(stream) if memory_map else None
+            if mapped_stream is None:
+                with open(stream, "rb") as fh:
+                    source = BytesIO(fh.read())
+            else:
+                # The mapped file behaves like a BytesIO.
+                source = cast(StreamType, mapped_stream)
             self._stream_opened = True
-        self.read(stream)
-        self.stream = stream
+        else:
+            source = stream
+        if index_cache is None or self._source_path is None:
+            self.read(source)
+        else:
+            key = get_index_key(self._source_path, source, self.strict)
+            data = index_cache.load(key)
+            if data is None or not load_index(self, data):
+                self.read(source)
+                data = dump_index(self)
+                if data is not None:
+                    index_cache.store(key, data)
+        self.stream = source
+
+    @staticmethod
+    def _open_memory_mapped(path: Union[str, Path]) -> Optional[MemoryMappedStream]:
+        if Path(path).stat().st_size == 0:
+            # Empty files cannot be mapped; reading reports the error.
+            return None
+        try:
+            return MemoryMappedStream(path)
+        except (ValueError, OSError, ImportError) as exc:
+            # Some platforms or file systems do not support mmap.
+            logger_warning(
+                "Cannot map %(path)s into memory, reading it instead: %(exception)s",
+                source=__name__,
+                path=path,
+                exception=exc,
+            )
+            return None
 
     def _handle_encryption(self, password: Optional[Union[str, bytes]]) -> None:
         self._override_encryption = True
@@ -196,6 +272,16 @@ class PdfReader(PdfDocCommon):
             raise WrongPasswordError("Wrong password")
         self._override_encryption = False
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks cannot be copied, for example when deep copying pages.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
     def __enter__(self) -> Self:
         return self
 
@@ -212,7 +298,9 @@ class PdfReader(PdfDocCommon):
         if self._stream_opened:
             self.stream.close()
         self.flattened_pages = []
-        self.resolved_objects = {}
+        self._invalidate_page_index()
+        self.resolved_objects.clear()
+        self._font_cache = None
         self.trailer = DictionaryObject()
         self.xref = {}
         self.xref_free_entry = {}
@@ -314,7 +402,7 @@ class PdfReader(PdfDocCommon):
         #       but that needs a deprecation
         loc = self.stream.tell()
         self.stream.seek(0, 0)
-        pdf_file_version = self.stream.read(8).decode("utf-8", "backslashreplace")
+        pdf_file_version: str = self.stream.read(8).decode("utf-8", "backslashreplace")
         self.stream.seek(loc, 0)  # return to where it was
         return pdf_file_version
 
@@ -327,6 +415,180 @@ class PdfReader(PdfDocCommon):
         finally:
             self._override_encryption = False
 
+    def extract_text_all(
+        self,
+        *,
+        workers: Optional[int] = None,
+        executor: Literal["process", "thread"] = "process",
+        password: Union[str, bytes, None] = None,
+        extraction_mode: Literal["plain", "layout"] = "plain",
+        **kwargs: Any,
+    ) -> list[str]:
+        """
+        Extract the text of all pages, using a pool of workers.
+
+        Each worker opens the document again, either from its path or from
+        a copy of its content, thus changes made to the objects of this
+        reader are not taken into account.
+
+        Args:
+            workers: The number of workers. Defaults to the number of CPUs.
+                With a single worker, the pages are processed by this reader.
+            executor: Run the workers in processes, or in threads.
+            password: The password to open the document with in the workers,
+                if it is encrypted.
+            extraction_mode: See :meth:`PageObject.extract_text`.
+            **kwargs: Further arguments for :meth:`PageObject.extract_text`.
+                They must be picklable when using processes.
+
+        Returns:
+            The text of each page, in page order.
+
+        """
+        return [
+            text
+            for _, text in self.iter_extract_text(
+                workers=workers, executor=executor, password=password, extraction_mode=extraction_mode, **kwargs
+            )
+        ]
+
+    def iter_extract_text(
+        self,
+        *,
+        workers: Optional[int] = None,
+        executor: Literal["process", "thread"] = "process",
+        password: Union[str, bytes, None] = None,
+        ordered: bool = True,
+        extraction_mode: Literal["plain", "layout"] = "plain",
+        **kwargs: Any,
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Extract the text of all pages, returning it as soon as it is available.
+
+        See :meth:`extract_text_all` for the arguments.
+
+        Args:
+            ordered: If ``False``, pages are returned as soon as they are
+                done, thus not necessarily in page order.
+
+        Returns:
+            An iterator of tuples of the page index and the text of the page.
+
+        """
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unknown executor {executor!r}, expected 'process' or 'thread'")
+        kwargs["extraction_mode"] = extraction_mode
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        page_count = len(self.pages)
+        if workers <= 1 or page_count <= 1:
+            return (
+                (page_index, page.extract_text(**kwargs)) for page_index, page in enumerate(self.pages)
+            )
+
+        from ._parallel import iter_extract_text  # noqa: PLC0415
+
+        reader_kwargs: dict[str, Any] = {
+            "strict": self.strict,
+            "password": password,
+            "root_object_recovery_limit": self._root_object_recovery_limit,
+            "memory_map": self._memory_map,
+        }
+        if isinstance(self.resolved_objects, LRUObjectCache):
+            # Each worker creates its own cache with the same limits.
+            reader_kwargs["object_cache"] = LRUObjectCache(
+                self.resolved_objects.max_bytes, self.resolved_objects.max_entries
+            )
+        return iter_extract_text(
+            self._get_source(), reader_kwargs, page_count, kwargs, workers, executor, ordered
+        )
+
+    def prefetch(
+        self,
+        pages: Optional[Iterable[int]] = None,
+        kinds: Iterable[Literal["contents", "xobjects", "fonts"]] = ("contents", "xobjects", "fonts"),
+        workers: Optional[int] = None,
+    ) -> None:
+        """
+        Decode the streams used by some pages ahead of time, using a pool of threads.
+
+        Decoding the streams is often the most expensive part of extracting
+        the text or the images of pages. As zlib releases the GIL, the streams
+        are decoded concurrently. The decoded data is kept in memory and used
+        when the pages are processed afterwards.
+
+        Streams which cannot be decoded are skipped; the error is raised again
+        when their data is accessed.
+
+        Args:
+            pages: The indices of the pages. Defaults to all pages.
+            kinds: The kinds of streams to decode: ``"contents"`` for the
+                content streams of the pages, ``"xobjects"`` for images and
+                forms, and ``"fonts"`` for the character maps of fonts.
+            workers: The number of threads. Defaults to the number of CPUs.
+
+        """
+        from ._parallel import PREFETCH_KINDS, collect_streams, decode_streams  # noqa: PLC0415
+
+        kinds = tuple(kinds)
+        for kind in kinds:
+            if kind not in PREFETCH_KINDS:
+                raise ValueError(f"Unknown kind {kind!r}, expected one of {', '.join(PREFETCH_KINDS)}")
+        selected_pages = self.pages if pages is None else [self.pages[index] for index in pages]
+        streams = collect_streams(selected_pages, kinds)
+        decode_streams(streams, (os.cpu_count() or 1) if workers is None else workers)
+
+    def _get_source(self) -> Union[str, bytes]:
+        """Get the path of the document, or its content if it has not been read from a path."""
+        if self._source_path is not None:
+            return self._source_path
+        buffer = get_stream_buffer(self.stream)
+        if buffer is not None:
+            return bytes(buffer)
+        position = self.stream.tell()
+        try:
+            self.stream.seek(0)
+            return self.stream.read()
+        finally:
+            self.stream.seek(position)
+
+    def get_num_pages(self) -> int:
+        if self.flattened_pages is None and self._lazy_page_tree is not None and not self.is_encrypted:
+            count = self._lazy_page_tree.get_num_pages()
+            if count is not None:
+                return count
+        return super().get_num_pages()
+
+    def get_page(self, page_number: int) -> "PageObject":
+        if self.flattened_pages is None and self._lazy_page_tree is not None:
+            page = self._lazy_page_tree.get_page(page_number)
+            if page is not None:
+                return page
+        return super().get_page(page_number)
+
+    def _get_page_index(self, page: "PageObject") -> Optional[int]:
+        if self.flattened_pages is None and self._lazy_page_tree is not None:
+            index = self._lazy_page_tree.get_page_index(page)
+            if index is not None:
+                return index
+        return super()._get_page_index(page)
+
+    def _append_flattened_page(self, page: "PageObject") -> None:
+        if self._lazy_page_tree is not None:
+            # Keep the pages which have already been handed out.
+            assert self.flattened_pages is not None, "mypy"
+            lazy_page = self._lazy_page_tree.pages.get(len(self.flattened_pages))
+            if (
+                lazy_page is not None
+                and lazy_page.indirect_reference is not None
+                and lazy_page.indirect_reference == page.indirect_reference
+            ):
+                page = lazy_page
+        super()._append_flattened_page(page)
+
+    def _invalidate_page_index(self) -> None:
+        super()._invalidate_page_index()
+        self._page_id2num = None
+
     def _get_page_number_by_indirect(
         self, indirect_reference: Union[int, NullObject, IndirectObject, None]
     ) -> Optional[int]:
@@ -464,6 +726,18 @@ class PdfReader(PdfDocCommon):
         )
         if retval is not None:
             return retval
+        # Reading an object moves the position in the stream, thus other
+        # threads must wait, and may find the object in the cache afterwards.
+        with self._lock:
+            retval = self.cache_get_indirect_object(
+                indirect_reference.generation, indirect_reference.idnum
+            )
+            if retval is not None:
+                return retval
+            return self._read_object(indirect_reference)
+
+    def _read_object(self, indirect_reference: IndirectObject) -> Optional[PdfObject]:
+        retval: Optional[PdfObject] = None
         if (
             indirect_reference.generation == 0
             and indirect_reference.idnum in self.xref_objStm
@@ -671,8 +945,14 @@ class PdfReader(PdfDocCommon):
             raise ValueError("Cannot find referenced object")
         self.resolved_objects[(indirect_reference.generation, indirect_reference.idnum)] = obj
         obj.indirect_reference = indirect_reference
+        self._pin_cached_object(indirect_reference)
         return obj
 
+    def _pin_cached_object(self, indirect_reference: Optional[IndirectObject]) -> None:
+        """Keep an object which has been created or modified in the object cache."""
+        if indirect_reference is not None and isinstance(self.resolved_objects, LRUObjectCache):
+            self.resolved_objects.pin((indirect_reference.generation, indirect_reference.idnum))
+
     def read(self, stream: StreamType) -> None:
         """
         Read and process the PDF stream, extracting necessary data.
@@ -1532,9 +1812,11 @@ class PdfReader(PdfDocCommon):
             max(i for (g, i) in self.resolved_objects if g == 0) + 1,
             interim,
         )
+        self._pin_cached_object(interim.indirect_reference)
         arr = ArrayObject()
         arr.append(interim.indirect_reference)
         acroform[NameObject("/Fields")] = arr
+        self._pin_cached_object(acroform.indirect_reference or catalog.indirect_reference)
         for o in cast(ArrayObject, interim["/Kids"]):
             obj = o.get_object()
             if "/Parent" in obj:
@@ -1544,6 +1826,7 @@ class PdfReader(PdfDocCommon):
                     obj_ref=obj.indirect_reference,
                 )
             obj[NameObject("/Parent")] = interim.indirect_reference
+            self._pin_cached_object(obj.indirect_reference)
         return interim
 
     def rename_form_topname(self, name: str) -> Optional[DictionaryObject]:
@@ -0,0 +1,192 @@
+"""Render PDF objects into a buffer which is written to the output in large blocks."""
+
+import binascii
+from typing import Any, Callable, Union
+
+from ._utils import StreamType
+from .constants import StreamAttributes as SA
+from .generic import (
+    ArrayObject,
+    BooleanObject,
+    ByteStringObject,
+    ContentStream,
+    DictionaryObject,
+    FloatObject,
+    IndirectObject,
+    NameObject,
+    NullObject,
+    NumberObject,
+    PdfObject,
+    StreamObject,
+    TextStringObject,
+)
+
+BLOCK_SIZE = 1 << 20
+FLOAT_CACHE_SIZE = 4096
+
+# Escape sequences of the bytes of a literal string, see TextStringObject.write_to_stream().
+_STRING_ESCAPES = [
+    bytes([i]) if bytes([i]).isalnum() or i == 0x20 else b"\\%03o" % i for i in range(256)
+]
+
+
+class ObjectSerializer:
+    """
+    Write PDF objects to a stream with the same output as their ``write_to_stream()`` methods.
+
+    The output is collected in a buffer, which is written to the stream when it
+    exceeds ``block_size``. As the serializer provides ``write()`` and
+    ``tell()``, it can be passed wherever the writer expects its output stream.
+    Encoded names and floats are memoized.
+
+    Objects whose class overrides ``write_to_stream()`` are written by calling
+    that method.
+
+    Args:
+        stream: The stream to write to.
+        block_size: The size of the buffer after which it is written to the stream.
+
+    """
+
+    def __init__(self, stream: StreamType, block_size: int = BLOCK_SIZE) -> None:
+        self.stream = stream
+        self.block_size = block_size
+        self.buffer = bytearray()
+        self._offset = stream.tell()
+        self._names: dict[str, bytes] = {}
+        self._floats: dict[float, bytes] = {}
+        self._writers: dict[type, Callable[[Any], None]] = {}
+        # The writer to use for a class, by the implementation of write_to_stream() it uses.
+        self._implementations: dict[Callable[..., None], Callable[[Any], None]] = {
+            NullObject.write_to_stream: self._write_null,
+            BooleanObject.write_to_stream: self._write_boolean,
+            IndirectObject.write_to_stream: self._write_indirect_object,
+            FloatObject.write_to_stream: self._write_float,
+            NumberObject.write_to_stream: self._write_number,
+            ByteStringObject.write_to_stream: self._write_byte_string,
+            TextStringObject.write_to_stream: self._write_text_string,
+            NameObject.write_to_stream: self._write_name,
+            ArrayObject.write_to_stream: self._write_array,
+            DictionaryObject.write_to_stream: self._write_dictionary,
+            StreamObject.write_to_stream: self._write_stream,
+            ContentStream.write_to_stream: self._write_content_stream,
+        }
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        """Append data to the output."""
+        self.buffer += data
+        return len(data)
+
+    def tell(self) -> int:
+        """Get the position in the output."""
+        return self._offset + len(self.buffer)
+
+    def flush(self) -> None:
+        """Write the buffer to the stream."""
+        if self.buffer:
+            self.stream.write(self.buffer)
+            self._offset += len(self.buffer)
+            self.buffer = bytearray()
+
+    def pop_buffer(self) -> bytes:
+        """Get the output which has not been written to the stream yet, instead of writing it."""
+        data = bytes(self.buffer)
+        self._offset += len(self.buffer)
+        self.buffer = bytearray()
+        return data
+
+    def write_object(self, obj: PdfObject) -> None:
+        """Append an object to the output, and write the buffer to the stream if it is full."""
+        self._write(obj)
+        if len(self.buffer) >= self.block_size:
+            self.flush()
+
+    def _write(self, obj: Any) -> None:
+        cls = type(obj)
+        writer = self._writers.get(cls)
+        if writer is None:
+            writer = self._implementations.get(cls.write_to_stream, self._write_fallback)
+            self._writers[cls] = writer
+        writer(obj)
+
+    def _write_fallback(self, obj: Any) -> None:
+        obj.write_to_stream(self)
+
+    def _write_null(self, obj: NullObject) -> None:
+        self.buffer += b"null"
+
+    def _write_boolean(self, obj: BooleanObject) -> None:
+        self.buffer += b"true" if obj.value else b"false"
+
+    def _write_indirect_object(self, obj: IndirectObject) -> None:
+        self.buffer += b"%d %d R" % (obj.idnum, obj.generation)
+
+    def _write_float(self, obj: FloatObject) -> None:
+        encoded = self._floats.get(obj)
+        if encoded is None:
+            encoded = obj.myrepr().encode("utf8")
+            if len(self._floats) >= FLOAT_CACHE_SIZE:
+                self._floats.clear()
+            self._floats[obj] = encoded
+        self.buffer += encoded
+
+    def _write_number(self, obj: NumberObject) -> None:
+        self.buffer += b"%d" % obj
+
+    def _write_byte_string(self, obj: ByteStringObject) -> None:
+        self.buffer += b"<" + binascii.hexlify(obj) + b">"
+
+    def _write_text_string(self, obj: TextStringObject) -> None:
+        escapes = _STRING_ESCAPES
+        self.buffer += b"(" + b"".join([escapes[c] for c in obj.get_encoded_bytes()]) + b")"
+
+    def _write_name(self, obj: NameObject) -> None:
+        encoded = self._names.get(obj)
+        if encoded is None:
+            encoded = obj.renumber()
+            if encoded[:1] == b"/":
+                # Names with another first character are reported on each write.
+                self._names[obj] = encoded
+        self.buffer += encoded
+
+    def _write_array(self, obj: ArrayObject) -> None:
+        self.buffer += b"["
+        for item in obj:
+            self.buffer += b" "
+            self._write(item)
+        self.buffer += b" ]"
+
+    def _write_dictionary(self, obj: DictionaryObject, length: int = -1) -> None:
+        # A length is written as the /Length of a stream, like StreamObject.write_to_stream() does.
+        self.buffer += b"<<\n"
+        for key, value in obj.items():
+            if len(key) > 2 and key[1] == "%" and key[-1] == "%":
+                continue
+            self._write(key)
+            self.buffer += b" "
+            if length >= 0 and key == SA.LENGTH:
+                self.buffer += b"%d" % length
+                length = -1
+            else:
+                self._write(value)
+            self.buffer += b"\n"
+        if length >= 0:
+            self.buffer += b"/Length %d\n" % length
+        self.buffer += b">>"
+
+    def _write_stream(self, obj: StreamObject) -> None:
+        data = obj._stream_data if obj._stream_crypt is None else obj._data
+        self._write_dictionary(obj, len(data))
+        self.buffer += b"\nstream\n"
+        if len(data) >= self.block_size:
+            self.flush()
+            self.stream.write(data)
+            self._offset += len(data)
+        else:
+            self.buffer += data
+        self.buffer += b"\nendstream"
+
+    def _write_content_stream(self, obj: ContentStream) -> None:
+        if not obj._data and obj._operations:
+            obj.get_data()  # this ensures ._data is rebuilt
+        self._write_stream(obj)
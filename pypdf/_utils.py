@@ -36,8 +36,9 @@ import sys
 import warnings
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from io import DEFAULT_BUFFER_SIZE
-from os import SEEK_CUR
+from io import DEFAULT_BUFFER_SIZE, BufferedIOBase, BytesIO
+from os import SEEK_CUR, SEEK_END, SEEK_SET
+from pathlib import Path
 from re import Pattern
 from typing import (
     IO,
@@ -275,6 +276,81 @@ def skip_over_comment(stream: StreamType) -> None:
                 raise PdfStreamError("File ended unexpectedly.")
 
 
+def get_stream_buffer(stream: StreamType) -> Optional[Union[bytes, memoryview]]:
+    """
+    Get the whole content of an in-memory stream without copying it.
+
+    Args:
+        stream: The stream to inspect.
+
+    Returns:
+        The content of the stream, or ``None`` if it is not held in memory.
+
+    """
+    if isinstance(stream, BytesIO):
+        return stream.getvalue()
+    if isinstance(stream, MemoryMappedStream) and not stream.closed:
+        return stream._view
+    return None
+
+
+def scan_until_regex(
+    buffer: Union[bytes, memoryview], position: int, regex: Pattern[bytes], length: int = sys.maxsize
+) -> int:
+    """
+    Buffer-based equivalent of :func:`read_until_regex`.
+
+    The limit is checked against the same growing chunks which
+    :func:`read_until_regex` reads from streams, thus both functions accept and
+    reject exactly the same input.
+
+    Args:
+        buffer: The data to scan.
+        position: The index to start scanning at.
+        regex: The pattern to search for.
+        length: The (approximated) maximum number of bytes to read before raising an exception.
+
+    Returns:
+        The index of the match, or the end of the buffer.
+
+    Raises:
+        LimitReachedError: The limit has been reached. The ``position``
+            attribute of the exception holds the index of the end of the read data.
+
+    """
+    remaining = len(buffer) - position
+    if remaining <= 0:
+        return position
+    if length > 16:
+        # Fast path: match within the first chunk.
+        search_match = regex.search(buffer, position, position + 16)
+        if search_match is not None:
+            return search_match.start()
+    first_match = regex.search(buffer, position)
+    total_length = 0
+    chunk_size = 16
+    tail_start = position
+    while True:
+        token_length = min(chunk_size, remaining - total_length)
+        if token_length <= 0:
+            return position + total_length
+        current_length = total_length + token_length
+        if current_length >= length:
+            error = LimitReachedError(
+                f"Read stream length of {current_length} exceeds maximum allowed length of {length}."
+            )
+            error.position = position + current_length  # type: ignore[attr-defined]
+            raise error
+        if first_match is not None and position + current_length > first_match.start():
+            search_match = regex.search(buffer, tail_start, position + current_length)
+            if search_match is not None:
+                return search_match.start()
+        total_length = current_length
+        tail_start = position + total_length - min(16, token_length)
+        if chunk_size < 8192:
+            chunk_size <<= 1
+
+
 def read_until_regex(*, stream: StreamType, regex: Pattern[bytes], length: int = sys.maxsize) -> bytes:
     """
     Read until the regular expression pattern matched (ignore the match).
@@ -289,6 +365,17 @@ def read_until_regex(*, stream: StreamType, regex: Pattern[bytes], length: int =
         The read bytes.
 
     """
+    buffer = get_stream_buffer(stream)
+    if buffer is not None:
+        start = stream.tell()
+        try:
+            end = scan_until_regex(buffer, start, regex, length)
+        except LimitReachedError as error:
+            stream.seek(error.position)  # type: ignore[attr-defined]
+            raise
+        stream.seek(max(start, end))
+        return bytes(buffer[start:end])
+
     parts: list[bytes] = []
     total_length = 0
     tail = b""
@@ -405,6 +492,105 @@ def read_previous_line(stream: StreamType) -> bytes:
     return b"".join(line_content[::-1])
 
 
+class MemoryMappedStream(BufferedIOBase):
+    """
+    Read-only binary stream backed by a memory-mapped file.
+
+    It behaves like a :class:`io.BytesIO` holding the file content, but pages
+    are loaded on demand by the operating system instead of copying the whole
+    file into memory. :meth:`read_view` returns zero-copy slices of the map.
+
+    The mapping stays valid as long as views on it are alive, even after
+    :meth:`close`. The file must not be truncated while it is mapped.
+
+    Args:
+        path: Path of the file to map. The file must not be empty.
+
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        import mmap  # noqa: PLC0415
+
+        super().__init__()
+        self._file = open(path, "rb")  # noqa: SIM115
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        self._view = memoryview(self._mmap)
+        self._size = len(self._view)
+        self._position = 0
+
+    @property
+    def name(self) -> str:
+        return self._file.name
+
+    @property
+    def mode(self) -> str:
+        return self._file.mode
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_SET:
+            if offset < 0:
+                raise ValueError(f"negative seek value {offset}")
+            self._position = offset
+        elif whence == SEEK_CUR:
+            self._position = max(0, self._position + offset)
+        elif whence == SEEK_END:
+            self._position = max(0, self._size + offset)
+        else:
+            raise ValueError(f"invalid whence ({whence}, should be 0, 1 or 2)")
+        return self._position
+
+    def _end_position(self, size: Optional[int]) -> int:
+        if size is None or size < 0:
+            return self._size
+        return min(self._position + size, self._size)
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if self._position >= self._size:
+            return b""
+        end = self._end_position(size)
+        data = self._mmap[self._position:end]
+        self._position = end
+        return data
+
+    read1 = read
+
+    def read_view(self, size: Optional[int] = -1) -> memoryview:
+        """Same as :meth:`read`, but return a zero-copy view on the map."""
+        start = min(self._position, self._size)
+        end = max(start, self._end_position(size))
+        self._position = end
+        return self._view[start:end]
+
+    def getbuffer(self) -> memoryview:
+        return self._view[:]
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Stream data still references the map. It is unmapped as soon
+            # as the last view is garbage collected.
+            pass
+        self._file.close()
+        super().close()
+
+
 def matrix_multiply(
     a: TransformationMatrixType, b: TransformationMatrixType
 ) -> TransformationMatrixType:
@@ -30,11 +30,15 @@
 import decimal
 import enum
 import hashlib
+import os
 import re
 import struct
 import sys
 import uuid
-from collections.abc import Iterable, Mapping, Sequence
+import weakref
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO, FileIO, IOBase
 from itertools import compress
 from pathlib import Path
@@ -55,11 +59,12 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
-from ._doc_common import DocumentInformation, PdfDocCommon
-from ._encryption import EncryptAlgorithm, Encryption
+from ._doc_common import INHERITABLE_PAGE_ATTRIBUTES, PAGE_TREE_MAX_DEPTH, DocumentInformation, PdfDocCommon
+from ._encryption import CryptFilter, EncryptAlgorithm, Encryption
 from ._page import PageObject, Transformation
 from ._page_labels import nums_clear_range, nums_insert, nums_next
 from ._reader import PdfReader
+from ._serializer import ObjectSerializer
 from ._utils import (
     StrByteType,
     StreamType,
@@ -91,6 +96,7 @@ from .generic import (
     BooleanObject,
     ByteStringObject,
     ContentStream,
+    DecodedStreamObject,
     Destination,
     DictionaryObject,
     EmbeddedFile,
@@ -125,6 +131,8 @@ from .types import (
 from .xmp import XmpInformation
 
 ALL_DOCUMENT_PERMISSIONS = UserAccessPermissions.all()
+# Streams with less data are compressed and encrypted by the thread writing the document.
+PARALLEL_WRITE_MIN_SIZE = 64 * 1024
 
 
 class ObjectDeletionFlag(enum.IntFlag):
@@ -172,6 +180,28 @@ class PdfWriter(PdfDocCommon):
         keep_initial_header: If true, the PDF header of the cloned document is kept
             when using ``clone_from`` in non-incremental mode.
 
+        use_object_streams: If true, objects other than streams are packed into
+            compressed object streams, and a cross-reference stream is written
+            instead of a cross-reference table. This requires PDF 1.5, the
+            header is updated accordingly. Not used in incremental mode.
+
+        objects_per_stream: The maximum number of objects per object stream.
+
+        page_tree_fanout: If set, the page tree is kept balanced with at most this
+            many kids per node, which must be at least 3: a node is split when
+            pages are added to it, and the page tree is rebuilt accordingly when
+            the document is written. This keeps inserting pages and accessing a
+            page by its number fast for documents with many pages. By default,
+            all pages are kids of the root.
+
+        preserve_encryption: If true, the document is written with the encryption
+            of the encrypted document given by ``clone_from``, which has to be
+            decrypted. The data of streams which have not been accessed is then
+            written as read, without decrypting and encrypting it again. As the
+            keys of RC4 and AES-128 depend on the number of the object, this only
+            applies to streams which keep their object number with these algorithms,
+            which all objects do with ``full=True``. Not available in incremental mode.
+
     """
 
     def __init__(
@@ -185,6 +215,10 @@ class PdfWriter(PdfDocCommon):
         keep_initial_header: bool = False,
         incremental_clone_object_count_limit: Optional[int] = 500_000,
         incremental_clone_object_id_limit: Optional[int] = 1_000_000,
+        use_object_streams: bool = False,
+        objects_per_stream: int = 200,
+        page_tree_fanout: Optional[int] = None,
+        preserve_encryption: bool = False,
     ) -> None:
         self.strict = strict
         """
@@ -197,6 +231,36 @@ class PdfWriter(PdfDocCommon):
         """
         Returns if the PdfWriter object has been started in incremental mode.
         """
+        self._full_clone = full and not incremental
+        """Whether the objects are cloned like in incremental mode, but written as a new document."""
+
+        if objects_per_stream < 1:
+            raise ValueError(f"objects_per_stream must be at least 1, not {objects_per_stream}")
+        self.use_object_streams = use_object_streams
+        """If true, objects are packed into object streams, see the class documentation."""
+        self.objects_per_stream = objects_per_stream
+        """The maximum number of objects per object stream."""
+        if page_tree_fanout is not None and page_tree_fanout < 3:
+            # Splitting a node then leaves at least 2 kids in each half.
+            raise ValueError(f"page_tree_fanout must be at least 3, not {page_tree_fanout}")
+        self.page_tree_fanout = page_tree_fanout
+        """The maximum number of kids of a node of the page tree, or None to keep the page tree as is."""
+        self.write_workers: Optional[int] = 1
+        """
+        The number of threads encrypting the streams and compressing the object
+        streams when the document is written, or None for the number of CPUs.
+        Large streams are then prepared while the preceding objects are written.
+        Defaults to 1, thus the document is written by a single thread.
+        """
+
+        self._streaming_output: Optional[StreamType] = None
+        """The output of a writer created by :meth:`streaming`."""
+        self._streaming_own_output = False
+        self._streaming_header: Optional[str] = None
+        """The header written to the output of a streaming writer, if any."""
+        self._streamed_offsets: dict[int, int] = {}
+        """Maps the numbers of the objects written by :meth:`flush` to their offsets."""
+        self._streamed_pages: set[int] = set()
 
         self._objects: list[Optional[PdfObject]] = []
         """
@@ -210,6 +274,17 @@ class PdfWriter(PdfDocCommon):
         List of hashes after import; used to identify changes.
         """
 
+        self._tracked_objects: list[Optional[PdfObject]] = []
+        """
+        The objects of the original document whose modifications are tracked,
+        in incremental mode. Objects which are not tracked are compared with
+        their original hash instead.
+        """
+
+        self._modified_objects: set[int] = set()
+        """Numbers of the tracked objects which have been modified."""
+        self._container_kinds: dict[type, type] = {}
+
         self._idnum_hash: dict[bytes, tuple[IndirectObject, list[IndirectObject]]] = {}
         """
         Maps hash values of indirect objects to the list of IndirectObjects.
@@ -306,6 +381,8 @@ class PdfWriter(PdfDocCommon):
         self._encryption: Optional[Encryption] = None
         self._encrypt_entry: Optional[DictionaryObject] = None
 
+        if preserve_encryption and (clone_from is None or incremental):
+            raise ValueError("preserve_encryption requires a document to clone from, and no incremental mode")
         if clone_from is not None:
             if not isinstance(clone_from, PdfReader):
                 clone_from = PdfReader(clone_from)
@@ -324,6 +401,8 @@ class PdfWriter(PdfDocCommon):
             self._add_object(self._root_object)
         if full and not incremental:
             self.incremental = False
+        if preserve_encryption:
+            self._preserve_encryption(cast(PdfReader, clone_from))
         if isinstance(self._ID, list):
             if isinstance(self._ID[0], TextStringObject):
                 self._ID[0] = ByteStringObject(self._ID[0].get_original_bytes())
@@ -421,6 +500,8 @@ class PdfWriter(PdfDocCommon):
 
     def __enter__(self) -> Self:
         """Store how writer is initialized by 'with'."""
+        if self._streaming_output is not None:
+            return self
         c: bool = self._cloned
         t = self.temp_fileobj
         self.__init__()  # type: ignore[misc]
@@ -436,6 +517,12 @@ class PdfWriter(PdfDocCommon):
         traceback: Optional[TracebackType],
     ) -> None:
         """Write data to the fileobj."""
+        if self._streaming_output is not None:
+            if exc_type is None:
+                self.close()
+            elif self._streaming_own_output:
+                self._streaming_output.close()
+            return
         if self.fileobj and not self._cloned:
             self.write(self.fileobj)
 
@@ -504,10 +591,71 @@ class PdfWriter(PdfDocCommon):
             obj = obj.clone(self)
         self._objects[indirect_reference - 1] = obj
         obj.indirect_reference = IndirectObject(indirect_reference, gen, self)
+        if indirect_reference <= len(self._tracked_objects):
+            # Track the new object if it equals the original one.
+            self._modified_objects.discard(indirect_reference)
+            self._tracked_objects[indirect_reference - 1] = None
+            if obj.hash_bin() == self._original_hash[indirect_reference - 1]:
+                self._track_modifications(indirect_reference, obj)
 
         assert isinstance(obj, PdfObject), "mypy"
         return obj
 
+    def _track_modifications(self, idnum: int, obj: PdfObject) -> None:
+        """
+        Track the modifications of an object of the original document in incremental mode.
+
+        The dictionaries and arrays which are directly part of the object report
+        their modifications to :attr:`_modified_objects`, see
+        :meth:`PdfObject._mark_modified`. Objects sharing a dictionary or an array
+        with another object are not tracked.
+
+        Args:
+            idnum: The number of the object.
+            obj: The object.
+
+        """
+        tracker = (self._modified_objects, idnum)
+        containers: list[PdfObject] = []
+        visited: set[int] = set()
+        stack = [obj]
+        while stack:
+            item = stack.pop()
+            # isinstance() is slow for the PdfObject classes, being protocols.
+            kind = self._container_kinds.get(type(item))
+            if kind is None:
+                kind = self._container_kinds[type(item)] = (
+                    DictionaryObject if isinstance(item, DictionaryObject)
+                    else ArrayObject if isinstance(item, ArrayObject)
+                    else PdfObject
+                )
+            if kind is DictionaryObject:
+                values: Iterable[Any] = item.values()  # type: ignore[attr-defined]
+            elif kind is ArrayObject:
+                values = item  # type: ignore[assignment]
+            else:
+                continue
+            if id(item) in visited:
+                continue
+            visited.add(id(item))
+            current = item._modification_tracker
+            if current is not None and (current[0] is not self._modified_objects or current[1] != idnum):
+                self._tracked_objects[idnum - 1] = None
+                return
+            containers.append(item)
+            stack.extend(values)
+        for item in containers:
+            item._modification_tracker = tracker
+        self._tracked_objects[idnum - 1] = obj
+
+    def _is_modified(self, idnum: int, obj: PdfObject) -> bool:
+        """Check whether an object has to be written in an incremental update."""
+        if idnum > len(self._original_hash):
+            return True
+        if obj is self._tracked_objects[idnum - 1]:
+            return idnum in self._modified_objects
+        return obj.hash_bin() != self._original_hash[idnum - 1]
+
     def _add_page(
         self,
         page: PageObject,
@@ -539,14 +687,17 @@ class PdfWriter(PdfDocCommon):
             self.pdf_header = _get_max_pdf_version_header(self.pdf_header, other)
 
         node, idx = self._get_page_in_node(index)
+        if idx < 0 and self.page_tree_fanout is not None:
+            node = self._get_last_page_tree_node()
         page[NameObject(PagesAttributes.PARENT)] = node.indirect_reference
 
         if idx >= 0:
             cast(ArrayObject, node[PagesAttributes.KIDS]).insert(idx, page.indirect_reference)
             self.flattened_pages.insert(index, page)
+            self._invalidate_page_index()
         else:
             cast(ArrayObject, node[PagesAttributes.KIDS]).append(page.indirect_reference)
-            self.flattened_pages.append(page)
+            self._append_flattened_page(page)
         current: Optional[PdfObject] = node
         recurse = 0
         while not is_null_or_none(current):
@@ -566,8 +717,116 @@ class PdfWriter(PdfDocCommon):
             self._unresolved_links.extend(extract_links(page, page_org))
             self._merged_in_pages[page_org.indirect_reference] = page.indirect_reference
 
+        if self.page_tree_fanout is not None:
+            self._split_page_tree_node(node, appended=idx < 0)
         return page
 
+    def _get_last_page_tree_node(self) -> DictionaryObject:
+        """Get the node of the page tree containing the last page, to which pages are appended."""
+        node = cast(DictionaryObject, self._pages.get_object())
+        for _ in range(PAGE_TREE_MAX_DEPTH):
+            kids = cast(ArrayObject, node[PagesAttributes.KIDS])
+            if not kids:
+                break
+            last = cast(DictionaryObject, kids[-1].get_object())
+            if last.get(PagesAttributes.TYPE) != "/Pages":
+                break
+            node = last
+        return node
+
+    def _split_page_tree_node(self, node: DictionaryObject, appended: bool = False) -> None:
+        """
+        Split a node of the page tree having more than ``page_tree_fanout`` kids.
+
+        The kids are distributed over new sibling nodes, which may require
+        splitting the parent node as well. The kids of the root are moved to new
+        nodes below it instead, thus the root itself is kept.
+
+        Args:
+            node: The /Pages node to split.
+            appended: Whether the node overflows because a page has been
+                appended to the document. The node is then kept full and only
+                the last kids are moved to a new sibling, as further pages are
+                appended to that sibling. Otherwise, the kids are distributed
+                evenly.
+
+        """
+        fanout = cast(int, self.page_tree_fanout)
+        for _ in range(PAGE_TREE_MAX_DEPTH):
+            kids = cast(ArrayObject, node[PagesAttributes.KIDS])
+            if len(kids) <= fanout:
+                return
+            if appended:
+                bounds = [*range(0, len(kids), fanout), len(kids)]
+            else:
+                group_count = -(-len(kids) // fanout)
+                bounds = [len(kids) * i // group_count for i in range(group_count + 1)]
+            groups = [ArrayObject(kids[start:stop]) for start, stop in zip(bounds, bounds[1:])]
+            parent = node.get(PagesAttributes.PARENT)
+            if parent is None:
+                node[NameObject(PagesAttributes.KIDS)] = ArrayObject(
+                    self._add_page_tree_node(group, node) for group in groups
+                )
+                continue
+            # The siblings have to inherit the same attributes as the node.
+            inherited = {
+                NameObject(key): node.raw_get(key) for key in INHERITABLE_PAGE_ATTRIBUTES if key in node
+            }
+            node[NameObject(PagesAttributes.KIDS)] = groups[0]
+            node[NameObject(PagesAttributes.COUNT)] = NumberObject(
+                sum(self._get_page_tree_count(kid) for kid in groups[0])
+            )
+            reference = node.indirect_reference
+            node = cast(DictionaryObject, parent.get_object())
+            parent_kids = cast(ArrayObject, node[PagesAttributes.KIDS])
+            position = parent_kids.index(reference) + 1
+            parent_kids[position:position] = [
+                self._add_page_tree_node(group, node, inherited) for group in groups[1:]
+            ]
+        raise PyPdfError("Too many recursive calls!")
+
+    def _add_page_tree_node(
+        self,
+        kids: ArrayObject,
+        parent: DictionaryObject,
+        attributes: Optional[dict[NameObject, PdfObject]] = None,
+    ) -> IndirectObject:
+        node = DictionaryObject(attributes or {})
+        node[NameObject(PagesAttributes.TYPE)] = NameObject("/Pages")
+        node[NameObject(PagesAttributes.PARENT)] = cast(IndirectObject, parent.indirect_reference)
+        node[NameObject(PagesAttributes.KIDS)] = kids
+        node[NameObject(PagesAttributes.COUNT)] = NumberObject(sum(self._get_page_tree_count(kid) for kid in kids))
+        reference = self._add_object(node)
+        for kid in kids:
+            cast(DictionaryObject, kid.get_object())[NameObject(PagesAttributes.PARENT)] = reference
+        return reference
+
+    @staticmethod
+    def _get_page_tree_count(kid: PdfObject) -> int:
+        obj = cast(DictionaryObject, kid.get_object())
+        if obj.get(PagesAttributes.TYPE) == "/Pages":
+            return cast(int, obj.get(PagesAttributes.COUNT, 0))
+        return 1
+
+    def _balance_page_tree(self) -> None:
+        """Split all nodes of the page tree having more than ``page_tree_fanout`` kids."""
+        nodes = []
+        stack = [cast(DictionaryObject, self._pages.get_object())]
+        visited: set[int] = set()
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            nodes.append(node)
+            for kid in cast(ArrayObject, node.get(PagesAttributes.KIDS, ArrayObject())):
+                obj = kid.get_object()
+                if isinstance(obj, DictionaryObject) and obj.get(PagesAttributes.TYPE) == "/Pages":
+                    stack.append(obj)
+        # Children first, the new siblings are inserted into nodes which have not been split yet.
+        for node in reversed(nodes):
+            self._split_page_tree_node(node)
+
     def set_need_appearances_writer(self, state: bool = True) -> None:
         """
         Sets the "NeedAppearances" flag in the PDF writer.
@@ -1199,10 +1458,15 @@ class PdfWriter(PdfDocCommon):
             )
 
         # must be done here before rewriting
-        if self.incremental:
+        if self.incremental and not self._full_clone:
             self._original_hash = [
                 (obj.hash_bin() if obj is not None else 0) for obj in self._objects
             ]
+            self._tracked_objects = [None] * len(self._objects)
+            self._modified_objects.clear()
+            for idnum, obj in enumerate(self._objects, start=1):
+                if obj is not None:
+                    self._track_modifications(idnum, obj)
 
         try:
             self._flatten()
@@ -1247,9 +1511,10 @@ class PdfWriter(PdfDocCommon):
                     IndirectObject, inf.clone(self).indirect_reference
                 )
                 assert isinstance(self._info, DictionaryObject), "mypy"
-                self._original_hash[
-                    self._info_obj.indirect_reference.idnum - 1
-                ] = self._info.hash_bin()
+                if not self._full_clone:
+                    self._original_hash[
+                        self._info_obj.indirect_reference.idnum - 1
+                    ] = self._info.hash_bin()
         elif inf is not None:
             self._info_obj = self._add_object(
                 DictionaryObject(cast(DictionaryObject, inf.get_object()))
@@ -1269,7 +1534,9 @@ class PdfWriter(PdfDocCommon):
 
     def _compute_document_identifier(self) -> ByteStringObject:
         stream = BytesIO()
-        self._write_pdf_structure(stream)
+        serializer = ObjectSerializer(stream)
+        self._write_pdf_structure(serializer)
+        serializer.flush()
         stream.seek(0)
         return ByteStringObject(_rolling_checksum(stream).encode("utf8"))
 
@@ -1328,6 +1595,8 @@ class PdfWriter(PdfDocCommon):
         """
         if self.incremental:
             raise NotImplementedError("Encrypting incremental PDF files is currently not supported.")
+        if self._streamed_offsets:
+            raise PyPdfError("A streaming writer has to be encrypted before objects are written.")
 
         if owner_password is None:
             owner_password = user_password
@@ -1355,6 +1624,15 @@ class PdfWriter(PdfDocCommon):
             self._add_object(entry)
         self._encrypt_entry = entry
 
+    def _preserve_encryption(self, reader: PdfReader) -> None:
+        """Encrypt the document like the document it has been cloned from."""
+        encryption = reader._encryption
+        if encryption is None or not encryption.is_decrypted():
+            raise PyPdfError("The document to clone from has to be encrypted and decrypted to preserve its encryption.")
+        self._encryption = encryption
+        encrypt_entry = cast(DictionaryObject, reader.trailer[TK.ENCRYPT].get_object())
+        self._encrypt_entry = encrypt_entry.clone(self)
+
     def _resolve_links(self) -> None:
         """Patch up links that were added to the document earlier, to
         make sure they still point to the same pages.
@@ -1376,20 +1654,30 @@ class PdfWriter(PdfDocCommon):
                 source=__name__,
                 stream_name=stream.name,
             )
+        if self._streaming_output is not None:
+            raise PyPdfError("A streaming writer writes to its output while it is built, use close() instead.")
         self._resolve_links()
+        if self.page_tree_fanout is not None and not self.incremental:
+            self._balance_page_tree()
 
         if self.incremental:
             assert self._reader is not None, "mypy"
             self._reader.stream.seek(0)
             stream.write(self._reader.stream.read(-1))
-            if len(self.list_objects_in_increment()) > 0:
-                self._write_increment(stream)  # writes objs, xref stream and startxref
+            if len(self.list_objects_in_increment()) == 0:
+                return
+        serializer = ObjectSerializer(stream)
+        if self.incremental:
+            self._write_increment(serializer)  # writes objs, xref stream and startxref
+        elif self.use_object_streams:
+            self._write_compressed_pdf_structure(serializer)
         else:
-            object_positions, free_objects = self._write_pdf_structure(stream)
+            object_positions, free_objects = self._write_pdf_structure(serializer)
             xref_location = self._write_xref_table(
-                stream, object_positions, free_objects
+                serializer, object_positions, free_objects
             )
-            self._write_trailer(stream, xref_location)
+            self._write_trailer(serializer, xref_location)
+        serializer.flush()
 
     def write(self, stream: Union[Path, StrByteType]) -> tuple[bool, IO[Any]]:
         """
@@ -1423,6 +1711,129 @@ class PdfWriter(PdfDocCommon):
 
         return my_file, stream
 
+    @classmethod
+    def streaming(
+        cls,
+        stream: Union[Path, StrByteType],
+        *,
+        strict: bool = False,
+        page_tree_fanout: Optional[int] = None,
+    ) -> "PdfWriter":
+        """
+        Create a writer which writes the document to its output while it is built.
+
+        Each time :meth:`merge` or :meth:`append` has added the pages of a
+        document, the objects used by these pages, like their contents, resources
+        and annotations, are written to the output and released. Only the
+        catalog, the page tree, the pages, the outline and the form fields are
+        kept until the writer is closed, thus merging many documents only needs
+        memory for one of them at a time.
+
+        Objects which have been written cannot be modified anymore, and links
+        between pages are only resolved within the pages added by one call to
+        :meth:`merge` or :meth:`flush`. Object streams and incremental
+        updates are not supported. If the document is to be encrypted,
+        :meth:`encrypt` has to be called before adding pages.
+
+        .. code-block:: python
+
+            with PdfWriter.streaming("merged.pdf") as writer:
+                for path in paths:
+                    writer.append(path)
+
+        Args:
+            stream: An object to write the file to, or a file path.
+            strict: See :class:`PdfWriter`.
+            page_tree_fanout: See :class:`PdfWriter`.
+
+        Returns:
+            The writer. The document is completed by :meth:`close`, which is
+            called when leaving the ``with`` block.
+
+        """
+        writer = cls(strict=strict, page_tree_fanout=page_tree_fanout)
+        if isinstance(stream, (str, Path)):
+            stream = FileIO(stream, "wb")
+            writer._streaming_own_output = True
+        writer._streaming_output = stream
+        return writer
+
+    def flush(self) -> None:
+        """
+        Write the objects used by the pages added so far to the output of a streaming writer.
+
+        See :meth:`streaming`; this is done automatically after each :meth:`merge`.
+        """
+        stream = self._streaming_output
+        if stream is None:
+            raise PyPdfError("Only a writer created by PdfWriter.streaming() can be flushed.")
+        self._resolve_links()
+        self._unresolved_links.clear()
+        self._merged_in_pages.clear()
+        serializer = ObjectSerializer(stream)
+        if self._streaming_header is None:
+            self._streaming_header = self.pdf_header
+            serializer.write(self.pdf_header.encode() + b"\n")
+            serializer.write(b"%\xE2\xE3\xCF\xD3\n")
+        objects = [(idnum, self._objects[idnum - 1]) for idnum in self._collect_streamable_objects()]
+        for idnum, obj in self._prepare_objects(objects):
+            self._streamed_offsets[idnum] = serializer.tell()
+            self._write_top_level_object(serializer, idnum, cast(PdfObject, obj))
+            # Keep the reference for objects cloned from the same document later.
+            placeholder = NullObject()
+            placeholder.indirect_reference = cast(PdfObject, self._objects[idnum - 1]).indirect_reference
+            self._objects[idnum - 1] = placeholder
+        serializer.flush()
+        for key, translated in self._id_translated.items():
+            source = translated.pop("PreventGC", None)
+            if source is not None:
+                # Release the source document; its numbers must not be reused by another one.
+                weakref.finalize(source, self._id_translated.pop, key, None)
+
+    def _collect_streamable_objects(self) -> list[int]:
+        """
+        Get the numbers of the objects used by the pages which have not been flushed yet.
+
+        The pages themselves, the page tree and objects with a /Parent, like form
+        fields, are not included as they may still be modified.
+        """
+        assert self.flattened_pages is not None, "mypy"
+        page_numbers = {cast(IndirectObject, page.indirect_reference).idnum for page in self.flattened_pages}
+        stack: list[PdfObject] = []
+        for page in self.flattened_pages:
+            idnum = cast(IndirectObject, page.indirect_reference).idnum
+            if idnum not in self._streamed_pages:
+                self._streamed_pages.add(idnum)
+                # Set by merge(), it keeps the source document alive.
+                vars(page).pop("original_page", None)
+                stack.extend(value for key, value in page.items() if key != PagesAttributes.PARENT)
+        result = []
+        visited: set[int] = set()
+        while stack:
+            obj: Optional[PdfObject] = stack.pop()
+            if isinstance(obj, IndirectObject):
+                idnum = obj.idnum
+                if (
+                    obj.pdf is not self
+                    or idnum in visited
+                    or idnum in self._streamed_offsets
+                    or idnum in page_numbers
+                ):
+                    continue
+                visited.add(idnum)
+                obj = self._objects[idnum - 1]
+                if obj is None:
+                    continue
+                if not isinstance(obj, DictionaryObject) or not any(
+                    key in obj for key in (PagesAttributes.PARENT, PagesAttributes.KIDS, "/FT", "/T")
+                ):
+                    result.append(idnum)
+            if isinstance(obj, DictionaryObject):
+                stack.extend(value for key, value in obj.items() if key != PagesAttributes.PARENT)
+            elif isinstance(obj, ArrayObject):
+                stack.extend(obj)
+        return sorted(result)
+
     def list_objects_in_increment(self) -> list[IndirectObject]:
         """
         For analysis or debugging.
@@ -1434,33 +1845,21 @@ class PdfWriter(PdfDocCommon):
             List of new or modified IndirectObjects
 
         """
-        original_hash_count = len(self._original_hash)
         return [
             cast(IndirectObject, obj).indirect_reference
-            for i, obj in enumerate(self._objects)
-            if (
-                obj is not None
-                and (
-                    i >= original_hash_count
-                    or obj.hash_bin() != self._original_hash[i]
-                )
-            )
+            for idnum, obj in enumerate(self._objects, start=1)
+            if obj is not None and self._is_modified(idnum, obj)
         ]
 
-    def _write_increment(self, stream: StreamType) -> None:
+    def _write_increment(self, stream: ObjectSerializer) -> None:
         # Only reached from `write()` inside `if self.incremental`.
         assert self._reader is not None, "mypy"
         object_positions = {}
         object_blocks = []
         current_start = -1
         current_stop = -2
-        original_hash_count = len(self._original_hash)
-        for i, obj in enumerate(self._objects):
-            if obj is not None and (
-                i >= original_hash_count
-                or obj.hash_bin() != self._original_hash[i]
-            ):
-                idnum = i + 1
+        for idnum, obj in enumerate(self._objects, start=1):
+            if obj is not None and self._is_modified(idnum, obj):
                 assert isinstance(obj, PdfObject), "mypy"
                 # first write new/modified object
                 object_positions[idnum] = stream.tell()
@@ -1469,7 +1868,7 @@ class PdfWriter(PdfDocCommon):
                 if self._encryption and obj != self._encrypt_entry:
                     obj = self._encryption.encrypt_object(obj, idnum, 0)
                 """
-                obj.write_to_stream(stream)
+                stream.write_object(obj)
                 stream.write(b"\nendobj\n")
 
                 # prepare xref
@@ -1499,13 +1898,8 @@ class PdfWriter(PdfDocCommon):
             ),
             "__streamdata__": b"",
         }
-        if self._info is not None and (
-            self._info.indirect_reference.idnum - 1  # type: ignore[union-attr]
-            >= len(self._original_hash)
-            or cast(IndirectObject, self._info).hash_bin()  # kept for future
-            != self._original_hash[
-                self._info.indirect_reference.idnum - 1  # type: ignore[union-attr]
-            ]
+        if self._info is not None and self._is_modified(
+            self._info.indirect_reference.idnum, self._info  # type: ignore[union-attr]
         ):
             init_data[NameObject(TK.INFO)] = self._info.indirect_reference
         init_data[NameObject(TK.PREV)] = NumberObject(self._reader._startxref)
@@ -1517,31 +1911,204 @@ class PdfWriter(PdfDocCommon):
                 [struct.pack(b">BIB", 1, _pos, 0) for _pos in object_positions.values()]
             )
         )
-        xr.write_to_stream(stream)
+        stream.write_object(xr)
         stream.write(f"\nendobj\nstartxref\n{xref_location}\n%%EOF\n".encode())  # eof
 
-    def _write_pdf_structure(self, stream: StreamType) -> tuple[list[int], list[int]]:
+    def _write_pdf_structure(self, stream: ObjectSerializer) -> tuple[list[int], list[int]]:
         object_positions = []
         free_objects = []
         stream.write(self.pdf_header.encode() + b"\n")
         stream.write(b"%\xE2\xE3\xCF\xD3\n")
 
-        for idnum, obj in enumerate(self._objects, start=1):
+        for idnum, obj in self._prepare_objects(enumerate(self._objects, start=1)):
             if obj is not None:
                 object_positions.append(stream.tell())
-                stream.write(f"{idnum} 0 obj\n".encode())
-                if self._encryption and obj != self._encrypt_entry:
-                    obj = self._encryption.encrypt_object(obj, idnum, 0)
-                obj.write_to_stream(stream)
-                stream.write(b"\nendobj\n")
+                self._write_top_level_object(stream, idnum, obj)
             else:
                 object_positions.append(-1)
                 free_objects.append(idnum)
         free_objects.append(0)  # add 0 to loop in accordance with specification
         return object_positions, free_objects
 
+    def _write_compressed_pdf_structure(self, stream: ObjectSerializer) -> None:
+        """
+        Write the objects, packing them into object streams, followed by a cross-reference stream.
+
+        Streams, the encryption dictionary and the cross-reference stream are
+        written as top-level objects, see §7.5.7 of the PDF 2.0 specification.
+        """
+        # Object streams require PDF 1.5.
+        header = max(self.pdf_header, "%PDF-1.5")
+        stream.write(header.encode() + b"\n")
+        stream.write(b"%\xE2\xE3\xCF\xD3\n")
+
+        # Entries of the cross-reference stream: (type, field 2, field 3)
+        xref_entries: list[tuple[int, int, int]] = [(0, 0, 65535)]
+        free_objects = []
+        top_level_objects: list[tuple[int, Optional[PdfObject]]] = []
+        packed_objects: list[tuple[int, PdfObject]] = []
+        for idnum, obj in enumerate(self._objects, start=1):
+            if obj is None:
+                xref_entries.append((0, 0, 1))
+                free_objects.append(idnum)
+            elif isinstance(obj, StreamObject) or obj is self._encrypt_entry:
+                xref_entries.append((1, 0, 0))  # updated below
+                top_level_objects.append((idnum, obj))
+            else:
+                xref_entries.append((2, 0, 0))  # updated below
+                packed_objects.append((idnum, obj))
+        for idnum, obj in self._prepare_objects(top_level_objects):
+            xref_entries[idnum] = (1, stream.tell(), 0)
+            self._write_top_level_object(stream, idnum, cast(PdfObject, obj))
+
+        def pack_object_streams() -> Iterator[tuple[int, PdfObject]]:
+            # The contents of the object streams are kept in the buffer of the packer.
+            packer = ObjectSerializer(BytesIO(), block_size=sys.maxsize)
+            for stream_idnum, start in enumerate(
+                range(0, len(packed_objects), self.objects_per_stream), start=len(self._objects) + 1
+            ):
+                chunk = packed_objects[start:start + self.objects_per_stream]
+                offsets = []
+                chunk_start = packer.tell()
+                for index, (idnum, obj) in enumerate(chunk):
+                    offsets.append(f"{idnum} {packer.tell() - chunk_start}")
+                    packer.write_object(obj)
+                    packer.write(b"\n")
+                    xref_entries[idnum] = (2, stream_idnum, index)
+                offset_table = " ".join(offsets).encode() + b"\n"
+                object_stream = DecodedStreamObject()
+                object_stream[NameObject("/Type")] = NameObject("/ObjStm")
+                object_stream[NameObject("/N")] = NumberObject(len(chunk))
+                object_stream[NameObject("/First")] = NumberObject(len(offset_table))
+                object_stream.set_data(offset_table + packer.pop_buffer())
+                yield stream_idnum, object_stream
+
+        next_idnum = len(self._objects) + 1
+        for idnum, obj in self._prepare_objects(pack_object_streams(), compress=True):
+            xref_entries.append((1, stream.tell(), 0))
+            self._write_top_level_object(stream, idnum, cast(PdfObject, obj))
+            next_idnum = idnum + 1
+
+        # Link the free entries, like in _write_xref_table.
+        free_objects.append(0)
+        xref_entries[0] = (0, free_objects[0], 65535)
+        for current, following in zip(free_objects, free_objects[1:]):
+            xref_entries[current] = (0, following, 1)
+
+        xref_location = stream.tell()
+        xref_entries.append((1, xref_location, 0))
+        widths = [
+            1,
+            max(1, (max(entry[1] for entry in xref_entries).bit_length() + 7) // 8),
+            max(1, (max(entry[2] for entry in xref_entries).bit_length() + 7) // 8),
+        ]
+        xref_stream = DecodedStreamObject()
+        xref_stream.update(
+            {
+                NameObject("/Type"): NameObject("/XRef"),
+                NameObject(TK.SIZE): NumberObject(len(xref_entries)),
+                NameObject(TK.ROOT): self.root_object.indirect_reference,
+                NameObject("/W"): ArrayObject([NumberObject(width) for width in widths]),
+            }
+        )
+        if self._info is not None:
+            xref_stream[NameObject(TK.INFO)] = self._info.indirect_reference
+        if self._ID is not None:
+            xref_stream[NameObject(TK.ID)] = self._ID
+        if self._encrypt_entry:
+            xref_stream[NameObject(TK.ENCRYPT)] = self._encrypt_entry.indirect_reference
+        xref_stream.set_data(
+            b"".join(
+                b"".join(value.to_bytes(width, "big") for value, width in zip(entry, widths))
+                for entry in xref_entries
+            )
+        )
+        # The cross-reference stream is never encrypted.
+        stream.write(f"{next_idnum} 0 obj\n".encode())
+        stream.write_object(xref_stream.flate_encode())
+        stream.write(f"\nendobj\nstartxref\n{xref_location}\n%%EOF\n".encode())
+
+    def _prepare_objects(
+        self, objects: Iterable[tuple[int, Optional[PdfObject]]], compress: bool = False
+    ) -> Iterator[tuple[int, Optional[PdfObject]]]:
+        """
+        Prepare top-level objects for :meth:`_write_top_level_object`, keeping their order.
+
+        The objects are encrypted if the document is encrypted, and the streams
+        are compressed first if ``compress`` is set. With several
+        :attr:`write_workers`, large streams are prepared in a pool of threads
+        while the preceding objects are written, as zlib and the crypt
+        providers release the GIL.
+
+        Args:
+            objects: The numbers of the objects and the objects, or None for free entries.
+            compress: Whether to compress the objects, which have to be streams.
+
+        Returns:
+            The numbers of the objects and the objects to write.
+
+        """
+        workers = (os.cpu_count() or 1) if self.write_workers is None else self.write_workers
+        pool = ThreadPoolExecutor(workers) if workers > 1 else None
+        pending: deque[tuple[int, Union[Optional[PdfObject], Future[PdfObject]]]] = deque()
+        running = 0
+
+        def next_object() -> tuple[int, Optional[PdfObject]]:
+            nonlocal running
+            idnum, obj = pending.popleft()
+            if isinstance(obj, Future):
+                running -= 1
+                return idnum, obj.result()
+            return idnum, obj
+
+        try:
+            for idnum, obj in objects:
+                crypt_filter = None
+                if (
+                    self._encryption is not None
+                    and obj is not None
+                    and obj != self._encrypt_entry
+                    and Encryption._is_encryption_object(obj)
+                ):
+                    crypt_filter = self._encryption._get_crypt_filter(idnum, 0)
+                if obj is None or (crypt_filter is None and not compress):
+                    pending.append((idnum, obj))
+                elif (
+                    pool is not None
+                    and isinstance(obj, StreamObject)
+                    and len(obj._stream_data) >= PARALLEL_WRITE_MIN_SIZE
+                ):
+                    pending.append((idnum, pool.submit(self._prepare_object, obj, compress, crypt_filter)))
+                    running += 1
+                else:
+                    pending.append((idnum, self._prepare_object(obj, compress, crypt_filter)))
+                # Hand out the objects which are ready, and limit the streams held in memory.
+                while pending and (
+                    not isinstance(pending[0][1], Future) or pending[0][1].done() or running > 2 * workers
+                ):
+                    yield next_object()
+            while pending:
+                yield next_object()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def _prepare_object(obj: PdfObject, compress: bool, crypt_filter: Optional[CryptFilter]) -> PdfObject:
+        if compress:
+            obj = cast(StreamObject, obj).flate_encode()
+        if crypt_filter is not None:
+            obj = crypt_filter.encrypt_object(obj)
+        return obj
+
+    def _write_top_level_object(self, stream: ObjectSerializer, idnum: int, obj: PdfObject) -> None:
+        # The object has been prepared by _prepare_objects().
+        stream.write(f"{idnum} 0 obj\n".encode())
+        stream.write_object(obj)
+        stream.write(b"\nendobj\n")
+
     def _write_xref_table(
-        self, stream: StreamType, object_positions: list[int], free_objects: list[int]
+        self, stream: ObjectSerializer, object_positions: list[int], free_objects: list[int]
     ) -> int:
         xref_location = stream.tell()
         stream.write(b"xref\n")
@@ -1556,7 +2123,7 @@ class PdfWriter(PdfDocCommon):
                 free_idx += 1
         return xref_location
 
-    def _write_trailer(self, stream: StreamType, xref_location: int) -> None:
+    def _write_trailer(self, stream: ObjectSerializer, xref_location: int) -> None:
         """
         Write the PDF trailer to the stream.
 
@@ -1577,7 +2144,7 @@ class PdfWriter(PdfDocCommon):
             trailer[NameObject(TK.ID)] = self._ID
         if self._encrypt_entry:
             trailer[NameObject(TK.ENCRYPT)] = self._encrypt_entry.indirect_reference
-        trailer.write_to_stream(stream)
+        stream.write_object(trailer)
         stream.write(f"\nstartxref\n{xref_location}\n%%EOF\n".encode())  # eof
 
     @property
@@ -1628,6 +2195,59 @@ class PdfWriter(PdfDocCommon):
             self._info = DictionaryObject()
         self._info.update(args)
 
+    def compress_content_streams(self, level: int = -1, workers: Optional[int] = None) -> None:
+        """
+        Compress the content streams of all pages and the other uncompressed
+        streams of the document with the FlateDecode filter.
+
+        The content streams of each page are joined as with
+        :meth:`PageObject.compress_content_streams`. As zlib releases the GIL,
+        the streams are compressed in a pool of threads.
+
+        Metadata streams are kept uncompressed, as required by PDF/A.
+
+        Args:
+            level: The compression level, from 0 (no compression) to 9, or -1
+                for the default of zlib.
+            workers: The number of threads. Defaults to the number of CPUs.
+
+        """
+        page_contents = []
+        page_content_ids = set()
+        for page in self.pages:
+            contents = page.raw_get(PG.CONTENTS) if PG.CONTENTS in page else None
+            for reference in contents if isinstance(contents, ArrayObject) else [contents]:
+                if isinstance(reference, IndirectObject):
+                    page_content_ids.add(reference.idnum)
+            content = page.get_contents()
+            if content is not None:
+                page_contents.append((page, content))
+
+        streams = []
+        for idnum, obj in enumerate(self._objects, start=1):
+            if (
+                isinstance(obj, DecodedStreamObject)
+                and idnum not in page_content_ids
+                and "/Filter" not in obj
+                and obj.get("/Type") != "/Metadata"
+            ):
+                # Make sure that the data of content streams is up to date.
+                obj.get_data()
+                streams.append((idnum, obj))
+
+        to_compress = [content for _, content in page_contents] + [stream for _, stream in streams]
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers <= 1 or len(to_compress) <= 1:
+            compressed = [stream.flate_encode(level) for stream in to_compress]
+        else:
+            with ThreadPoolExecutor(min(workers, len(to_compress))) as pool:
+                compressed = list(pool.map(lambda stream: stream.flate_encode(level), to_compress))
+
+        for (page, content), content_obj in zip(page_contents, compressed):
+            page._set_compressed_contents(content, content_obj)
+        for (idnum, _), stream_obj in zip(streams, compressed[len(page_contents):]):
+            self._replace_object(idnum, stream_obj)
+
     _UNSET = object()
 
     def compress_identical_objects(
@@ -2840,6 +3460,9 @@ class PdfWriter(PdfDocCommon):
         if "/B" not in excluded_fields:
             self.add_filtered_articles("", srcpages, reader)
 
+        if self._streaming_output is not None:
+            self.flush()
+
     def _merge__process_named_dests(self, dest: Any, reader: PdfDocCommon, srcpages: dict[int, PageObject]) -> None:
         arr: Any = dest.dest_array
         if "/Names" in self._root_object and dest["/Title"] in cast(
@@ -3178,8 +3801,53 @@ class PdfWriter(PdfDocCommon):
             self._insert_filtered_outline(dest._filtered_children, np, None)
 
     def close(self) -> None:
-        """Implemented for API harmonization."""
-        return
+        """
+        Complete the document of a streaming writer, see :meth:`streaming`.
+
+        The remaining objects, the cross-reference table and the trailer are
+        written, and the output is closed if it has been opened by the writer.
+        For other writers, this is only implemented for API harmonization.
+        """
+        stream = self._streaming_output
+        if stream is None:
+            return
+        if self.page_tree_fanout is not None:
+            self._balance_page_tree()
+        self.flush()
+        assert self._streaming_header is not None, "mypy"
+        if self.pdf_header > self._streaming_header:
+            # The header has been written already.
+            self._root_object[NameObject("/Version")] = NameObject("/" + self.pdf_header[5:])
+
+        object_positions = []
+        free_objects = []
+        serializer = ObjectSerializer(stream)
+        offsets = dict(self._streamed_offsets)
+        remaining = [
+            (idnum, obj)
+            for idnum, obj in enumerate(self._objects, start=1)
+            if obj is not None and idnum not in offsets
+        ]
+        for idnum, obj in self._prepare_objects(remaining):
+            offsets[idnum] = serializer.tell()
+            self._write_top_level_object(serializer, idnum, cast(PdfObject, obj))
+        for idnum in range(1, len(self._objects) + 1):
+            offset = offsets.get(idnum)
+            if offset is None:
+                object_positions.append(-1)
+                free_objects.append(idnum)
+            else:
+                object_positions.append(offset)
+        free_objects.append(0)
+        xref_location = self._write_xref_table(serializer, object_positions, free_objects)
+        self._write_trailer(serializer, xref_location)
+        serializer.flush()
+
+        self._streaming_output = None
+        if self._streaming_own_output:
+            stream.close()
+        else:
+            stream.flush()
 
     def find_outline_item(
         self,
@@ -3354,6 +4022,7 @@ class PdfWriter(PdfDocCommon):
 
         page_labels[NameObject("/Nums")] = nums
         self._root_object[NameObject(CatalogAttributes.PAGE_LABELS)] = page_labels
+        self._page_label_lookup = None
 
     def _repr_mimebundle_(
         self,
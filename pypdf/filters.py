@@ -36,6 +36,7 @@ __author__ = "Mathieu Fenniak"
 __author_email__ = "biziqe@mathieu.fenniak.net"
 
 import binascii
+import importlib.util
 import math
 import os
 import shutil
@@ -43,7 +44,9 @@ import struct
 import subprocess
 import zlib
 from base64 import a85decode
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any, NoReturn, Optional, Union, cast
@@ -72,6 +75,9 @@ from .generic import (
     is_null_or_none,
 )
 
+# numpy is only imported when PNG predictors are decoded.
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
 MAX_DECLARED_STREAM_LENGTH = 75_000_000
 MAX_ARRAY_BASED_STREAM_OUTPUT_LENGTH = 75_000_000
 
@@ -84,9 +90,6 @@ FLATE_MAX_COLUMNS = 250_000
 FLATE_MAX_ROW_LENGTH = 4_000_000
 FLATE_MAX_BUFFER_SIZE = 75_000_000  # TODO: This should be IMAGE_MAX_BUFFER_SIZE.
 
-# Reuse cached 1-byte values in the fallback loop to avoid per-byte allocations.
-_SINGLE_BYTES = tuple(bytes((i,)) for i in range(256))
-
 
 def _decompress_with_limit(data: bytes) -> bytes:
     decompressor = zlib.decompressobj()
@@ -141,32 +144,196 @@ def decompress(data: bytes) -> bytes:
                 pass
 
         # If still failing, then try with increased window size.
-        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
-        result_str = b""
-        remaining_limit = ZLIB_MAX_OUTPUT_LENGTH
-        data_length = len(data)
-        known_errors = set()
-        for index in range(data_length):
-            chunk = _SINGLE_BYTES[data[index]]
+        return _decompress_prefix(data)
+
+
+# Number of bytes fed to the decompressor at once when recovering damaged data.
+_RECOVERY_CHUNK_SIZE = 65536
+
+
+def _decompress_prefix(data: bytes) -> bytes:
+    """
+    Decompress the data up to the first byte zlib cannot process.
+
+    Once zlib has reported an error, it rejects any further input. The result
+    is therefore everything that can be decompressed from the data before the
+    damaged byte. The data is fed in chunks, and a copy of the decompressor is
+    kept before each chunk to locate the damaged byte, or the byte which
+    reaches ``ZLIB_MAX_OUTPUT_LENGTH``, by bisection.
+    """
+    output_limit = ZLIB_MAX_OUTPUT_LENGTH
+    data_length = len(data)
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+    result: list[bytes] = []
+    produced = 0
+
+    def decompress_chunk(checkpoint: Any, chunk: bytes) -> tuple[Any, bytes]:
+        # Process the chunk using a copy of the decompressor, may raise zlib.error.
+        chunk_decompressor = checkpoint.copy()
+        if output_limit:
+            # No need to produce more output than required to reach the limit.
+            return chunk_decompressor, chunk_decompressor.decompress(chunk, output_limit - produced)
+        return chunk_decompressor, chunk_decompressor.decompress(chunk)
+
+    def first_failure(checkpoint: Any, chunk: bytes) -> int:
+        # The length of the shortest prefix of the chunk failing to decompress
+        # or reaching the output limit.
+        low, high = 1, len(chunk)
+        while low < high:
+            middle = (low + high) // 2
             try:
-                decompressed = decompressor.decompress(chunk, max_length=remaining_limit)
-                result_str += decompressed
-                remaining_limit -= len(decompressed)
-                if remaining_limit <= 0:
-                    raise LimitReachedError(
-                        f"Limit reached while decompressing. {data_length - index} bytes remaining."
-                    )
-            except zlib.error as error:
-                if index > ZLIB_MAX_RECOVERY_INPUT_LENGTH:
-                    raise LimitReachedError(
-                        f"Recovery limit reached while decompressing. {data_length - index} bytes remaining."
-                    )
-                error_str = str(error)
-                if error_str in known_errors:
-                    continue
-                logger_warning(error_str, source=__name__)
-                known_errors.add(error_str)
-        return result_str
+                _, output = decompress_chunk(checkpoint, chunk[:middle])
+                failed = bool(output_limit) and produced + len(output) >= output_limit
+            except zlib.error:
+                failed = True
+            if failed:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    for position in range(0, data_length, _RECOVERY_CHUNK_SIZE):
+        chunk = data[position : position + _RECOVERY_CHUNK_SIZE]
+        try:
+            chunk_decompressor, output = decompress_chunk(decompressor, chunk)
+            if not output_limit or produced + len(output) < output_limit:
+                result.append(output)
+                produced += len(output)
+                decompressor = chunk_decompressor
+                continue
+        except zlib.error:
+            pass
+
+        failure_length = first_failure(decompressor, chunk)
+        index = position + failure_length - 1
+        try:
+            decompress_chunk(decompressor, chunk[:failure_length])
+        except zlib.error as error:
+            result.append(decompress_chunk(decompressor, chunk[: failure_length - 1])[1])
+            # Any further input fails with the same error.
+            if index <= ZLIB_MAX_RECOVERY_INPUT_LENGTH:
+                logger_warning(str(error), source=__name__)
+            if data_length - 1 > ZLIB_MAX_RECOVERY_INPUT_LENGTH:
+                index = max(index, ZLIB_MAX_RECOVERY_INPUT_LENGTH + 1)
+                raise LimitReachedError(
+                    f"Recovery limit reached while decompressing. {data_length - index} bytes remaining."
+                )
+            break
+        raise LimitReachedError(f"Limit reached while decompressing. {data_length - index} bytes remaining.")
+    return b"".join(result)
+
+
+def _iter_decompress(chunks: Iterable[bytes], chunk_size: int) -> Iterator[bytes]:
+    """
+    Decompress zlib data given in chunks, without keeping the decompressed data in memory.
+
+    The limit ``pypdf.filters.ZLIB_MAX_OUTPUT_LENGTH`` applies to the number of
+    bytes produced so far. Damaged data is handed to :func:`decompress`, which
+    tries to recover as much as possible from it.
+
+    Args:
+        chunks: The compressed data.
+        chunk_size: The maximum length of the decompressed chunks.
+
+    Yields:
+        The decompressed data.
+
+    """
+    decompressor = zlib.decompressobj()
+    consumed: list[bytes] = []
+    produced = 0
+    chunks = iter(chunks)
+    try:
+        for chunk in chunks:
+            consumed.append(chunk)
+            data = chunk
+            while not decompressor.eof:
+                output = decompressor.decompress(data, chunk_size)
+                data = decompressor.unconsumed_tail
+                if output:
+                    produced += len(output)
+                    if ZLIB_MAX_OUTPUT_LENGTH and produced > ZLIB_MAX_OUTPUT_LENGTH:
+                        raise LimitReachedError(
+                            f"Limit reached while decompressing. {len(data)} bytes remaining."
+                        )
+                    yield output
+                elif not data:
+                    break  # more input required
+            if decompressor.eof:
+                return
+        output = decompressor.flush()
+    except zlib.error:
+        output = decompress(b"".join(consumed) + b"".join(chunks))[produced:]
+        for start in range(0, len(output), chunk_size):
+            yield output[start : start + chunk_size]
+        return
+    produced += len(output)
+    if ZLIB_MAX_OUTPUT_LENGTH and produced > ZLIB_MAX_OUTPUT_LENGTH:
+        raise LimitReachedError("Limit reached while decompressing. 0 bytes remaining.")
+    if output:
+        yield output
+
+
+# Low byte of an integer, to apply to all the values of an iterable at C speed.
+_LOW_BYTE = (255).__and__
+
+
+def _png_sub(row_data: Union[bytes, memoryview], bpp: int) -> bytes:
+    """Undo the PNG Sub filter: each byte is a running sum of the bytes bpp apart."""
+    output = bytearray(len(row_data))
+    for offset in range(min(bpp, len(row_data))):
+        output[offset::bpp] = bytes(map(_LOW_BYTE, accumulate(row_data[offset::bpp])))
+    return bytes(output)
+
+
+def _png_up(row_data: Union[bytes, memoryview], previous_row_data: Union[bytes, memoryview]) -> bytes:
+    """Undo the PNG Up filter by adding all the bytes of the rows at once."""
+    length = len(row_data)
+    a = int.from_bytes(row_data, "big")
+    b = int.from_bytes(previous_row_data, "big")
+    # Add the low 7 bits of every byte without carry into the next byte,
+    # then fix the high bit of every byte.
+    low_bits = int.from_bytes(b"\x7f" * length, "big")
+    result = ((a & low_bits) + (b & low_bits)) ^ ((a ^ b) & ~low_bits)
+    return result.to_bytes(length, "big")
+
+
+def _png_average(row_data: Union[bytes, memoryview], previous_row_data: Union[bytes, memoryview], bpp: int) -> bytes:
+    """Undo the PNG Average filter."""
+    output = bytearray(row_data)
+    for i in range(min(bpp, len(output))):
+        output[i] = (output[i] + (previous_row_data[i] >> 1)) & 0xFF
+    for i in range(bpp, len(output)):
+        output[i] = (output[i] + ((output[i - bpp] + previous_row_data[i]) >> 1)) & 0xFF
+    return bytes(output)
+
+
+def _png_paeth(row_data: Union[bytes, memoryview], previous_row_data: Union[bytes, memoryview], bpp: int) -> bytes:
+    """Undo the PNG Paeth filter."""
+    if not any(previous_row_data):
+        # Without a row above, the Paeth predictor always selects the left byte.
+        return _png_sub(row_data, bpp)
+    output = bytearray(_png_up(row_data[:bpp], previous_row_data[:bpp]))
+    output += row_data[bpp:]
+    for i in range(bpp, len(output)):
+        left = output[i - bpp]
+        up = previous_row_data[i]
+        up_left = previous_row_data[i - bpp]
+
+        p = left + up - up_left
+        dist_left = abs(p - left)
+        dist_up = abs(p - up)
+        dist_up_left = abs(p - up_left)
+
+        if dist_left <= dist_up and dist_left <= dist_up_left:
+            paeth = left
+        elif dist_up <= dist_up_left:
+            paeth = up
+        else:
+            paeth = up_left
+
+        output[i] = (output[i] + paeth) & 0xFF
+    return bytes(output)
 
 
 class FlateDecode:
@@ -192,33 +359,13 @@ class FlateDecode:
         """
         str_data = decompress(data)
 
-        processed_parms: Optional[PdfObject] = decode_parms
-        if isinstance(decode_parms, IndirectObject) and processed_parms is not None:
-            processed_parms = processed_parms.get_object()
-        if isinstance(processed_parms, dict):
-            parameters = processed_parms
-        else:
-            if not is_null_or_none(processed_parms):
-                logger_warning(
-                    "Detected invalid /DecodeParms, results might be incorrect: %(value)s (type %(type_name)s)",
-                    source=__name__, value=decode_parms, type_name=decode_parms.__class__.__name__,
-                )
-            parameters = DictionaryObject()
-
+        parameters = FlateDecode._get_decode_parameters(decode_parms)
         predictor = parameters.get("/Predictor", 1)
 
         # predictor 1 == no predictor
         if predictor != 1:
             columns, colors, bits_per_component = FlateDecode._get_parameters(parameters)
-
-            # PNG predictor can vary by row and so is the lead byte on each row
-            row_length = (
-                math.ceil(columns * colors * bits_per_component / 8) + 1
-            )  # number of bytes
-            if row_length > FLATE_MAX_ROW_LENGTH:
-                raise LimitReachedError(
-                    f"Row length of {row_length} exceeds defined limit of {FLATE_MAX_ROW_LENGTH}."
-                )
+            row_length = FlateDecode._get_row_length(columns, colors, bits_per_component)
 
             # TIFF prediction:
             if predictor == 2:
@@ -238,6 +385,54 @@ class FlateDecode:
                 raise PdfReadError(f"Unsupported flatedecode predictor {predictor!r}")
         return str_data
 
+    @staticmethod
+    def _iter_decode(
+        chunks: Iterable[bytes],
+        decode_parms: Optional[Union[DictionaryObject, IndirectObject]],
+        chunk_size: int,
+    ) -> Iterator[bytes]:
+        """Decode flate-encoded data given in chunks, see :func:`iter_decode_stream_data`."""
+        parameters = FlateDecode._get_decode_parameters(decode_parms)
+        predictor = parameters.get("/Predictor", 1)
+        if predictor == 1:
+            yield from _iter_decompress(chunks, chunk_size)
+        elif isinstance(predictor, int) and 10 <= predictor <= 15:
+            columns, colors, bits_per_component = FlateDecode._get_parameters(parameters)
+            row_length = FlateDecode._get_row_length(columns, colors, bits_per_component)
+            yield from FlateDecode._iter_decode_png_prediction(
+                _iter_decompress(chunks, chunk_size), columns, row_length
+            )
+        else:
+            yield FlateDecode.decode(b"".join(chunks), decode_parms)
+
+    @staticmethod
+    def _get_decode_parameters(
+        decode_parms: Optional[Union[DictionaryObject, IndirectObject]],
+    ) -> DictionaryObject:
+        processed_parms: Optional[PdfObject] = decode_parms
+        if isinstance(decode_parms, IndirectObject) and processed_parms is not None:
+            processed_parms = processed_parms.get_object()
+        if isinstance(processed_parms, dict):
+            return cast(DictionaryObject, processed_parms)
+        if not is_null_or_none(processed_parms):
+            logger_warning(
+                "Detected invalid /DecodeParms, results might be incorrect: %(value)s (type %(type_name)s)",
+                source=__name__, value=decode_parms, type_name=decode_parms.__class__.__name__,
+            )
+        return DictionaryObject()
+
+    @staticmethod
+    def _get_row_length(columns: int, colors: int, bits_per_component: int) -> int:
+        # PNG predictor can vary by row and so is the lead byte on each row
+        row_length = (
+            math.ceil(columns * colors * bits_per_component / 8) + 1
+        )  # number of bytes
+        if row_length > FLATE_MAX_ROW_LENGTH:
+            raise LimitReachedError(
+                f"Row length of {row_length} exceeds defined limit of {FLATE_MAX_ROW_LENGTH}."
+            )
+        return row_length
+
     @staticmethod
     def _get_parameters(parameters: DictionaryObject) -> tuple[int, int, int]:
         # For details, see table 8 of ISO 32000-2:2020.
@@ -271,67 +466,118 @@ class FlateDecode:
             logger_warning("Image data is not rectangular. Adding padding.", source=__name__)
             data += b"\x00" * (row_length - remainder)
             assert len(data) % row_length == 0
+        # recomputed locally to not change params; at least one byte as for PNG images
+        bpp = max(1, (row_length - 1) // columns)
+        if HAS_NUMPY:
+            return FlateDecode._decode_png_prediction_numpy(data, row_length, bpp)
+        return FlateDecode._decode_png_prediction_python(data, row_length, bpp)
+
+    @staticmethod
+    def _iter_decode_png_prediction(chunks: Iterable[bytes], columns: int, row_length: int) -> Iterator[bytes]:
+        # Blocks of complete rows are decoded after the last decoded row,
+        # added as an unfiltered row to provide the row above their first row.
+        pending = b""
+        previous_row = b""
+        for chunk in chunks:
+            pending += chunk
+            usable = len(pending) - len(pending) % row_length
+            if usable:
+                block = previous_row + pending[:usable]
+                pending = pending[usable:]
+                decoded = FlateDecode._decode_png_prediction(block, columns, row_length)
+                yield decoded[len(previous_row) - 1 :] if previous_row else decoded
+                previous_row = b"\x00" + decoded[-(row_length - 1) :]
+        if pending:
+            # The incomplete last row is padded.
+            decoded = FlateDecode._decode_png_prediction(previous_row + pending, columns, row_length)
+            yield decoded[len(previous_row) - 1 :] if previous_row else decoded
+
+    @staticmethod
+    def _decode_png_prediction_python(data: bytes, row_length: int, bpp: int) -> bytes:
         output = bytearray()
-        previous_row_data = bytes(row_length)
-        bpp = (row_length - 1) // columns  # recomputed locally to not change params
+        view = memoryview(data)
+        previous_row_data: Union[bytes, memoryview] = bytes(row_length - 1)
         for row in range(0, len(data), row_length):
-            row_data = bytearray(data[row : row + row_length])
-            filter_byte = row_data[0]
+            filter_byte = data[row]
+            row_data: Union[bytes, memoryview] = view[row + 1 : row + row_length]
 
             if filter_byte == 0:
                 # PNG None Predictor
                 pass
             elif filter_byte == 1:
                 # PNG Sub Predictor
-                for i in range(bpp + 1, row_length):
-                    row_data[i] = (row_data[i] + row_data[i - bpp]) % 256
+                row_data = _png_sub(row_data, bpp)
             elif filter_byte == 2:
                 # PNG Up Predictor
-                for i in range(1, row_length):
-                    row_data[i] = (row_data[i] + previous_row_data[i]) % 256
+                row_data = _png_up(row_data, previous_row_data)
             elif filter_byte == 3:
                 # PNG Average Predictor
-                for i in range(1, bpp + 1):
-                    floor = previous_row_data[i] // 2
-                    row_data[i] = (row_data[i] + floor) % 256
-                for i in range(bpp + 1, row_length):
-                    left = row_data[i - bpp]
-                    floor = (left + previous_row_data[i]) // 2
-                    row_data[i] = (row_data[i] + floor) % 256
+                row_data = _png_average(row_data, previous_row_data, bpp)
             elif filter_byte == 4:
                 # PNG Paeth Predictor
-                for i in range(1, bpp + 1):
-                    row_data[i] = (row_data[i] + previous_row_data[i]) % 256
-                for i in range(bpp + 1, row_length):
-                    left = row_data[i - bpp]
-                    up = previous_row_data[i]
-                    up_left = previous_row_data[i - bpp]
-
-                    p = left + up - up_left
-                    dist_left = abs(p - left)
-                    dist_up = abs(p - up)
-                    dist_up_left = abs(p - up_left)
-
-                    if dist_left <= dist_up and dist_left <= dist_up_left:
-                        paeth = left
-                    elif dist_up <= dist_up_left:
-                        paeth = up
-                    else:
-                        paeth = up_left
-
-                    row_data[i] = (row_data[i] + paeth) % 256
+                row_data = _png_paeth(row_data, previous_row_data, bpp)
             else:
                 raise PdfReadError(
                     f"Unsupported PNG filter {filter_byte!r}"
                 )  # pragma: no cover
-            previous_row_data = bytes(row_data)
-            output += row_data[1:]
+            previous_row_data = row_data
+            output += row_data
         return bytes(output)
 
+    @staticmethod
+    def _decode_png_prediction_numpy(data: bytes, row_length: int, bpp: int) -> bytes:
+        import numpy as np  # noqa: PLC0415
+
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, row_length)
+        filter_bytes = rows[:, 0]
+        output = rows[:, 1:].copy()
+        width = row_length - 1
+        # Whole images using a single predictor are decoded at once.
+        # The additions wrap around modulo 256 with unsigned bytes.
+        if (filter_bytes == 2).all():
+            np.cumsum(output, axis=0, dtype=np.uint8, out=output)
+        elif (filter_bytes == 1).all() and width % bpp == 0:
+            pixels = output.reshape(len(output), -1, bpp)
+            np.cumsum(pixels, axis=1, dtype=np.uint8, out=pixels)
+        else:
+            FlateDecode._decode_png_rows_numpy(output, filter_bytes.tolist(), bpp)
+        decoded: bytes = output.tobytes()
+        return decoded
+
+    @staticmethod
+    def _decode_png_rows_numpy(output: Any, filter_bytes: list[int], bpp: int) -> None:
+        import numpy as np  # noqa: PLC0415
+
+        width = output.shape[1]
+        previous_row_data = np.zeros(width, dtype=np.uint8)
+        for index, filter_byte in enumerate(filter_bytes):
+            row_data = output[index]
+            if filter_byte == 0:
+                # PNG None Predictor
+                pass
+            elif filter_byte == 1:
+                # PNG Sub Predictor
+                for offset in range(min(bpp, width)):
+                    row_data[offset::bpp] = np.cumsum(row_data[offset::bpp], dtype=np.uint8)
+            elif filter_byte == 2:
+                # PNG Up Predictor
+                row_data += previous_row_data
+            elif filter_byte in (3, 4):
+                # PNG Average and Paeth Predictors depend on the decoded left neighbour
+                predictor = _png_average if filter_byte == 3 else _png_paeth
+                row_data[:] = np.frombuffer(
+                    predictor(row_data.tobytes(), previous_row_data.tobytes(), bpp), dtype=np.uint8
+                )
+            else:
+                raise PdfReadError(
+                    f"Unsupported PNG filter {filter_byte!r}"
+                )  # pragma: no cover
+            previous_row_data = row_data
+
     @staticmethod
     def encode(data: bytes, level: int = -1) -> bytes:
         """
-        Compress the input data using zlib.
+        Compress the input data using zlib, or the encoder registered for ``/FlateDecode``.
 
         Args:
             data: The data to be compressed.
@@ -341,7 +587,11 @@ class FlateDecode:
             The compressed data.
 
         """
-        return zlib.compress(data, level)
+        encoder: Optional[FilterEncoder] = _get_backend(_FILTER_ENCODERS, FT.FLATE_DECODE)
+        if encoder is None:
+            # All encoders, including the built-in one, have been unregistered.
+            return zlib.compress(data, level)
+        return encoder(data, level)
 
 
 class ASCIIHexDecode:
@@ -809,23 +1059,160 @@ def _deprecate_inline_image_filters(filter_name: str, old_name: str, new_name: s
     )
 
 
-def decode_stream_data(stream: StreamObject) -> bytes:
+FilterDecoder = Callable[[bytes, DictionaryObject, StreamObject], bytes]
+"""Decode the data of a stream, given the /DecodeParms of the filter and the stream itself."""
+
+FilterEncoder = Callable[[bytes, int], bytes]
+"""Encode data, given the compression level if the filter supports it."""
+
+# Backends by filter name, the preferred one first.
+_FILTER_DECODERS: dict[str, list[tuple[int, FilterDecoder]]] = {}
+_FILTER_ENCODERS: dict[str, list[tuple[int, FilterEncoder]]] = {}
+
+_FILTER_ABBREVIATIONS = {
+    FTA.AHx: FT.ASCII_HEX_DECODE,
+    FTA.A85: FT.ASCII_85_DECODE,
+    FTA.LZW: FT.LZW_DECODE,
+    FTA.FL: FT.FLATE_DECODE,
+    FTA.RL: FT.RUN_LENGTH_DECODE,
+    FTA.CCF: FT.CCITT_FAX_DECODE,
+    FTA.DCT: FT.DCT_DECODE,
+}
+
+
+def _add_backend(backends: list[tuple[int, Any]], backend: Any, priority: int) -> None:
+    # Among backends of the same priority, the one registered last is preferred.
+    index = 0
+    while index < len(backends) and backends[index][0] > priority:
+        index += 1
+    backends.insert(index, (priority, backend))
+
+
+def _remove_backend(backends: list[tuple[int, Any]], backend: Any) -> list[tuple[int, Any]]:
+    return [entry for entry in backends if entry[1] is not backend]
+
+
+def register_filter(
+    name: str,
+    decoder: Optional[FilterDecoder] = None,
+    encoder: Optional[FilterEncoder] = None,
+    *,
+    priority: int = 0,
+) -> None:
     """
-    Decode the stream data based on the specified filters.
+    Register a decoder and/or an encoder for a stream filter.
 
-    This function decodes the stream data using the filters provided in the
-    stream.
+    This allows to decode streams using filters pypdf does not support, or to
+    use another implementation for a supported one, like a faster deflate
+    implementation for ``/FlateDecode``.
+
+    Several backends can be registered for the same filter, and the one with
+    the highest priority is used. Among backends with the same priority, the
+    one registered last is used. The built-in backends have priority 0.
 
     Args:
-        stream: The input stream object containing the data and filters.
+        name: The name of the filter, e.g. ``"/FlateDecode"``.
+        decoder: Called with the encoded data, the ``/DecodeParms`` of the
+            filter and the stream, returns the decoded data.
+        encoder: Called with the data and the compression level (-1 for the
+            default level), returns the encoded data.
+        priority: The priority of the backends.
 
-    Returns:
-        The decoded stream data.
+    """
+    if decoder is None and encoder is None:
+        raise ValueError("Either a decoder or an encoder is required")
+    name = _FILTER_ABBREVIATIONS.get(name, name)
+    if decoder is not None:
+        _add_backend(_FILTER_DECODERS.setdefault(name, []), decoder, priority)
+    if encoder is not None:
+        _add_backend(_FILTER_ENCODERS.setdefault(name, []), encoder, priority)
+
+
+def unregister_filter(
+    name: str,
+    decoder: Optional[FilterDecoder] = None,
+    encoder: Optional[FilterEncoder] = None,
+) -> None:
+    """
+    Remove backends registered with :func:`register_filter`.
 
-    Raises:
-        NotImplementedError: If an unsupported filter type is encountered.
+    Args:
+        name: The name of the filter.
+        decoder: The decoder to remove.
+        encoder: The encoder to remove.
 
     """
+    name = _FILTER_ABBREVIATIONS.get(name, name)
+    if decoder is not None:
+        _FILTER_DECODERS[name] = _remove_backend(_FILTER_DECODERS.get(name, []), decoder)
+    if encoder is not None:
+        _FILTER_ENCODERS[name] = _remove_backend(_FILTER_ENCODERS.get(name, []), encoder)
+
+
+def _get_backend(registry: dict[str, list[tuple[int, Any]]], name: Any) -> Any:
+    if not isinstance(name, str) or not registry.get(name):
+        return None
+    return registry[name][0][1]
+
+
+def _decode_crypt(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    if "/Name" in decode_parms or "/Type" in decode_parms:
+        raise NotImplementedError(
+            "/Crypt filter with /Name or /Type not supported yet"
+        )
+    return data
+
+
+def _decode_ascii_hex(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    return ASCIIHexDecode.decode(data)
+
+
+def _decode_ascii_85(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    return ASCII85Decode.decode(data)
+
+
+def _decode_lzw(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    return LZWDecode.decode(data, decode_parms)
+
+
+def _decode_flate(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    # Known by iter_decode_stream_data, which decodes /FlateDecode incrementally
+    return FlateDecode.decode(data, decode_parms)
+
+
+def _decode_run_length(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    return RunLengthDecode.decode(data)
+
+
+def _decode_ccitt_fax(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    return CCITTFaxDecode.decode(data, decode_parms, stream.get(ImageAttributes.HEIGHT, ()))
+
+
+def _decode_dct(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    return DCTDecode.decode(data)
+
+
+def _decode_jpx(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    return JPXDecode.decode(data)
+
+
+def _decode_jbig2(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+    return JBIG2Decode.decode(data, decode_parms)
+
+
+register_filter(FT.ASCII_HEX_DECODE, _decode_ascii_hex)
+register_filter(FT.ASCII_85_DECODE, _decode_ascii_85)
+register_filter(FT.LZW_DECODE, _decode_lzw)
+register_filter(FT.FLATE_DECODE, _decode_flate, zlib.compress)
+register_filter(FT.RUN_LENGTH_DECODE, _decode_run_length)
+register_filter(FT.CCITT_FAX_DECODE, _decode_ccitt_fax)
+register_filter(FT.DCT_DECODE, _decode_dct)
+register_filter(FT.JPX_DECODE, _decode_jpx)
+register_filter(FT.JBIG2_DECODE, _decode_jbig2)
+register_filter("/Crypt", _decode_crypt)
+
+
+def _get_filters_and_decode_parms(stream: StreamObject) -> tuple[Sequence[Any], Sequence[Any]]:
     filters = stream.get(StreamAttributes.FILTER, ())
     if isinstance(filters, IndirectObject):
         filters = cast(ArrayObject, filters.get_object())
@@ -835,6 +1222,27 @@ def decode_stream_data(stream: StreamObject) -> bytes:
     decode_parms = stream.get(StreamAttributes.DECODE_PARMS, (DictionaryObject(),) * len(filters))
     if not isinstance(decode_parms, (list, tuple)):
         decode_parms = (decode_parms,)
+    return filters, decode_parms
+
+
+def decode_stream_data(stream: StreamObject) -> bytes:
+    """
+    Decode the stream data based on the specified filters.
+
+    This function decodes the stream data using the filters provided in the
+    stream.
+
+    Args:
+        stream: The input stream object containing the data and filters.
+
+    Returns:
+        The decoded stream data.
+
+    Raises:
+        NotImplementedError: If an unsupported filter type is encountered.
+
+    """
+    filters, decode_parms = _get_filters_and_decode_parms(stream)
     data: bytes = stream._data
     # If there is no data to decode, we should not try to decode it.
     if not data:
@@ -844,37 +1252,60 @@ def decode_stream_data(stream: StreamObject) -> bytes:
             # The decoders are typed for a DictionaryObject; a plain {} is not
             # one, so a null /DecodeParms entry would hand them the wrong type.
             params = DictionaryObject()
-        if filter_name in (FT.ASCII_HEX_DECODE, FTA.AHx):
-            _deprecate_inline_image_filters(filter_name=filter_name, old_name=FTA.AHx, new_name=FT.ASCII_HEX_DECODE)
-            data = ASCIIHexDecode.decode(data)
-        elif filter_name in (FT.ASCII_85_DECODE, FTA.A85):
-            _deprecate_inline_image_filters(filter_name=filter_name, old_name=FTA.A85, new_name=FT.ASCII_85_DECODE)
-            data = ASCII85Decode.decode(data)
-        elif filter_name in (FT.LZW_DECODE, FTA.LZW):
-            _deprecate_inline_image_filters(filter_name=filter_name, old_name=FTA.LZW, new_name=FT.LZW_DECODE)
-            data = LZWDecode.decode(data, params)
-        elif filter_name in (FT.FLATE_DECODE, FTA.FL):
-            _deprecate_inline_image_filters(filter_name=filter_name, old_name=FTA.FL, new_name=FT.FLATE_DECODE)
-            data = FlateDecode.decode(data, params)
-        elif filter_name in (FT.RUN_LENGTH_DECODE, FTA.RL):
-            _deprecate_inline_image_filters(filter_name=filter_name, old_name=FTA.RL, new_name=FT.RUN_LENGTH_DECODE)
-            data = RunLengthDecode.decode(data)
-        elif filter_name in (FT.CCITT_FAX_DECODE, FTA.CCF):
-            _deprecate_inline_image_filters(filter_name=filter_name, old_name=FTA.CCF, new_name=FT.CCITT_FAX_DECODE)
-            height = stream.get(ImageAttributes.HEIGHT, ())
-            data = CCITTFaxDecode.decode(data, params, height)
-        elif filter_name in (FT.DCT_DECODE, FTA.DCT):
-            _deprecate_inline_image_filters(filter_name=filter_name, old_name=FTA.DCT, new_name=FT.DCT_DECODE)
-            data = DCTDecode.decode(data)
-        elif filter_name == FT.JPX_DECODE:
-            data = JPXDecode.decode(data)
-        elif filter_name == FT.JBIG2_DECODE:
-            data = JBIG2Decode.decode(data, params)
-        elif filter_name == "/Crypt":
-            if "/Name" in params or "/Type" in params:
-                raise NotImplementedError(
-                    "/Crypt filter with /Name or /Type not supported yet"
-                )
-        else:
+        if isinstance(filter_name, str) and filter_name in _FILTER_ABBREVIATIONS:
+            new_name = _FILTER_ABBREVIATIONS[filter_name]
+            _deprecate_inline_image_filters(filter_name=filter_name, old_name=filter_name, new_name=new_name)
+            filter_name = new_name
+        decoder = _get_backend(_FILTER_DECODERS, filter_name)
+        if decoder is None:
             raise NotImplementedError(f"Unsupported filter {filter_name}")
+        data = decoder(data, params, stream)
     return data
+
+
+def iter_decode_stream_data(stream: StreamObject, chunk_size: int = 65536) -> Iterator[bytes]:
+    """
+    Decode the stream data based on the specified filters, chunk by chunk.
+
+    The ``/FlateDecode`` filter is applied incrementally, so the decoded data
+    does not need to fit into memory at once, and the limit
+    ``pypdf.filters.ZLIB_MAX_OUTPUT_LENGTH`` applies to the bytes produced so far.
+    All other filters, as well as the TIFF predictor, decode their complete
+    input at once.
+
+    Args:
+        stream: The input stream object containing the data and filters.
+        chunk_size: The maximum number of decompressed bytes to produce at once.
+
+    Yields:
+        The decoded stream data.
+
+    Raises:
+        NotImplementedError: If an unsupported filter type is encountered.
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+    filters, decode_parms = _get_filters_and_decode_parms(stream)
+    data: bytes = stream._data
+    # If there is no data to decode, we should not try to decode it.
+    if not data:
+        return
+    chunks: Iterable[bytes] = (data,)
+    for filter_name, params in zip(filters, decode_parms):
+        if isinstance(params, NullObject):
+            params = DictionaryObject()
+        if isinstance(filter_name, str) and filter_name in _FILTER_ABBREVIATIONS:
+            new_name = _FILTER_ABBREVIATIONS[filter_name]
+            _deprecate_inline_image_filters(filter_name=filter_name, old_name=filter_name, new_name=new_name)
+            filter_name = new_name
+        decoder = _get_backend(_FILTER_DECODERS, filter_name)
+        if decoder is None:
+            raise NotImplementedError(f"Unsupported filter {filter_name}")
+        if decoder is _decode_flate:
+            chunks = FlateDecode._iter_decode(chunks, params, chunk_size)
+        else:
+            chunks = (decoder(b"".join(chunks), params, stream),)
+    for chunk in chunks:
+        for start in range(0, len(chunk), chunk_size):
+            yield chunk[start : start + chunk_size]
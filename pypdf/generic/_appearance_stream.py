@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from .._codecs import encoding_dict_from_named_encoding
 from .._codecs.core_font_metrics import CORE_FONT_METRICS
-from .._font import Font
+from .._font import Font, get_cached_font
 from .._page import Transformation
 from .._utils import is_char_rtl, logger_warning
 from ..constants import AnnotationDictionaryAttributes, BorderStyles, FieldDictionaryAttributes, PageAttributes
@@ -534,7 +534,7 @@ class TextStreamAppearance(BaseStreamAppearance):
         acro_form_font_resources = acro_form_resources.get("/Font", DictionaryObject())
         font_resource = acro_form_font_resources.get(font_name, None)
         if font_resource:
-            font = Font.from_font_resource(font_resource)
+            font = get_cached_font(font_resource)
         else:
             # Normally, we should have found a font resource by now. However, when a user has provided a specific
             # font name, we may not have found the associated font resource among the AcroForm resources. Also, in
@@ -580,7 +580,8 @@ class TextStreamAppearance(BaseStreamAppearance):
                     encodable = test_font.can_encode(text)
                     if encodable:
                         font = test_font
-                        font.character_widths.clear()
+                        # Do not modify the widths of the (possibly cached) original font.
+                        font.character_widths = {}
                         for code, character in test_font.encoding.items():
                             # Look up the width using the glyph name from the encoding
                             if character in core_font_metrics.character_widths:
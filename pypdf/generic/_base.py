@@ -56,6 +56,7 @@ from .._utils import (
     read_until_regex,
 )
 from ..errors import STREAM_TRUNCATED_PREMATURELY, PdfReadError, PdfStreamError
+from ._lexer import BufferLexer
 
 __author__ = "Mathieu Fenniak"
 __author_email__ = "biziqe@mathieu.fenniak.net"
@@ -65,6 +66,14 @@ class PdfObject(PdfObjectProtocol):
     # function for calculating a hash value
     hash_func: Callable[..., "hashlib._Hash"] = hashlib.sha1
     indirect_reference: Optional["IndirectObject"]
+    # Set by an incremental PdfWriter on the containers belonging to an object of
+    # the original document: the modified object numbers, and the number to add.
+    _modification_tracker: Optional[tuple[set[int], int]] = None
+
+    def _mark_modified(self) -> None:
+        tracker = self._modification_tracker
+        if tracker is not None:
+            tracker[0].add(tracker[1])
 
     def hash_bin(self) -> int:
         """
@@ -187,7 +196,10 @@ class PdfObject(PdfObjectProtocol):
                     pdf_dest._id_translated[id(ind.pdf)][ind.idnum]
                 )
                 assert isinstance(obj, PdfObject), "mypy"
-                return obj
+                # A streaming writer only keeps a null placeholder for the
+                # objects it has already written: clone them again instead.
+                if not isinstance(obj, NullObject) or isinstance(clone, NullObject):
+                    return obj
             pdf_dest._id_translated[id(ind.pdf)][ind.idnum] = i
         try:
             pdf_dest._objects[i - 1] = clone
@@ -600,6 +612,13 @@ class NumberObject(int, PdfObject):
             return FloatObject(num)
         return NumberObject(num)
 
+    @staticmethod
+    def _read_from_lexer(lexer: BufferLexer) -> Union["NumberObject", "FloatObject"]:
+        num = lexer.read_until_regex(NumberObject.NumberPattern, NumberObject._LENGTH_LIMIT)
+        if b"." in num:
+            return FloatObject(num)
+        return NumberObject(num)
+
 
 class ByteStringObject(bytes, PdfObject):
     """
@@ -910,10 +929,23 @@ class NameObject(str, PdfObject):  # noqa: SLOT000
         if name != NameObject.prefix:
             raise PdfReadError("Name read error")
         name += read_until_regex(stream=stream, regex=NameObject.delimiter_pattern, length=NameObject._LENGTH_LIMIT)
+        return NameObject._decode_name(name, pdf)
+
+    @staticmethod
+    def _read_from_lexer(lexer: BufferLexer, pdf: Any) -> "NameObject":  # PdfReader
+        name = lexer.read(1)
+        if name != NameObject.prefix:
+            raise PdfReadError("Name read error")
+        name += lexer.read_until_regex(NameObject.delimiter_pattern, NameObject._LENGTH_LIMIT)
+        return NameObject._decode_name(name, pdf)
+
+    @staticmethod
+    def _decode_name(name: bytes, pdf: Any) -> "NameObject":  # PdfReader
         try:
             # Name objects should represent irregular characters
             # with a '#' followed by the symbol's hex number
-            name = NameObject.unnumber(name)
+            if b"#" in name:
+                name = NameObject.unnumber(name)
             for enc in NameObject.CHARSETS:
                 try:
                     ret = name.decode(enc)
@@ -29,17 +29,20 @@
 __author__ = "Mathieu Fenniak"
 __author_email__ = "biziqe@mathieu.fenniak.net"
 
+import binascii
 import logging
 import os
 import re
 import sys
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from io import BytesIO
 from math import ceil
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Optional,
+    SupportsIndex,
     Union,
     cast,
 )
@@ -48,6 +51,7 @@ from .._protocols import PdfReaderProtocol, PdfWriterProtocol, XmpInformationPro
 from .._utils import (
     WHITESPACES,
     BinaryStreamType,
+    MemoryMappedStream,
     StreamType,
     deprecation_no_replacement,
     logger_warning,
@@ -86,13 +90,17 @@ from ._image_inline import (
     extract_inline__run_length_decode,
     extract_inline_default,
 )
-from ._utils import read_hex_string_from_stream, read_string_from_stream
+from ._lexer import BufferLexer
+from ._utils import create_string_object, read_hex_string_from_stream, read_string_from_stream
 
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
     from typing_extensions import Self
 
+if TYPE_CHECKING:
+    from .._crypt_providers._base import CryptBase
+
 logger = logging.getLogger(__name__)
 
 IndirectPattern = re.compile(rb"[+-]?(\d+)\s+(\d+)\s+R[^a-zA-Z]")
@@ -227,6 +235,54 @@ class ArrayObject(list[Any], PdfObject):
                 pass
         return self
 
+    # The list methods modifying the array are overridden to report the
+    # modification when writing incrementally, see PdfObject._mark_modified().
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if not (isinstance(index, int) and -len(self) <= index < len(self) and list.__getitem__(self, index) is value):
+            self._mark_modified()
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self._mark_modified()
+        list.__delitem__(self, index)
+
+    def __imul__(self, value: SupportsIndex, /) -> Self:
+        self._mark_modified()
+        return list.__imul__(self, value)
+
+    def append(self, value: Any) -> None:
+        self._mark_modified()
+        list.append(self, value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self._mark_modified()
+        list.extend(self, values)
+
+    def insert(self, index: SupportsIndex, value: Any) -> None:
+        self._mark_modified()
+        list.insert(self, index, value)
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        self._mark_modified()
+        return list.pop(self, index)
+
+    def remove(self, value: Any) -> None:
+        self._mark_modified()
+        list.remove(self, value)
+
+    def clear(self) -> None:
+        self._mark_modified()
+        list.clear(self)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._mark_modified()
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self) -> None:
+        self._mark_modified()
+        list.reverse(self)
+
     def write_to_stream(
         self, stream: StreamType, encryption_key: Union[str, bytes, None] = None
     ) -> None:
@@ -246,6 +302,10 @@ class ArrayObject(list[Any], PdfObject):
         pdf: Optional[PdfReaderProtocol],
         forced_encoding: Union[str, list[str], dict[int, str], None] = None,
     ) -> "ArrayObject":
+        lexer = BufferLexer.from_stream(stream)
+        if lexer is not None:
+            with lexer:
+                return ArrayObject._read_from_lexer(lexer, pdf, forced_encoding)
         arr = ArrayObject()
         tmp = stream.read(1)
         if tmp != b"[":
@@ -271,6 +331,31 @@ class ArrayObject(list[Any], PdfObject):
             arr.append(read_object(stream, pdf, forced_encoding))
         return arr
 
+    @staticmethod
+    def _read_from_lexer(
+        lexer: BufferLexer,
+        pdf: Optional[PdfReaderProtocol],
+        forced_encoding: Union[str, list[str], dict[int, str], None] = None,
+    ) -> "ArrayObject":
+        arr = ArrayObject()
+        if lexer.read(1) != b"[":
+            raise PdfReadError("Could not read array")
+        buffer = lexer.buffer
+        while True:
+            # skip leading whitespace
+            lexer.skip_isspace()
+            tok = bytes(buffer[lexer.position:lexer.position + 1])
+            if tok == b"":
+                break
+            if tok == b"]":
+                lexer.position += 1
+                break
+            if tok == b"%":
+                lexer.skip_comment()
+                continue
+            arr.append(_read_object_from_lexer(lexer, pdf, forced_encoding))
+        return arr
+
 
 class DictionaryObject(dict[Any, Any], PdfObject):
     def replicate(
@@ -480,6 +565,8 @@ class DictionaryObject(dict[Any, Any], PdfObject):
             raise ValueError("Key must be a PdfObject")
         if not isinstance(value, PdfObject):
             raise ValueError("Value must be a PdfObject")
+        if self._modification_tracker is not None and dict.get(self, key) is not value:
+            self._mark_modified()
         return dict.__setitem__(self, key, value)
 
     def setdefault(self, key: Any, value: Optional[Any] = None) -> Any:
@@ -487,8 +574,51 @@ class DictionaryObject(dict[Any, Any], PdfObject):
             raise ValueError("Key must be a PdfObject")
         if not isinstance(value, PdfObject):
             raise ValueError("Value must be a PdfObject")
+        if key not in self:
+            self._mark_modified()
         return dict.setdefault(self, key, value)
 
+    # Like for ArrayObject, the other dict methods modifying the dictionary report the
+    # modification, unless they do not change anything.
+
+    def _update_values(self, values: dict[Any, Any]) -> None:
+        if self._modification_tracker is not None and any(
+            dict.get(self, key) is not value for key, value in values.items()
+        ):
+            self._mark_modified()
+        dict.update(self, values)
+
+    def __delitem__(self, key: Any) -> None:
+        if key in self:
+            self._mark_modified()
+        dict.__delitem__(self, key)
+
+    def __or__(self, other: Any, /) -> dict[Any, Any]:
+        # Declared to keep the signature of __ior__() compatible.
+        return dict.__or__(self, other)
+
+    def __ior__(self, other: Any, /) -> Self:
+        self._update_values(dict(other))
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._update_values(dict(*args, **kwargs))
+
+    def pop(self, *args: Any) -> Any:
+        if args and args[0] in self:
+            self._mark_modified()
+        return dict.pop(self, *args)
+
+    def popitem(self) -> tuple[Any, Any]:
+        if self:
+            self._mark_modified()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        if self:
+            self._mark_modified()
+        dict.clear(self)
+
     def __getitem__(self, key: Any) -> PdfObject:
         return cast(PdfObject, dict.__getitem__(self, key).get_object())
 
@@ -581,6 +711,10 @@ class DictionaryObject(dict[Any, Any], PdfObject):
         pdf: Optional[PdfReaderProtocol],
         forced_encoding: Union[str, list[str], dict[int, str], None] = None,
     ) -> "DictionaryObject":
+        lexer = BufferLexer.from_stream(stream)
+        if lexer is not None:
+            with lexer:
+                return DictionaryObject._read_from_lexer(lexer, pdf, forced_encoding)
         tmp = stream.read(2)
         if tmp != b"<<":
             raise PdfReadError(
@@ -646,74 +780,161 @@ class DictionaryObject(dict[Any, Any], PdfObject):
         pos = stream.tell()
         s = read_non_whitespace(stream)
         if s == b"s" and stream.read(5) == b"tream":
-            eol = stream.read(1)
-            # Occasional PDF file output has spaces after 'stream' keyword but before EOL.
-            # patch provided by Danial Sandler
-            while eol == b" ":
-                eol = stream.read(1)
-            if eol not in (b"\n", b"\r"):
-                raise PdfStreamError("Stream data must be followed by a newline")
-            if eol == b"\r" and stream.read(1) != b"\n":
-                stream.seek(-1, 1)
-            # this is a stream object, not a dictionary
-            if StreamAttributes.LENGTH not in data:
+            DictionaryObject._read_stream_data(stream, pdf, data)
+        else:
+            stream.seek(pos, 0)
+        return DictionaryObject._from_parsed_data(data)
+
+    @staticmethod
+    def _read_from_lexer(
+        lexer: BufferLexer,
+        pdf: Optional[PdfReaderProtocol],
+        forced_encoding: Union[str, list[str], dict[int, str], None] = None,
+    ) -> "DictionaryObject":
+        tmp = lexer.read(2)
+        if tmp != b"<<":
+            raise PdfReadError(
+                f"Dictionary read error at byte {hex(lexer.position)}: "
+                "stream must begin with '<<'"
+            )
+        data: dict[Any, Any] = {}
+        buffer = lexer.buffer
+        while True:
+            lexer.skip_whitespace()
+            tok = bytes(buffer[lexer.position:lexer.position + 1])
+            if tok == b"%":
+                lexer.skip_comment()
+                continue
+            if not tok:
+                raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+
+            if tok == b">":
+                lexer.position = min(lexer.position + 2, lexer.size)
+                break
+            try:
+                try:
+                    key = _read_object_from_lexer(lexer, pdf)
+                    if isinstance(key, NullObject):
+                        break
+                    if not isinstance(key, NameObject):
+                        raise PdfReadError(
+                            f"Expecting a NameObject for key but found {key!r}"
+                        )
+                except PdfReadError as exc:
+                    if pdf is not None and pdf.strict:
+                        raise
+                    logger_warning("%(exception)r", source=__name__, exception=exc)
+                    continue
+                lexer.skip_whitespace()
+                if lexer.position >= lexer.size:
+                    lexer.unread()
+                value = _read_object_from_lexer(lexer, pdf, forced_encoding)
+            except (RecursionError, LimitReachedError) as exc:
+                raise PdfReadError(exc.__repr__())
+            except Exception as exc:
                 if pdf is not None and pdf.strict:
-                    raise PdfStreamError("Stream length not defined")
-                logger_warning(
-                    "Stream length not defined @pos=%(position)d",
-                    source=__name__,
-                    position=stream.tell(),
+                    raise PdfReadError(exc.__repr__())
+                logger_warning("%(exception)r", source=__name__, exception=exc)
+                retval = DictionaryObject()
+                retval.update(data)
+                return retval  # return partial data
+
+            if not data.get(key):
+                data[key] = value
+            else:
+                # multiple definitions of key not permitted
+                msg = (
+                    "Multiple definitions in dictionary at byte "
+                    "%(position)s for key %(key)s"
                 )
-                data[NameObject(StreamAttributes.LENGTH)] = NumberObject(-1)
-            length = data[StreamAttributes.LENGTH]
-            if isinstance(length, IndirectObject):
-                t = stream.tell()
-                assert pdf is not None, "mypy"
-                length = pdf.get_object(length)
-                stream.seek(t, 0)
-            if length is None:  # if the PDF is damaged
-                length = -1
-            pstart = stream.tell()
-
-            from ..filters import MAX_DECLARED_STREAM_LENGTH  # noqa: PLC0415
-            if length >= 0:
-                if length > MAX_DECLARED_STREAM_LENGTH:
-                    raise LimitReachedError(f"Declared stream length of {length} exceeds maximum allowed length.")
+                values = {"position": hex(lexer.position), "key": key}
+                if pdf is not None and pdf.strict:
+                    raise PdfReadError(msg % values)
+                logger_warning(msg, source=__name__, **values)
 
-                data["__streamdata__"] = stream.read(length)
+        pos = lexer.position
+        s = lexer.read_non_whitespace()
+        if s == b"s" and lexer.read(5) == b"tream":
+            lexer.delegate(DictionaryObject._read_stream_data, pdf, data)
+        else:
+            lexer.position = pos
+        return DictionaryObject._from_parsed_data(data)
+
+    @staticmethod
+    def _read_stream_data(stream: StreamType, pdf: Optional[PdfReaderProtocol], data: dict[Any, Any]) -> None:
+        """Read the data following the ``stream`` keyword into ``data["__streamdata__"]``."""
+        eol = stream.read(1)
+        # Occasional PDF file output has spaces after 'stream' keyword but before EOL.
+        # patch provided by Danial Sandler
+        while eol == b" ":
+            eol = stream.read(1)
+        if eol not in (b"\n", b"\r"):
+            raise PdfStreamError("Stream data must be followed by a newline")
+        if eol == b"\r" and stream.read(1) != b"\n":
+            stream.seek(-1, 1)
+        # this is a stream object, not a dictionary
+        if StreamAttributes.LENGTH not in data:
+            if pdf is not None and pdf.strict:
+                raise PdfStreamError("Stream length not defined")
+            logger_warning(
+                "Stream length not defined @pos=%(position)d",
+                source=__name__,
+                position=stream.tell(),
+            )
+            data[NameObject(StreamAttributes.LENGTH)] = NumberObject(-1)
+        length = data[StreamAttributes.LENGTH]
+        if isinstance(length, IndirectObject):
+            t = stream.tell()
+            assert pdf is not None, "mypy"
+            length = pdf.get_object(length)
+            stream.seek(t, 0)
+        if length is None:  # if the PDF is damaged
+            length = -1
+        pstart = stream.tell()
+
+        from ..filters import MAX_DECLARED_STREAM_LENGTH  # noqa: PLC0415
+        if length >= 0:
+            if length > MAX_DECLARED_STREAM_LENGTH:
+                raise LimitReachedError(f"Declared stream length of {length} exceeds maximum allowed length.")
+
+            if isinstance(stream, MemoryMappedStream):
+                data["__streamdata__"] = stream.read_view(length)
             else:
-                data["__streamdata__"] = read_until_regex(
-                    stream=stream, regex=re.compile(b"endstream"), length=MAX_DECLARED_STREAM_LENGTH,
+                data["__streamdata__"] = stream.read(length)
+        else:
+            data["__streamdata__"] = read_until_regex(
+                stream=stream, regex=re.compile(b"endstream"), length=MAX_DECLARED_STREAM_LENGTH,
+            )
+        e = read_non_whitespace(stream)
+        ndstream = stream.read(8)
+        if (e + ndstream) != b"endstream":
+            # the odd PDF file has a length that is too long, so
+            # we need to read backwards to find the "endstream" ending.
+            # ReportLab (unknown version) generates files with this bug,
+            # and Python users into PDF files tend to be our audience.
+            # we need to do this to correct the streamdata and chop off
+            # an extra character.
+            pos = stream.tell()
+            stream.seek(-10, 1)
+            end = stream.read(9)
+            if end == b"endstream":
+                # we found it by looking back one character further.
+                data["__streamdata__"] = data["__streamdata__"][:-1]
+            elif pdf is not None and not pdf.strict:
+                stream.seek(pstart, 0)
+                data["__streamdata__"] = DictionaryObject._read_unsized_from_stream(
+                    stream=stream, pdf=pdf, length=MAX_DECLARED_STREAM_LENGTH
                 )
-            e = read_non_whitespace(stream)
-            ndstream = stream.read(8)
-            if (e + ndstream) != b"endstream":
-                # the odd PDF file has a length that is too long, so
-                # we need to read backwards to find the "endstream" ending.
-                # ReportLab (unknown version) generates files with this bug,
-                # and Python users into PDF files tend to be our audience.
-                # we need to do this to correct the streamdata and chop off
-                # an extra character.
                 pos = stream.tell()
-                stream.seek(-10, 1)
-                end = stream.read(9)
-                if end == b"endstream":
-                    # we found it by looking back one character further.
-                    data["__streamdata__"] = data["__streamdata__"][:-1]
-                elif pdf is not None and not pdf.strict:
-                    stream.seek(pstart, 0)
-                    data["__streamdata__"] = DictionaryObject._read_unsized_from_stream(
-                        stream=stream, pdf=pdf, length=MAX_DECLARED_STREAM_LENGTH
-                    )
-                    pos = stream.tell()
-                else:
-                    stream.seek(pos, 0)
-                    raise PdfReadError(
-                        "Unable to find 'endstream' marker after stream at byte "
-                        f"{hex(stream.tell())} (nd='{ndstream!r}', end='{end!r}')."
-                    )
-        else:
-            stream.seek(pos, 0)
+            else:
+                stream.seek(pos, 0)
+                raise PdfReadError(
+                    "Unable to find 'endstream' marker after stream at byte "
+                    f"{hex(stream.tell())} (nd='{ndstream!r}', end='{end!r}')."
+                )
+
+    @staticmethod
+    def _from_parsed_data(data: dict[Any, Any]) -> "DictionaryObject":
         if "__streamdata__" in data:
             return StreamObject.initialize_from_dictionary(data)
         retval = DictionaryObject()
@@ -965,10 +1186,43 @@ def _reset_node_tree_relationship(child_obj: Any) -> None:
 
 
 class StreamObject(DictionaryObject):
+    # Raw stream content. A memoryview (e.g. a slice of a memory-mapped file)
+    # is only turned into bytes when the data is accessed through ``_data``.
+    _stream_data: Union[bytes, memoryview] = b""
+    # Set when reading an encrypted document: the data is only decrypted, with
+    # this crypt filter and strict mode, when it is accessed through ``_data``.
+    # The method and key of the crypt filter allow writing the data unchanged
+    # when it is encrypted with the same key again.
+    _stream_crypt: Optional[tuple["CryptBase", bool, Optional[tuple[str, bytes]]]] = None
+
     def __init__(self) -> None:
-        self._data: bytes = b""
+        self._data = b""
         self.decoded_self: Optional[DecodedStreamObject] = None
 
+    @property
+    def _data(self) -> bytes:
+        data = self._stream_data
+        if not isinstance(data, bytes):
+            data = self._stream_data = bytes(data)
+        if self._stream_crypt is not None:
+            crypt, strict, _ = self._stream_crypt
+            data = self._stream_data = crypt.decrypt(data, strict=strict)
+            del self._stream_crypt
+        return data
+
+    @_data.setter
+    def _data(self, value: Union[bytes, memoryview]) -> None:
+        self._mark_modified()
+        self._stream_data = value
+        if self._stream_crypt is not None:
+            del self._stream_crypt
+
+    def _copy_data(self, src: "StreamObject") -> None:
+        """Take the data of another stream, without decrypting it."""
+        self._data = src._stream_data
+        if src._stream_crypt is not None:
+            self._stream_crypt = src._stream_crypt
+
     def replicate(
         self,
         pdf_dest: PdfWriterProtocol,
@@ -977,7 +1231,7 @@ class StreamObject(DictionaryObject):
             "StreamObject",
             self._reference_clone(self.__class__(), pdf_dest, False),
         )
-        d__._data = self._data
+        d__._copy_data(self)
         try:
             decoded_self = self.decoded_self
             if decoded_self is None:
@@ -1012,7 +1266,7 @@ class StreamObject(DictionaryObject):
             ignore_fields:
 
         """
-        self._data = cast("StreamObject", src)._data
+        self._copy_data(cast("StreamObject", src))
         try:
             decoded_self = cast("StreamObject", src).decoded_self
             if decoded_self is None:
@@ -1055,11 +1309,12 @@ class StreamObject(DictionaryObject):
             deprecation_no_replacement(
                 "the encryption_key parameter of write_to_stream", "5.0.0"
             )
-        self[NameObject(StreamAttributes.LENGTH)] = NumberObject(len(self._data))
+        data = self._stream_data if self._stream_crypt is None else self._data
+        self[NameObject(StreamAttributes.LENGTH)] = NumberObject(len(data))
         DictionaryObject.write_to_stream(self, stream)
         del self[StreamAttributes.LENGTH]
         stream.write(b"\nstream\n")
-        stream.write(self._data)
+        stream.write(data)
         stream.write(b"\nendstream")
 
     @staticmethod
@@ -1110,6 +1365,33 @@ class StreamObject(DictionaryObject):
         retval._data = FlateDecode.encode(self._data, level)
         return retval
 
+    def iter_decoded(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Iterate over the decoded data of the stream in chunks.
+
+        Unlike :meth:`get_data`, the decoded data is neither cached nor kept in
+        memory at once if the stream uses the FlateDecode filter, which allows
+        to process very large embedded files or images.
+
+        Args:
+            chunk_size: The maximum number of bytes per chunk.
+
+        Yields:
+            The decoded data.
+
+        """
+        from ..filters import iter_decode_stream_data  # noqa: PLC0415
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+        decoded_self = getattr(self, "decoded_self", None)
+        if decoded_self is not None or not isinstance(self, EncodedStreamObject):
+            data = self.get_data() if decoded_self is None else decoded_self.get_data()
+            for start in range(0, len(data), chunk_size):
+                yield data[start : start + chunk_size]
+            return
+        yield from iter_decode_stream_data(self, chunk_size)
+
     def decode_as_image(self, pillow_parameters: Union[dict[str, Any], None] = None) -> Any:
         """
         Try to decode the stream object as an image
@@ -1279,7 +1561,7 @@ class ContentStream(DecodedStreamObject):
             "ContentStream",
             self._reference_clone(self.__class__(None, None), pdf_dest, False),
         )
-        d__._data = self._data
+        d__._copy_data(self)
         try:
             decoded_self = self.decoded_self
             if decoded_self is None:
@@ -1364,8 +1646,16 @@ class ContentStream(DecodedStreamObject):
         # like super(DictionaryObject,self)._clone(src, pdf_dest, force_duplicate, ignore_fields, visited)
 
     def _parse_content_stream(self, stream: StreamType) -> None:
+        self._operations.extend(self._iter_content_stream(stream))
+
+    def _iter_content_stream(self, stream: StreamType) -> Iterator[tuple[Any, bytes]]:
         # 7.8.2 Content Streams
         stream.seek(0, 0)
+        lexer = BufferLexer.from_stream(stream)
+        if lexer is not None:
+            with lexer:
+                yield from self._iter_content_stream_from_lexer(lexer)
+            return
         operands: list[Union[int, str, PdfObject]] = []
         while True:
             peek = read_non_whitespace(stream)
@@ -1381,9 +1671,9 @@ class ContentStream(DecodedStreamObject):
                     # mechanism is required, of course... thanks buddy...
                     assert operands == []
                     ii = self._read_inline_image(stream)
-                    self._operations.append((ii, b"INLINE IMAGE"))
+                    yield ii, b"INLINE IMAGE"
                 else:
-                    self._operations.append((operands, operator))
+                    yield operands, operator
                     operands = []
             elif peek == b"%":
                 # If we encounter a comment in the content stream, we have to
@@ -1396,6 +1686,44 @@ class ContentStream(DecodedStreamObject):
             else:
                 operands.append(read_object(stream, None, self.forced_encoding))
 
+    def _iter_content_stream_from_lexer(self, lexer: BufferLexer) -> Iterator[tuple[Any, bytes]]:
+        operands: list[Union[int, str, PdfObject]] = []
+        buffer = lexer.buffer
+        while lexer.position < lexer.size:
+            # Numbers and operators make up most of the content, read them in one go.
+            match = _CONTENT_TOKEN_PATTERN.match(buffer, lexer.position)
+            number, operator = match.group(1, 2)  # type: ignore[union-attr]
+            if number is not None:
+                start = match.start(1)  # type: ignore[union-attr]
+                if IndirectPattern.match(buffer, start, start + 20) is None:
+                    lexer.position = match.end()  # type: ignore[union-attr]
+                    operands.append(FloatObject(number) if b"." in number else NumberObject(number))
+                    continue
+            elif operator is not None and operator != b"BI":
+                lexer.position = match.end()  # type: ignore[union-attr]
+                yield operands, operator
+                operands = []
+                continue
+            lexer.position = match.start(match.lastindex) if match.lastindex else match.end()  # type: ignore[union-attr]
+            peek = bytes(buffer[lexer.position:lexer.position + 1])
+            if not peek:
+                break
+            if peek.isalpha() or peek in (b"'", b'"'):
+                operator = lexer.read_until_regex(NameObject.delimiter_pattern, self._OPERATOR_LENGTH_LIMIT)
+                if operator == b"BI":
+                    # begin inline image
+                    assert operands == []
+                    ii = lexer.delegate(self._read_inline_image)
+                    yield ii, b"INLINE IMAGE"
+                else:
+                    yield operands, operator
+                    operands = []
+            elif peek == b"%":
+                # comments may be followed by an operator, see _parse_content_stream
+                lexer.skip_line()
+            else:
+                operands.append(_read_object_from_lexer(lexer, None, self.forced_encoding))
+
     def _read_inline_image(self, stream: StreamType) -> dict[str, Any]:
         # begin reading just after the "BI" - begin image
         # first read the dictionary of settings.
@@ -1530,6 +1858,23 @@ class ContentStream(DecodedStreamObject):
         self._operations = operations
         self._data = b""
 
+    def iter_operations(self) -> Iterator[tuple[Any, bytes]]:
+        """
+        Iterate over the operations of the content stream.
+
+        Unlike :attr:`operations`, the data is parsed while iterating and the
+        operations are not kept, thus the memory used does not grow with the
+        number of operations. Use :attr:`operations` to modify the content.
+
+        Yields:
+            ``(operands, operator)`` tuples, as in :attr:`operations`.
+
+        """
+        if self._operations or not self._data:
+            yield from self._operations
+        else:
+            yield from self._iter_content_stream(BytesIO(self._data))
+
     def isolate_graphics_state(self) -> None:
         if self._operations:
             self._operations.insert(0, ([], b"q"))
@@ -1550,6 +1895,18 @@ def read_object(
     stream: StreamType,
     pdf: Optional[PdfReaderProtocol],
     forced_encoding: Union[str, list[str], dict[int, str], None] = None,
+) -> Union[PdfObject, int, str, ContentStream]:
+    lexer = BufferLexer.from_stream(stream)
+    if lexer is None:
+        return _read_object_from_stream(stream, pdf, forced_encoding)
+    with lexer:
+        return _read_object_from_lexer(lexer, pdf, forced_encoding)
+
+
+def _read_object_from_stream(
+    stream: StreamType,
+    pdf: Optional[PdfReaderProtocol],
+    forced_encoding: Union[str, list[str], dict[int, str], None] = None,
 ) -> Union[PdfObject, int, str, ContentStream]:
     tok = stream.read(1)
     stream.seek(-1, 1)  # reset to start
@@ -1577,7 +1934,7 @@ def read_object(
         skip_over_comment(stream)
         tok = read_non_whitespace(stream)
         stream.seek(-1, 1)
-        return read_object(stream, pdf, forced_encoding)
+        return _read_object_from_stream(stream, pdf, forced_encoding)
     if tok in b"0123456789+-.":
         # number object OR indirect reference
         peek = stream.read(20)
@@ -1596,6 +1953,159 @@ def read_object(
     )
 
 
+# Numbers and operators ending within the first chunk examined by read_until_regex,
+# see NumberObject.NumberPattern and NameObject.delimiter_pattern.
+_NUMBER_TOKEN_PATTERN = re.compile(rb"[+\-.0-9][+-.0-9]{0,14}(?![+-.0-9])")
+_CONTENT_TOKEN_PATTERN = re.compile(
+    rb"[\x00\t\n\f\r ]*(?:([+\-.0-9][+-.0-9]{0,14}(?![+-.0-9]))"
+    rb"|([A-Za-z'\"][^\s()<>\[\]{}/%]{0,14}(?![^\s()<>\[\]{}/%])))?"
+)
+# Literal strings without escapes or nested parentheses, and hexadecimal strings.
+_SIMPLE_STRING_PATTERN = re.compile(rb"\(([^()\\]*)\)")
+_HEX_STRING_PATTERN = re.compile(rb"<([0-9a-fA-F\x00\t\n\f\r ]*)>")
+_HEX_STRING_WHITESPACES_PATTERN = re.compile(rb"[\x00\t\n\f\r ]")
+
+_LexerResult = Optional[Union[PdfObject, int, str, ContentStream]]
+_Encoding = Union[str, list[str], dict[int, str], None]
+
+
+def _read_number_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    # number object OR indirect reference, or end of data
+    buffer = lexer.buffer
+    position = lexer.position
+    match = IndirectPattern.match(buffer, position, position + 20)
+    if match is not None:
+        assert pdf is not None, "mypy"
+        if b"\x0b" in match.group():
+            # Let the stream-based reader report the exact error.
+            return lexer.delegate(IndirectObject.read_from_stream, pdf)
+        lexer.position = match.end() - 1
+        idnum = int(match.group(1))
+        return IndirectObject(-idnum if buffer[position:position + 1] == b"-" else idnum, int(match.group(2)), pdf)
+    match = _NUMBER_TOKEN_PATTERN.match(buffer, position)
+    if match is None:
+        return NumberObject._read_from_lexer(lexer)
+    lexer.position = match.end()
+    number = match.group()
+    return FloatObject(number) if b"." in number else NumberObject(number)
+
+
+def _read_name_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    return NameObject._read_from_lexer(lexer, pdf)
+
+
+def _read_dictionary_or_hex_string_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    buffer = lexer.buffer
+    position = lexer.position
+    if buffer[position + 1:position + 2] == b"<":
+        return DictionaryObject._read_from_lexer(lexer, pdf, forced_encoding)
+    match = _HEX_STRING_PATTERN.match(buffer, position)
+    if match is None:
+        return lexer.delegate(read_hex_string_from_stream, forced_encoding)
+    lexer.position = match.end()
+    hex_digits = _HEX_STRING_WHITESPACES_PATTERN.sub(b"", match.group(1))
+    if len(hex_digits) % 2:
+        hex_digits += b"0"
+    return create_string_object(binascii.unhexlify(hex_digits), forced_encoding)
+
+
+def _read_array_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    return ArrayObject._read_from_lexer(lexer, pdf, forced_encoding)
+
+
+def _read_boolean_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    word = lexer.read(4)
+    if word == b"true":
+        return BooleanObject(True)
+    if word == b"fals":
+        lexer.read(1)
+        return BooleanObject(False)
+    raise PdfReadError("Could not read Boolean object")
+
+
+def _read_string_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    match = _SIMPLE_STRING_PATTERN.match(lexer.buffer, lexer.position)
+    if match is None:
+        return lexer.delegate(read_string_from_stream, forced_encoding)
+    lexer.position = match.end()
+    return create_string_object(bytes(match.group(1)), forced_encoding)
+
+
+def _read_endobj_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    return NullObject() if lexer.read(6) == b"endobj" else None
+
+
+def _read_null_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    if lexer.read(4) != b"null":
+        raise PdfReadError("Could not read Null object")
+    return NullObject()
+
+
+def _read_comment_from_lexer(
+    lexer: BufferLexer, pdf: Optional[PdfReaderProtocol], forced_encoding: _Encoding
+) -> _LexerResult:
+    lexer.skip_comment()
+    lexer.read_non_whitespace()
+    lexer.unread()
+    return _read_object_from_lexer(lexer, pdf, forced_encoding)
+
+
+# The readers of the objects by their first character, see _read_object_from_stream().
+# A reader returns None if the data turns out not to be an object.
+_LEXER_READERS: dict[
+    bytes, Callable[[BufferLexer, Optional[PdfReaderProtocol], _Encoding], _LexerResult]
+] = {
+    **{bytes([char]): _read_number_from_lexer for char in b"0123456789+-."},
+    b"": _read_number_from_lexer,
+    b"/": _read_name_from_lexer,
+    b"<": _read_dictionary_or_hex_string_from_lexer,
+    b"[": _read_array_from_lexer,
+    b"t": _read_boolean_from_lexer,
+    b"f": _read_boolean_from_lexer,
+    b"(": _read_string_from_lexer,
+    b"e": _read_endobj_from_lexer,
+    b"n": _read_null_from_lexer,
+    b"%": _read_comment_from_lexer,
+}
+
+
+def _read_object_from_lexer(
+    lexer: BufferLexer,
+    pdf: Optional[PdfReaderProtocol],
+    forced_encoding: _Encoding = None,
+) -> Union[PdfObject, int, str, ContentStream]:
+    """Same as :func:`read_object`, for data held in memory."""
+    tok = bytes(lexer.buffer[lexer.position:lexer.position + 1])
+    reader = _LEXER_READERS.get(tok)
+    if reader is not None:
+        obj = reader(lexer, pdf, forced_encoding)
+        if obj is not None:
+            return obj
+    pos = lexer.position
+    extract_start = max(0, pos - 20)
+    stream_extract = bytes(lexer.buffer[extract_start:extract_start + 80])
+    lexer.read_until_isspace()
+    raise PdfReadError(
+        f"Invalid Elementary Object starting with {tok!r} @{pos}: {stream_extract!r}"
+    )
+
+
 class Field(TreeObject):
     """
     A class representing a field dictionary.
@@ -24,7 +24,7 @@ from pypdf.generic import (
 
 if TYPE_CHECKING:
     import datetime
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
 
     from pypdf._writer import PdfWriter
 
@@ -283,6 +283,19 @@ class EmbeddedFile:
             value = value.encode("latin-1")
         self._embedded_file.set_data(value)
 
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Retrieve the file content in chunks, without keeping all of it in memory.
+
+        Args:
+            chunk_size: The maximum number of bytes per chunk.
+
+        Returns:
+            An iterator over the file content.
+
+        """
+        return self._embedded_file.iter_decoded(chunk_size)
+
     @property
     def size(self) -> int | None:
         """Retrieve the size of the uncompressed file in bytes."""
@@ -0,0 +1,175 @@
+"""
+Tokenizer working on in-memory buffers.
+
+Reading objects byte by byte through ``stream.read(1)`` and ``stream.seek(-1, 1)``
+is slow. When the data is held in memory, the parser uses a :class:`BufferLexer`
+instead, which scans the buffer with an integer cursor and regular expressions.
+"""
+
+import re
+import sys
+from re import Pattern
+from types import TracebackType
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from .._utils import (
+    WHITESPACES_AS_BYTES,
+    StreamType,
+    get_stream_buffer,
+    scan_until_regex,
+)
+from ..errors import PdfStreamError
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+BufferType = Union[bytes, memoryview]
+T = TypeVar("T")
+
+_WHITESPACES = re.compile(b"[" + re.escape(WHITESPACES_AS_BYTES) + b"]*")
+# Characters accepted by bytes.isspace().
+_ISSPACE = re.compile(rb"[ \t\n\r\x0b\x0c]*")
+_NOT_ISSPACE = re.compile(rb"[^ \t\n\r\x0b\x0c]*")
+_END_OF_LINE = re.compile(rb"[\r\n]")
+
+
+class BufferLexer:
+    """
+    Cursor on a buffer, providing the tokenizing primitives used by the parser.
+
+    The methods mirror the stream helpers of :mod:`pypdf._utils`, including
+    the resulting position, so both parsing paths behave the same.
+    Used as a context manager, the position of the stream the lexer has been
+    created from is updated when leaving the block.
+
+    Args:
+        buffer: The data to tokenize.
+        position: The initial position of the cursor.
+        stream: The stream holding the same data, used to hand over to
+            stream-based readers.
+
+    """
+
+    __slots__ = ("buffer", "position", "size", "stream")
+
+    def __init__(self, buffer: BufferType, position: int = 0, stream: Optional[StreamType] = None) -> None:
+        self.buffer = buffer
+        self.position = position
+        self.size = len(buffer)
+        self.stream = stream
+
+    @classmethod
+    def from_stream(cls, stream: StreamType) -> Optional["BufferLexer"]:
+        """Create a lexer at the current position of an in-memory stream, or ``None``."""
+        buffer = get_stream_buffer(stream)
+        if buffer is None:
+            return None
+        return cls(buffer, stream.tell(), stream)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if self.stream is not None:
+            self.stream.seek(self.position)
+
+    def delegate(self, function: Callable[..., T], *args: Any) -> T:
+        """Call a stream-based reader at the current position and continue after the data it consumed."""
+        stream = self.stream
+        assert stream is not None, "mypy"
+        stream.seek(self.position)
+        try:
+            return function(stream, *args)
+        finally:
+            self.position = stream.tell()
+
+    def read(self, size: int) -> bytes:
+        """Read up to ``size`` bytes, like ``stream.read(size)``."""
+        start = self.position
+        end = min(start + size, self.size)
+        if end <= start:
+            return b""
+        self.position = end
+        return bytes(self.buffer[start:end])
+
+    def unread(self) -> None:
+        """Step back by one byte, like ``stream.seek(-1, 1)``."""
+        if self.position > 0:
+            self.position -= 1
+
+    def skip_whitespace(self) -> bool:
+        """
+        Move the cursor to the next non-whitespace character.
+
+        Returns:
+            True if at least one whitespace character has been skipped.
+
+        """
+        start = self.position
+        if start >= self.size:
+            return False
+        self.position = _WHITESPACES.match(self.buffer, start).end()  # type: ignore[union-attr]
+        return self.position > start
+
+    def read_non_whitespace(self) -> bytes:
+        """Same as :func:`pypdf._utils.read_non_whitespace`."""
+        self.skip_whitespace()
+        return self.read(1)
+
+    def skip_isspace(self) -> None:
+        """Move the cursor to the next character for which ``bytes.isspace()`` is false."""
+        if self.position < self.size:
+            self.position = _ISSPACE.match(self.buffer, self.position).end()  # type: ignore[union-attr]
+
+    def read_until_isspace(self) -> bytes:
+        """Read until the next ``bytes.isspace()`` character, which is consumed, but not returned."""
+        start = self.position
+        if start >= self.size:
+            return b""
+        end = _NOT_ISSPACE.match(self.buffer, start).end()  # type: ignore[union-attr]
+        self.position = min(end + 1, self.size)
+        return bytes(self.buffer[start:end])
+
+    def skip_line(self) -> bool:
+        """
+        Move the cursor after the next end-of-line character.
+
+        Returns:
+            False if the end of the buffer has been reached instead.
+
+        """
+        match = _END_OF_LINE.search(self.buffer, self.position)
+        if match is None:
+            self.position = max(self.position, self.size)
+            return False
+        self.position = match.end()
+        return True
+
+    def skip_comment(self) -> None:
+        """Same as :func:`pypdf._utils.skip_over_comment`."""
+        if self.buffer[self.position:self.position + 1] == b"%" and not self.skip_line():
+            raise PdfStreamError("File ended unexpectedly.")
+
+    def read_until_regex(self, regex: Pattern[bytes], length: int = sys.maxsize) -> bytes:
+        """Same as :func:`pypdf._utils.read_until_regex`."""
+        start = self.position
+        if length > 16:
+            # Shortcut for the common case of short tokens, see scan_until_regex.
+            match = regex.search(self.buffer, start, start + 16)
+            if match is not None:
+                end = self.position = match.start()
+                return bytes(self.buffer[start:end])
+        try:
+            end = scan_until_regex(self.buffer, start, regex, length)
+        except Exception as error:
+            self.position = getattr(error, "position", start)
+            raise
+        self.position = max(start, end)
+        return bytes(self.buffer[start:end])
@@ -11,6 +11,8 @@ import pytest
 
 import pypdf
 from pypdf import PageObject, PdfReader, PdfWriter, Transformation
+from pypdf._codecs._codecs import LzwCodec
+from pypdf.filters import FlateDecode
 from pypdf.generic import Destination, read_string_from_stream
 
 from . import RESOURCE_ROOT, SAMPLE_ROOT, get_data_from_url
@@ -232,3 +234,51 @@ def test_large_compressed_image_performance(benchmark):
     url = "https://github.com/py-pdf/pypdf/files/15306199/file_with_large_compressed_image.pdf"
     data = BytesIO(get_data_from_url(url=url, name="file_with_large_compressed_image.pdf"))
     benchmark(image_extraction, data)
+
+
+def _png_predicted_data(
+    filter_types: tuple[int, ...], columns: int = 2000, colors: int = 3, rows: int = 300
+) -> tuple[bytes, int, int]:
+    row_length = columns * colors + 1
+    data = bytearray()
+    for row in range(rows):
+        data.append(filter_types[row % len(filter_types)])
+        data += bytes((row + column) % 256 for column in range(row_length - 1))
+    return bytes(data), row_length, colors
+
+
+@pytest.mark.parametrize("filter_types", [(1,), (2,), (1, 2, 3, 4)], ids=["sub", "up", "mixed"])
+def test_png_prediction_python_performance(benchmark, filter_types):
+    data, row_length, bpp = _png_predicted_data(filter_types)
+    benchmark(FlateDecode._decode_png_prediction_python, data, row_length, bpp)
+
+
+@pytest.mark.parametrize("filter_types", [(1,), (2,), (1, 2, 3, 4)], ids=["sub", "up", "mixed"])
+def test_png_prediction_numpy_performance(benchmark, filter_types):
+    pytest.importorskip("numpy")
+    data, row_length, bpp = _png_predicted_data(filter_types)
+    benchmark(FlateDecode._decode_png_prediction_numpy, data, row_length, bpp)
+
+
+def _lzw_data(kind: str, length: int = 500_000) -> bytes:
+    if kind == "text":
+        words = [b"lorem", b"ipsum", b"dolor", b"sit", b"amet", b"consectetur", b"adipiscing", b"elit"]
+        return b" ".join(words[(index * 7) % 11 % len(words)] for index in range(length // 5))[:length]
+    # A smooth grayscale gradient with some noise, like a scanned page.
+    return bytes((index // 64 + index * 31 % 7) % 256 for index in range(length))
+
+
+def lzw_round_trip(data):
+    codec = LzwCodec()
+    assert codec.decode(codec.encode(data)) == data
+
+
+@pytest.mark.parametrize("kind", ["text", "image"])
+def test_lzw_round_trip_performance(benchmark, kind):
+    benchmark(lzw_round_trip, _lzw_data(kind))
+
+
+@pytest.mark.parametrize("kind", ["text", "image"])
+def test_lzw_decode_performance(benchmark, kind):
+    encoded = LzwCodec().encode(_lzw_data(kind))
+    benchmark(LzwCodec().decode, encoded)
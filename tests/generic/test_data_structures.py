@@ -2,7 +2,7 @@
 import os
 import subprocess
 import sys
-from io import BytesIO
+from io import BufferedReader, BytesIO
 from pathlib import Path
 from typing import Callable
 from unittest import mock
@@ -24,6 +24,7 @@ from pypdf.generic import (
     StreamObject,
     TextStringObject,
     TreeObject,
+    read_object,
 )
 from pypdf.types import OutlineType
 from tests import RESOURCE_ROOT, get_data_from_url
@@ -462,6 +463,69 @@ def test_content_stream__parse_content_stream__limits() -> None:
         content_stream._parse_content_stream(stream)
 
 
+def test_content_stream__iter_operations() -> None:
+    content_stream = ContentStream(stream=None, pdf=None)
+    content_stream.set_data(b"BT /F1 12 Tf (Hello) Tj ET")
+    operations = content_stream.iter_operations()
+    assert next(operations) == ([], b"BT")
+    assert next(operations) == (["/F1", 12], b"Tf")
+    # Nothing is kept while iterating.
+    assert content_stream._operations == []
+    assert content_stream.get_data() == b"BT /F1 12 Tf (Hello) Tj ET"
+    assert list(operations) == [(["Hello"], b"Tj"), ([], b"ET")]
+
+    # Operations which have already been parsed or modified are used.
+    content_stream.operations.insert(0, ([], b"q"))
+    assert [operator for _, operator in content_stream.iter_operations()] == [b"q", b"BT", b"Tf", b"Tj", b"ET"]
+
+
+def _unbuffered_stream(data: bytes) -> BufferedReader:
+    """File-like stream which does not expose its buffer, thus parsed without the lexer."""
+    return BufferedReader(BytesIO(data))  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"q 1 0 0 -1.5 +2 .5 cm /F1 12 Tf [(Hello) -250 (W\\(o\\)rld)] TJ Q",
+        b"BT <48656C6C6F> Tj <4 8 6> Tj (a(b)c) ' 1 2 (x) \" ET",
+        b"/Name#20X 1,2 3 0 12345678901234567 BX %comment\n EX",
+        b"<< /A [1 2 3] /B << /C null >> /D true /E false >> BDC EMC %no eol",
+        b"q 0 0 1 rg BI /W 1 /H 1 /BPC 8 /CS /G ID \x00 EI Q",
+    ],
+)
+def test_content_stream__lexer_matches_stream_parsing(data: bytes) -> None:
+    expected = ContentStream(stream=None, pdf=None)
+    expected._parse_content_stream(_unbuffered_stream(data))
+    parsed = ContentStream(stream=None, pdf=None)
+    parsed._parse_content_stream(BytesIO(data))
+    assert parsed.operations == expected.operations
+    assert len(parsed.operations) > 1
+
+
+@pytest.mark.parametrize(
+    ("data", "position"),
+    [
+        (b"<< /A 1 /B [ 2 (c) ] >> trailer", 23),
+        (b"[ /A 12 0 R -1.5 ] ", 18),
+        (b"(unterminated", 13),
+        (b"<< /Length 3 >>\nstream\nabc\nendstream\nendobj", 36),
+        (b"} invalid", 2),
+    ],
+)
+def test_read_object__lexer_matches_stream_parsing(data: bytes, position: int) -> None:
+    pdf = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    results = []
+    for stream in (_unbuffered_stream(data), BytesIO(data)):
+        try:
+            result = repr(read_object(stream, pdf))
+        except PdfReadError as exc:
+            result = str(exc)
+        results.append((result, stream.tell()))
+    assert results[0] == results[1]
+    assert results[0][1] == position
+
+
 @pytest.mark.timeout(5)
 def test_content_stream__read_inline_image__end_of_stream() -> None:
     # Broken content stream, for example due to filter errors.
@@ -295,6 +295,13 @@ def test_embedded_file__content_setter() -> None:
     assert embedded_file.content == b"Lorem ipsum dolor sit amet"
 
 
+def test_embedded_file__iter_content() -> None:
+    writer = PdfWriter()
+    embedded_file = writer.add_attachment("test.txt", b"Hello World! " * 1000)
+    assert b"".join(embedded_file.iter_content(chunk_size=100)) == b"Hello World! " * 1000
+    assert max(map(len, embedded_file.iter_content(chunk_size=100))) == 100
+
+
 def test_embedded_file__size_setter() -> None:
     writer = PdfWriter()
     embedded_file = writer.add_attachment("test.txt", b"content")
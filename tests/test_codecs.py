@@ -51,9 +51,9 @@ def test_encode_lzw(plain, expected_encoded):
 @pytest.mark.parametrize(
     ("encoded", "expected_decoded"),
     [
-        # _pack_codes_into_bytes([256, 65, 66, 67, 68, 256, 256, 69, 70, 71, 72, 257])
+        # The 9-bit codes 256, 65, 66, 67, 68, 256, 256, 69, 70, 71, 72, 257.
         (b"\x80\x10HD2$\x02\x00E#\x11\xc9\x10\x10", b"ABCDEFGH"),  # Clear twice.
-        # _pack_codes_into_bytes([65, 66, 67, 68, 257])
+        # The 9-bit codes 65, 66, 67, 68, 257.
         (b" \x90\x88dH\x08", b"ABCD"),  # No explicit initial clear marker.
     ],
 )
@@ -73,6 +73,13 @@ def test_lzw_decoder_table_overflow(caplog):
     assert "Ignoring too large LZW table index." in caplog.text
 
 
+@pytest.mark.timeout(timeout=15, method="thread")
+def test_lzw_encoder_large_stream_performance():
+    data = bytes((index // 64 + index * 31 % 7) % 256 for index in range(1_000_000))
+    codec = LzwCodec()
+    assert codec.decode(codec.encode(data)) == data
+
+
 @pytest.mark.enable_socket
 @pytest.mark.timeout(timeout=15, method="thread")
 def test_lzw_decoder_large_stream_performance(caplog):
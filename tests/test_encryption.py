@@ -7,6 +7,7 @@ import subprocess
 import sys
 from io import BytesIO
 from typing import NoReturn
+from unittest import mock
 
 import pytest
 
@@ -15,7 +16,8 @@ from pypdf import PasswordType, PdfReader, PdfWriter
 from pypdf._crypt_providers import crypt_provider
 from pypdf._crypt_providers._fallback import _DEPENDENCY_ERROR_STR
 from pypdf._encryption import AlgV5, CryptAES, CryptRC4, EncryptAlgorithm, Encryption, _saslprep
-from pypdf.errors import DependencyError, PdfReadError, PdfStreamError
+from pypdf.errors import DependencyError, PdfReadError, PdfStreamError, PyPdfError
+from pypdf.generic import DictionaryObject, NameObject, NumberObject
 from tests import RESOURCE_ROOT, SAMPLE_ROOT, get_data_from_url
 
 USE_CRYPTOGRAPHY = crypt_provider[0] == "cryptography"
@@ -525,6 +527,79 @@ def test_aes256_decrypt_does_not_call_md5(monkeypatch):
     reader.pages[0].extract_text()
 
 
+@pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
+def test_lazy_stream_decryption():
+    image_data = PdfReader(RESOURCE_ROOT / "jpeg.pdf").get_object(4)._data
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "jpeg.pdf")
+    writer.encrypt("userpass", algorithm="AES-128")
+    encrypted = BytesIO()
+    writer.write(encrypted)
+
+    reader = PdfReader(encrypted, password="userpass")
+    make_crypt_filter = reader._encryption._make_crypt_filter
+    with mock.patch.object(reader._encryption, "_make_crypt_filter", wraps=make_crypt_filter) as make:
+        page = reader.pages[0]
+        image = page["/Resources"]["/XObject"]["/Im4"]
+        assert image._stream_crypt is not None
+        assert image._stream_data != image_data
+
+        # The image is decrypted when writing the copied page.
+        writer = PdfWriter()
+        copied = writer.add_page(page)["/Resources"]["/XObject"]["/Im4"]
+        assert copied._stream_crypt is not None
+        output = BytesIO()
+        writer.write(output)
+        assert PdfReader(output).pages[0]["/Resources"]["/XObject"]["/Im4"]._data == image_data
+        assert image._stream_crypt is not None
+        assert image._data == image_data
+        assert image._stream_crypt is None
+
+        # The crypt filters are reused.
+        reader._encryption.decrypt_object(DictionaryObject(), 4, 0)
+        assert [call.args for call in make.call_args_list].count((4, 0)) == 1
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "requires_aes"),
+    [("RC4-128", False), ("AES-128", True), ("AES-256", True)],
+)
+@pytest.mark.parametrize("full", [False, True])
+def test_preserve_encryption(algorithm, requires_aes, full):
+    if requires_aes and not HAS_AES:
+        pytest.skip("No AES implementation")
+    image_data = PdfReader(RESOURCE_ROOT / "jpeg.pdf").get_object(4)._data
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "jpeg.pdf")
+    writer.encrypt("userpass", "ownerpass", algorithm=algorithm)
+    encrypted = BytesIO()
+    writer.write(encrypted)
+
+    reader = PdfReader(encrypted, password="userpass")
+    image_reference = reader.pages[0]["/Resources"]["/XObject"].raw_get("/Im4")
+    writer = PdfWriter(reader, preserve_encryption=True, full=full)
+    page = writer.pages[0]
+    page[NameObject("/Rotate")] = NumberObject(90)
+    image = page["/Resources"]["/XObject"]["/Im4"]
+    assert image.indirect_reference.idnum == image_reference.idnum
+    ciphertext = image._stream_data
+    output = BytesIO()
+    writer.write(output)
+
+    # The image is written without being decrypted.
+    assert image._stream_crypt is not None
+    assert ciphertext in output.getvalue()
+    reader = PdfReader(output)
+    assert reader.decrypt("ownerpass") == PasswordType.OWNER_PASSWORD
+    assert reader.pages[0].rotation == 90
+    assert reader.pages[0]["/Resources"]["/XObject"]["/Im4"]._data == image_data
+
+
+def test_preserve_encryption__invalid():
+    with pytest.raises(ValueError, match=r"^preserve_encryption requires a document to clone from"):
+        PdfWriter(preserve_encryption=True)
+    with pytest.raises(PyPdfError, match=r"^The document to clone from has to be encrypted and decrypted"):
+        PdfWriter(clone_from=RESOURCE_ROOT / "jpeg.pdf", preserve_encryption=True)
+
+
 @pytest.mark.enable_socket
 @pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
 def test_reader__decryption_error_handling(caplog) -> None:
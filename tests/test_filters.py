@@ -1,6 +1,8 @@
 """Test the pypdf.filters module."""
 import os
+import random
 import string
+import struct
 import subprocess
 import sys
 import zlib
@@ -8,7 +10,7 @@ from copy import deepcopy
 from io import BytesIO
 from itertools import product as cartesian_product
 from pathlib import Path
-from typing import cast
+from typing import NoReturn, cast
 from unittest import mock
 
 import pytest
@@ -17,6 +19,7 @@ from PIL import Image, ImageOps
 from pypdf import PdfReader, PdfWriter
 from pypdf.errors import DependencyError, DeprecationError, LimitReachedError, PdfReadError, PdfStreamError
 from pypdf.filters import (
+    _FILTER_ENCODERS,
     ASCII85Decode,
     ASCIIHexDecode,
     CCITParameters,
@@ -28,6 +31,9 @@ from pypdf.filters import (
     RunLengthDecode,
     decode_stream_data,
     decompress,
+    iter_decode_stream_data,
+    register_filter,
+    unregister_filter,
 )
 from pypdf.generic import (
     ArrayObject,
@@ -35,6 +41,7 @@ from pypdf.generic import (
     ContentStream,
     DecodedStreamObject,
     DictionaryObject,
+    EncodedStreamObject,
     IndirectObject,
     NameObject,
     NullObject,
@@ -960,6 +967,30 @@ def test_decompress__logging_on_invalid_data(caplog):
     assert caplog.messages == ["Error -3 while decompressing data: incorrect header check"]
 
 
+def test_decompress__corrupted_large_stream(caplog):
+    data = random.Random(42).randbytes(1_000_000)  # noqa: S311
+    # Store the data in uncompressed deflate blocks of 50000 bytes.
+    compressed = bytearray(b"\x78\x01")
+    for start in range(0, len(data), 50000):
+        block = data[start : start + 50000]
+        is_final = start + 50000 >= len(data)
+        compressed += bytes((is_final,)) + struct.pack("<HH", len(block), len(block) ^ 0xFFFF) + block
+    compressed += struct.pack(">I", zlib.adler32(data))
+    assert zlib.decompress(bytes(compressed)) == data
+
+    # Break the length of the 14th block, which stops the recovery after 13 blocks.
+    compressed[2 + 13 * 50005 + 1] ^= 0xFF
+    compressed.extend(b"\r\n" * 20)
+
+    assert decompress(bytes(compressed)) == data[:650000]
+    assert caplog.messages == ["Error -3 while decompressing data: invalid stored block lengths"]
+
+    # The output limit is checked for the exact input byte.
+    with mock.patch("pypdf.filters.ZLIB_MAX_OUTPUT_LENGTH", 500_000), \
+            pytest.raises(LimitReachedError, match=r"^Limit reached while decompressing\. \d+ bytes remaining\.$"):
+        decompress(bytes(compressed))
+
+
 def test_ccittfaxdecode__ccf_inline():
     writer = PdfWriter(clone_from=RESOURCE_ROOT / "jpeg.pdf")
     page = writer.pages[0]
@@ -1188,6 +1219,46 @@ def test_flatedecode__decode_png_prediction__speed():
     FlateDecode._decode_png_prediction(data=data, columns=columns, row_length=row_length)
 
 
+_PNG_PREDICTED_DATA = (
+    b"\x01\x10\x20\xf0\xf0\x05\x06"  # Sub
+    b"\x02\x01\x02\x20\x20\x01\x01"  # Up
+    b"\x03\x10\x10\x10\x10\x10\x10"  # Average
+    b"\x04\x01\x02\x03\x04\x05\x06"  # Paeth
+    b"\x00\x07\x08\x09\x0a\x0b\x0c"  # None
+    b"\x04\x80\x80\x80\x80\x80\x80"  # Paeth
+)
+_PNG_DECODED_DATA = (
+    b"\x10\x20\x00\x10\x05\x16"
+    b"\x11\x22\x20\x30\x06\x17"
+    b"\x18\x21\x2c\x38\x29\x37"
+    b"\x19\x23\x2f\x3c\x31\x42"
+    b"\x07\x08\x09\x0a\x0b\x0c"
+    b"\x87\x88\x07\x08\x89\x8a"
+)
+
+
+def test_flatedecode__decode_png_prediction__python():
+    assert FlateDecode._decode_png_prediction_python(_PNG_PREDICTED_DATA, 7, 2) == _PNG_DECODED_DATA
+
+
+def test_flatedecode__decode_png_prediction__numpy():
+    pytest.importorskip("numpy")
+    assert FlateDecode._decode_png_prediction_numpy(_PNG_PREDICTED_DATA, 7, 2) == _PNG_DECODED_DATA
+    # Images with the same predictor on all rows are decoded at once
+    sub_rows = b"\x01\x01\x02\x03\x04\xff\xff" * 2
+    up_rows = b"\x02\x01\x02\x03\x04\xff\xff" * 2
+    for data in (sub_rows, up_rows):
+        assert FlateDecode._decode_png_prediction_numpy(data, 7, 2) == (
+            FlateDecode._decode_png_prediction_python(data, 7, 2)
+        )
+
+
+def test_flatedecode__decode_png_prediction__less_than_one_byte_per_pixel():
+    # 1 bit per component: the Sub predictor uses the previous byte
+    data = b"\x01\x01\x01" * 2
+    assert FlateDecode._decode_png_prediction(data, columns=16, row_length=3) == b"\x01\x02" * 2
+
+
 _FLATE_IMAGE_DATA = (
     b"\x00\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
     b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00"
@@ -1282,3 +1353,114 @@ def test_flate_decode__decode__decode_parms_types__null_object(caplog) -> None:
     compressed = zlib.compress(_FLATE_IMAGE_DATA)
     _ = FlateDecode.decode(decode_parms=NullObject(), data=compressed)
     assert caplog.messages == []
+
+
+def test_register_filter__custom_decoder():
+    def decode_rot13(data: bytes, decode_parms: DictionaryObject, stream: StreamObject) -> bytes:
+        assert isinstance(decode_parms, DictionaryObject)
+        assert stream["/Filter"] == ["/ROT13", "/FlateDecode"]
+        return data.translate(bytes.maketrans(
+            string.ascii_letters.encode(),
+            (string.ascii_lowercase[13:] + string.ascii_lowercase[:13]
+             + string.ascii_uppercase[13:] + string.ascii_uppercase[:13]).encode(),
+        ))
+
+    stream = DecodedStreamObject()
+    stream.set_data(b"Uryyb")
+    stream[NameObject("/Filter")] = ArrayObject([NameObject("/ROT13"), NameObject("/FlateDecode")])
+    with pytest.raises(NotImplementedError, match=r"^Unsupported filter /ROT13$"):
+        decode_stream_data(stream)
+
+    register_filter("/ROT13", decode_rot13)
+    try:
+        with mock.patch.object(FlateDecode, "decode", return_value=b"done") as flate_decode:
+            assert decode_stream_data(stream) == b"done"
+        assert flate_decode.call_args.args[0] == b"Hello"
+    finally:
+        unregister_filter("/ROT13", decode_rot13)
+    with pytest.raises(NotImplementedError):
+        decode_stream_data(stream)
+
+    with pytest.raises(ValueError, match=r"^Either a decoder or an encoder is required$"):
+        register_filter("/ROT13")
+
+
+def test_register_filter__encoder_priority():
+    def encode_fast(data: bytes, level: int) -> bytes:
+        return zlib.compress(data, 1)
+
+    def encode_slow(data: bytes, level: int) -> NoReturn:
+        raise AssertionError("lower priority")
+
+    data = b"Hello World! " * 100
+    register_filter("/FlateDecode", encoder=encode_fast, priority=10)
+    register_filter("/Fl", encoder=encode_slow, priority=5)
+    try:
+        assert FlateDecode.encode(data, level=9) == zlib.compress(data, 1)
+        stream = DecodedStreamObject()
+        stream.set_data(data)
+        assert stream.flate_encode()._data == zlib.compress(data, 1)
+    finally:
+        unregister_filter("/FlateDecode", encoder=encode_fast)
+    with pytest.raises(AssertionError, match="lower priority"):
+        FlateDecode.encode(data)
+    unregister_filter("/FlateDecode", encoder=encode_slow)
+    assert FlateDecode.encode(data, level=9) == zlib.compress(data, 9)
+
+
+def test_unregister_filter__all_encoders():
+    data = b"Hello World! " * 100
+    encoders = list(_FILTER_ENCODERS["/FlateDecode"])
+    for _, encoder in encoders:
+        unregister_filter("/FlateDecode", encoder=encoder)
+    try:
+        assert FlateDecode.encode(data, level=9) == zlib.compress(data, 9)
+        stream = DecodedStreamObject()
+        stream.set_data(data)
+        assert stream.flate_encode()._data == zlib.compress(data)
+    finally:
+        for priority, encoder in encoders:
+            register_filter("/FlateDecode", encoder=encoder, priority=priority)
+    assert _FILTER_ENCODERS["/FlateDecode"] == encoders
+
+
+@pytest.mark.parametrize("predictor", [1, 2, 12])
+@pytest.mark.parametrize("chunk_size", [1, 10, 65536])
+def test_iter_decode_stream_data(predictor, chunk_size):
+    rows = [bytes([2]) + bytes(range(row, row + 9)) for row in range(50)]
+    data = b"".join(rows) + b"\x01\x03\x03"  # the last row is incomplete
+    stream = EncodedStreamObject()
+    stream[NameObject("/Filter")] = ArrayObject([NameObject("/ASCIIHexDecode"), NameObject("/FlateDecode")])
+    decode_parms = DictionaryObject({
+        NameObject("/Predictor"): NumberObject(predictor),
+        NameObject("/Columns"): NumberObject(3),
+        NameObject("/Colors"): NumberObject(3),
+    })
+    stream[NameObject("/DecodeParms")] = ArrayObject([NullObject(), decode_parms])
+    stream._data = zlib.compress(data).hex().encode() + b">"
+
+    chunks = list(iter_decode_stream_data(stream, chunk_size=chunk_size))
+    assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+    assert b"".join(chunks) == decode_stream_data(stream)
+    assert b"".join(stream.iter_decoded(chunk_size)) == stream.get_data()
+    assert b"".join(stream.iter_decoded(chunk_size)) == stream.get_data()  # from the cached data
+
+
+def test_iter_decode_stream_data__limits():
+    data = b"Hello World! " * 1000
+    stream = EncodedStreamObject()
+    stream[NameObject("/Filter")] = NameObject("/FlateDecode")
+    stream._data = zlib.compress(data)
+
+    with mock.patch("pypdf.filters.ZLIB_MAX_OUTPUT_LENGTH", 5000):
+        chunks = iter_decode_stream_data(stream, chunk_size=1000)
+        for _ in range(5):
+            assert len(next(chunks)) == 1000
+        with pytest.raises(LimitReachedError, match=r"^Limit reached while decompressing\. \d+ bytes remaining\.$"):
+            next(chunks)
+    with pytest.raises(ValueError, match=r"^chunk_size must be at least 1, not 0$"):
+        next(iter_decode_stream_data(stream, chunk_size=0))
+
+    # Damaged data is recovered by decompress()
+    stream._data = zlib.compress(data) + b"\r"
+    assert b"".join(iter_decode_stream_data(stream, chunk_size=1000)) == data
@@ -11,7 +11,7 @@ from fontTools.ttLib import TTFont
 
 from pypdf import PdfReader, PdfWriter
 from pypdf._cmap import _parse_to_unicode
-from pypdf._font import Font, FontDescriptor
+from pypdf._font import Font, FontCache, FontDescriptor
 from pypdf.errors import LimitReachedError, PdfReadError
 from pypdf.generic import ArrayObject, DictionaryObject, EncodedStreamObject, NameObject, NumberObject, RectangleObject
 from pypdf.generic._appearance_stream import BaseStreamConfig, TextStreamAppearance
@@ -188,6 +188,55 @@ def test_font_from_font_file():
                 font._get_typographic_maps()
 
 
+def test_font_cache():
+    writer = PdfWriter()
+    font_resources = [
+        writer._add_object(DictionaryObject({
+            NameObject("/BaseFont"): NameObject(name),
+            NameObject("/Subtype"): NameObject("/Type1"),
+        }))
+        for name in ("/Helvetica", "/Courier", "/Times-Roman")
+    ]
+    cache = FontCache(max_entries=2)
+    helvetica = cache.get(font_resources[0])
+    assert helvetica.name == "Helvetica"
+    assert cache.get(font_resources[0].get_object()) is helvetica
+    assert cache.get(font_resources[1]).name == "Courier"
+    cache.get(font_resources[0])
+    cache.get(font_resources[2])
+    assert len(cache) == 2
+    assert cache.get(font_resources[0]) is helvetica
+
+    # Replaced objects are parsed again.
+    writer._replace_object(font_resources[0], DictionaryObject({
+        NameObject("/BaseFont"): NameObject("/Symbol"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+    }))
+    assert cache.get(font_resources[0]).name == "Symbol"
+
+    # Direct objects are not cached.
+    direct = DictionaryObject({
+        NameObject("/BaseFont"): NameObject("/Courier"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+    })
+    assert cache.get(direct) is not cache.get(direct)
+
+
+def test_font_cache__shared_by_pages():
+    reader = PdfReader(RESOURCE_ROOT / "selenium-pypdf-issue-177.pdf")
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_page(reader.pages[0])
+    texts = [page.extract_text() for page in writer.pages]
+    assert texts == [reader.pages[0].extract_text()] * 3
+    assert writer._font_cache is not None
+    cached_fonts = len(writer._font_cache)
+    assert cached_fonts > 0
+    for page in writer.pages:
+        page.extract_text(extraction_mode="layout")
+    assert len(writer._font_cache) == cached_fonts
+
+
 def test_font_as_font_resource():
     writer = PdfWriter(RESOURCE_ROOT / "fontsampler.pdf")
     font_resources = writer.pages[0]["/Resources"]["/Font"]
@@ -0,0 +1,88 @@
+"""Test the pypdf._index_cache module."""
+import os
+import shutil
+from io import BytesIO
+from unittest import mock
+
+import pytest
+
+from pypdf import DirectoryIndexCache, PdfReader
+
+from . import RESOURCE_ROOT
+
+
+@pytest.mark.parametrize(
+    ("name", "password"),
+    [
+        ("GeoBase_NHNC1_Data_Model_UML_EN.pdf", None),
+        ("encryption/r4-user-password.pdf", "asdfzxcv"),
+    ],
+)
+def test_load_stored_index(tmp_path, name, password):
+    path = tmp_path / "document.pdf"
+    shutil.copy(RESOURCE_ROOT / name, path)
+    expected = PdfReader(path, password=password)
+    cache = DirectoryIndexCache(tmp_path / "index")
+
+    PdfReader(path, password=password, index_cache=cache)
+    assert len(list((tmp_path / "index").glob("*.idx"))) == 1
+
+    with mock.patch.object(PdfReader, "read") as read:
+        reader = PdfReader(path, password=password, index_cache=cache)
+    read.assert_not_called()
+    assert reader.xref == expected.xref
+    assert reader.xref_free_entry == expected.xref_free_entry
+    assert reader.xref_objStm == expected.xref_objStm
+    assert reader._startxref == expected._startxref
+    assert list(reader.trailer) == list(expected.trailer)
+    assert [page.extract_text() for page in reader.pages] == [page.extract_text() for page in expected.pages]
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    path = tmp_path / "document.pdf"
+    shutil.copy(RESOURCE_ROOT / "crazyones.pdf", path)
+    cache = DirectoryIndexCache(tmp_path)
+    PdfReader(path, index_cache=cache)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with mock.patch.object(PdfReader, "read") as read:
+        PdfReader(path, index_cache=cache)
+    read.assert_called_once()
+    assert len(list(tmp_path.glob("*.idx"))) == 2
+
+    with mock.patch.object(PdfReader, "read") as read:
+        PdfReader(path, strict=True, index_cache=cache)
+    read.assert_called_once()
+
+
+def test_invalid_index_is_ignored(tmp_path):
+    path = RESOURCE_ROOT / "crazyones.pdf"
+    cache = DirectoryIndexCache(tmp_path)
+    PdfReader(path, index_cache=cache)
+    index_path = next(tmp_path.glob("*.idx"))
+    data = index_path.read_bytes()
+
+    for invalid in (b"", b"%PDF-1.4", data[:-1], data[:60]):
+        index_path.write_bytes(invalid)
+        reader = PdfReader(path, index_cache=cache)
+        assert reader.pages[0].extract_text().startswith("The Crazy Ones")
+        assert index_path.read_bytes() == data
+
+
+def test_index_requires_path(tmp_path):
+    cache = DirectoryIndexCache(tmp_path)
+    reader = PdfReader(BytesIO((RESOURCE_ROOT / "crazyones.pdf").read_bytes()), index_cache=cache)
+    assert len(reader.pages) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_store_failure(tmp_path, caplog):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_bytes(b"")
+    cache = DirectoryIndexCache(not_a_directory)
+    assert repr(cache) == f"DirectoryIndexCache({str(not_a_directory)!r})"
+
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf", index_cache=cache)
+    assert len(reader.pages) == 1
+    assert "Cannot store the index in" in caplog.text
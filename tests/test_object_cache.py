@@ -0,0 +1,96 @@
+"""Test the pypdf._object_cache module."""
+import copy
+import gc
+from io import BytesIO
+
+import pytest
+
+from pypdf import LRUObjectCache, PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject, NumberObject
+
+from . import RESOURCE_ROOT
+
+
+def test_requires_limit():
+    with pytest.raises(ValueError, match="At least one of max_bytes and max_entries must be set"):
+        LRUObjectCache()
+
+
+def test_counters_and_lru_order():
+    cache = LRUObjectCache(max_entries=2)
+    objects = [DictionaryObject({NameObject("/N"): NumberObject(i)}) for i in range(3)]
+    cache[(0, 1)] = objects[0]
+    cache[(0, 2)] = objects[1]
+    assert cache.get((0, 1)) is objects[0]
+    assert cache.get((0, 3)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache[(0, 3)] = objects[2]
+    assert cache.evictions == 1
+    assert list(cache._entries) == [(0, 1), (0, 3)]
+
+    # Still referenced, thus available with the same identity.
+    assert (0, 2) in cache
+    assert cache.get((0, 2)) is objects[1]
+    assert cache.hits == 2
+
+    del objects[:]
+    gc.collect()
+    assert cache.get((0, 1)) is None
+    assert cache.misses == 2
+    assert len(cache) == 2
+
+
+def test_pinned_objects_are_not_evicted():
+    cache = LRUObjectCache(max_entries=1)
+    pinned = DictionaryObject()
+    cache[(0, 1)] = pinned
+    cache.pin((0, 1))
+    cache[(0, 2)] = DictionaryObject()
+    cache[(0, 3)] = DictionaryObject()
+    assert (0, 1) in cache._entries
+    assert cache.evictions == 2
+
+
+def test_decoded_data_is_dropped_first():
+    stream = DecodedStreamObject()
+    stream.set_data(b"raw")
+    decoded = DecodedStreamObject()
+    decoded.set_data(b"x" * 10_000)
+    stream.decoded_self = decoded
+
+    cache = LRUObjectCache(max_bytes=5_000)
+    cache[(0, 1)] = stream
+    assert stream.decoded_self is None
+    assert cache.evictions == 0
+    assert cache.size < 5_000
+
+
+def test_reader_with_bounded_cache():
+    src = RESOURCE_ROOT / "pdflatex-outline.pdf"
+    cache = LRUObjectCache(max_bytes=20_000)
+    reader = PdfReader(src, object_cache=cache)
+    expected = PdfReader(src)
+    assert reader.resolved_objects is cache
+
+    for page, expected_page in zip(reader.pages, expected.pages):
+        assert page.extract_text() == expected_page.extract_text()
+    assert cache.evictions > 0
+    assert cache.hits > 0
+    assert cache.size <= 20_000
+
+    output = BytesIO()
+    PdfWriter(clone_from=reader).write(output)
+    assert len(PdfReader(output).pages) == len(expected.pages)
+
+    reader.close()
+    assert len(cache) == 0
+
+
+def test_deepcopy():
+    cache = LRUObjectCache(max_entries=2)
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf", object_cache=cache)
+    reader.pages[0].extract_text()
+    copied = copy.deepcopy(cache)
+    assert list(copied) == list(cache)
+    assert copied._lock is not cache._lock
@@ -1073,6 +1073,29 @@ def test_merge_transformed_page_into_blank():
     assert inserted_blank.page_number is not None
 
 
+def test_page_number__after_page_list_changes():
+    writer = PdfWriter()
+    for _ in range(6):
+        writer.add_blank_page(100, 100)
+    writer.insert_blank_page(100, 100, index=2)
+    writer.remove_page(0)
+    del writer.pages[1:3]
+    writer.add_blank_page(100, 100)
+    writer.insert_page(PdfReader(RESOURCE_ROOT / "crazyones.pdf").pages[0], index=1)
+    writer.flattened_pages.reverse()  # changed without going through the writer
+    for i, page in enumerate(writer.pages):
+        assert page.page_number == i
+        assert writer.get_page_number(page) == i
+
+    reader = PdfReader(RESOURCE_ROOT / "git.pdf")
+    pages = list(reader.pages)
+    reader.remove_page(pages[0])
+    assert pages[0].page_number is None
+    for i, page in enumerate(reader.pages):
+        assert page.page_number == i
+        assert reader.get_page_number(page) == i
+
+
 def test_pages_printing():
     pdf_path = RESOURCE_ROOT / "crazyones.pdf"
     reader = PdfReader(pdf_path)
@@ -1324,6 +1347,17 @@ def test_get_contents_as_bytes():
     assert writer.pages[0]._get_contents_as_bytes() is None
 
 
+def test_iter_content_operations():
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    page = reader.pages[0]
+    operations = page.iter_content_operations()
+    assert next(operations) == next(iter(page.get_contents().operations))
+    assert list(page.iter_content_operations()) == page.get_contents().operations
+
+    del page[NameObject("/Contents")]
+    assert list(page.iter_content_operations()) == []
+
+
 def test_recursive_get_page_from_node():
     writer = PdfWriter(RESOURCE_ROOT / "crazyones.pdf", incremental=True)
     writer.root_object["/Pages"].get_object()[
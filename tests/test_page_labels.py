@@ -1,10 +1,12 @@
 """Test the pypdf._page_labels module."""
 from io import BytesIO
+from typing import Optional
 
 import pytest
 
-from pypdf import PdfReader
+from pypdf import PdfReader, PdfWriter
 from pypdf._page_labels import (
+    PageLabelLookup,
     get_label_from_nums,
     index2label,
     number2lowercase_letter,
@@ -21,6 +23,8 @@ from pypdf.generic import (
     NameObject,
     NullObject,
     NumberObject,
+    PdfObject,
+    TextStringObject,
 )
 
 from . import RESOURCE_ROOT, get_data_from_url
@@ -239,3 +243,101 @@ def test_index2label__malformed_kid_limits(limits, caplog):
     assert index2label(reader, 5) == "6"
     assert "Ignoring kid with missing or malformed /Limits" in caplog.text
     assert "Could not reliably determine page label" in caplog.text
+
+
+def _page_label(style: str, start: Optional[int] = None, prefix: Optional[str] = None) -> DictionaryObject:
+    page_label = DictionaryObject({NameObject("/S"): NameObject(style)})
+    if start is not None:
+        page_label[NameObject("/St")] = NumberObject(start)
+    if prefix is not None:
+        page_label[NameObject("/P")] = TextStringObject(prefix)
+    return page_label
+
+
+def _kid(low: int, high: int, **entries: PdfObject) -> DictionaryObject:
+    kid = DictionaryObject({NameObject("/Limits"): ArrayObject([NumberObject(low), NumberObject(high)])})
+    for key, value in entries.items():
+        kid[NameObject(f"/{key}")] = value
+    return kid
+
+
+@pytest.mark.parametrize(
+    "number_tree",
+    [
+        None,
+        DictionaryObject(
+            {
+                NameObject("/Nums"): ArrayObject(
+                    [
+                        NumberObject(2), _page_label("/r"),
+                        NumberObject(4), _page_label("/D"),
+                        NumberObject(7), _page_label("/D", 8, "A-"),
+                        NumberObject(7), _page_label("/A"),
+                        NumberObject(9),
+                    ]
+                )
+            }
+        ),
+        DictionaryObject(
+            {
+                NameObject("/Kids"): ArrayObject(
+                    [
+                        _kid(0, 3, Nums=ArrayObject([NumberObject(1), _page_label("/R")])),
+                        # Pages 4 and 5 are not covered by the number tree
+                        _kid(
+                            6,
+                            20,
+                            Kids=ArrayObject(
+                                [
+                                    _kid(6, 7, Nums=ArrayObject()),
+                                    _kid(8, 9, Nums=ArrayObject([NumberObject(8), NumberObject(0)])),
+                                    _kid(10, 30, Nums=ArrayObject([NumberObject(10), _page_label("/a", 3)])),
+                                ]
+                            ),
+                        ),
+                    ]
+                )
+            }
+        ),
+        # Unsorted keys and overlapping limits are not flattened
+        DictionaryObject(
+            {NameObject("/Nums"): ArrayObject([NumberObject(5), _page_label("/r"), NumberObject(2), _page_label("/D")])}
+        ),
+        DictionaryObject(
+            {
+                NameObject("/Kids"): ArrayObject(
+                    [
+                        _kid(0, 10, Nums=ArrayObject([NumberObject(0), _page_label("/R")])),
+                        _kid(5, 20, Nums=ArrayObject([NumberObject(5), _page_label("/D")])),
+                    ]
+                )
+            }
+        ),
+    ],
+)
+def test_page_label_lookup__matches_index2label(number_tree):
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    if number_tree is not None:
+        reader.root_object[NameObject("/PageLabels")] = number_tree
+    expected = [index2label(reader, index) for index in range(25)]
+
+    lookup = PageLabelLookup(reader)
+    assert list(lookup.iter_labels(25)) == expected
+    assert [lookup[index] for index in range(25)] == expected
+    assert [lookup[index] for index in reversed(range(25))] == expected[::-1]
+
+
+def test_get_page_label():
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "crazyones.pdf")
+    for _ in range(4):
+        writer.add_blank_page()
+    assert writer.page_labels == ["1", "2", "3", "4", "5"]
+    assert writer.get_page_label(3) == "4"
+
+    writer.set_page_label(0, 1, "/r")
+    assert writer.get_page_label(1) == "ii"
+    assert writer.get_page_label(3) == "2"
+    assert writer.page_labels == ["i", "ii", "1", "2", "3"]
+
+    del writer.root_object["/PageLabels"]
+    assert writer.get_page_label(1) == "2"
@@ -0,0 +1,123 @@
+"""Test the pypdf._page_tree module."""
+from io import BytesIO
+from typing import Optional
+from unittest import mock
+
+import pytest
+
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.errors import LimitReachedError, PdfReadError
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject, RectangleObject
+
+
+def _nested_page_tree(counts: Optional[list[int]] = None) -> BytesIO:
+    """Create a document with 3 nodes of 3 nodes of 2 pages, each node setting its /MediaBox."""
+    writer = PdfWriter()
+    nodes = []
+    for i in range(3):
+        inner = []
+        for j in range(3):
+            pages = [
+                writer._add_object(
+                    DictionaryObject(
+                        {NameObject("/Type"): NameObject("/Page"), NameObject("/Rotate"): NumberObject(90 * k)}
+                    )
+                )
+                for k in range(2)
+            ]
+            inner.append(
+                writer._add_object(
+                    DictionaryObject(
+                        {
+                            NameObject("/Type"): NameObject("/Pages"),
+                            NameObject("/Kids"): ArrayObject(pages),
+                            NameObject("/Count"): NumberObject(2),
+                            NameObject("/MediaBox"): RectangleObject([0, 0, 100 * i + 10 * j, 100]),
+                        }
+                    )
+                )
+            )
+        nodes.append(
+            writer._add_object(
+                DictionaryObject(
+                    {
+                        NameObject("/Type"): NameObject("/Pages"),
+                        NameObject("/Kids"): ArrayObject(inner),
+                        NameObject("/Count"): NumberObject(6 if counts is None else counts[i]),
+                    }
+                )
+            )
+        )
+    writer.root_object[NameObject("/Pages")] = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Pages"),
+                NameObject("/Kids"): ArrayObject(nodes),
+                NameObject("/Count"): NumberObject(18 if counts is None else sum(counts)),
+            }
+        )
+    )
+    output = BytesIO()
+    writer.write(output)
+    return output
+
+
+def _describe(page: PageObject) -> tuple[int, list[float], int]:
+    return page.indirect_reference.idnum, list(page.mediabox), page.rotation
+
+
+def test_lazy_pages():
+    data = _nested_page_tree()
+    expected = [_describe(page) for page in PdfReader(data).pages]
+
+    reader = PdfReader(data, lazy_pages=True)
+    assert len(reader.pages) == 18
+    page = reader.pages[13]
+    assert _describe(page) == expected[13]
+    assert page.page_number == 13
+    assert reader.pages[13] is page
+    assert reader.pages[-1].page_number == 17
+    assert list(reader._lazy_page_tree.pages) == [13, 17]
+    assert reader.flattened_pages is None
+
+    assert [_describe(page) for page in reader.pages] == expected
+    assert reader.flattened_pages is None
+
+    # Pages which have been handed out are kept when flattening.
+    reader._flatten()
+    assert reader.pages[13] is page
+    assert page.page_number == 13
+
+
+def test_lazy_pages__inconsistent_count():
+    data = _nested_page_tree(counts=[6, 5, 7])
+    expected = [_describe(page) for page in PdfReader(data).pages]
+
+    reader = PdfReader(data, lazy_pages=True)
+    page = reader.pages[2]
+    assert _describe(page) == expected[2]
+    assert reader.flattened_pages is None
+    # Reading all kids of the second node reveals its wrong /Count.
+    assert _describe(reader.pages[10]) == expected[10]
+    assert reader.flattened_pages is not None
+    assert reader.pages[2] is page
+    assert [_describe(page) for page in reader.pages] == expected
+
+
+def test_lazy_pages__cyclic_references():
+    data = _nested_page_tree()
+    reader = PdfReader(data, lazy_pages=True)
+    pages_object = reader.root_object["/Pages"]
+    pages_object["/Kids"][0].get_object()[NameObject("/Kids")][0] = pages_object.indirect_reference
+
+    with pytest.raises(PdfReadError, match=r"^Detected cyclic page references\.$"):
+        reader.pages[0]
+
+
+def test_lazy_pages__entry_limit():
+    reader = PdfReader(_nested_page_tree(), lazy_pages=True)
+    with mock.patch("pypdf._page_tree.PAGE_TREE_MAX_ENTRIES", 10), pytest.raises(
+        LimitReachedError, match=r"^Maximum page tree entry limit reached: 11 > 10\.$"
+    ):
+        for page in reader.pages:
+            assert page.rotation in (0, 90)
@@ -10,9 +10,10 @@ from unittest import mock
 
 import pytest
 
-from pypdf import PdfReader, PdfWriter
+from pypdf import LRUObjectCache, PdfReader, PdfWriter
 from pypdf._crypt_providers import crypt_provider
 from pypdf._reader import convert_to_int
+from pypdf._utils import MemoryMappedStream
 from pypdf.constants import ImageAttributes
 from pypdf.constants import PageAttributes as PG
 from pypdf.constants import UserAccessPermissions as UAP
@@ -2658,3 +2659,159 @@ def test_flatten_keeps_typeless_real_page_strict():
     reader = PdfReader(output, strict=True)
     assert len(reader.pages) == 1
     assert reader.pages[0].mediabox.width == 612
+
+
+def test_memory_map(tmp_path):
+    src = RESOURCE_ROOT / "crazyones.pdf"
+    reader = PdfReader(src, memory_map=True)
+    assert isinstance(reader.stream, MemoryMappedStream)
+    contents = reader.pages[0]["/Contents"][0].get_object()
+    assert isinstance(contents._stream_data, memoryview)
+
+    expected = PdfReader(src)
+    assert contents.get_data() == expected.pages[0]["/Contents"][0].get_object().get_data()
+    assert reader.pages[0].extract_text() == expected.pages[0].extract_text()
+
+    mapped_output = BytesIO()
+    PdfWriter(clone_from=reader).write(mapped_output)
+    output = BytesIO()
+    PdfWriter(clone_from=expected).write(output)
+    assert mapped_output.getvalue() == output.getvalue()
+
+    # Views stay usable after closing the reader.
+    other = reader.pages[0]["/Resources"]["/Font"]["/F1"]
+    reader.close()
+    assert reader.stream.closed
+    assert isinstance(other, DictionaryObject)
+
+    # Empty files cannot be mapped and fall back to the usual error.
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    with pytest.raises(EmptyFileError):
+        PdfReader(empty, memory_map=True)
+
+
+def test_memory_mapped_stream(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"0123456789")
+    stream = MemoryMappedStream(path)
+    assert stream.read(3) == b"012"
+    assert stream.seek(-1, 1) == 2
+    assert stream.read(2) == b"23"
+    assert stream.seek(-20, 1) == 0
+    assert stream.seek(-2, 2) == 8
+    assert stream.read() == b"89"
+    assert stream.read(5) == b""
+    assert stream.seek(20) == 20
+    assert stream.read() == b""
+    assert bytes(stream.read_view(1)) == b""
+    with pytest.raises(ValueError, match="negative seek value"):
+        stream.seek(-1)
+
+    stream.seek(4)
+    view = stream.read_view(3)
+    assert bytes(view) == b"456"
+    assert stream.tell() == 7
+    stream.close()
+    assert stream.closed
+    assert bytes(view) == b"456"
+    stream.close()
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_extract_text_all(executor):
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.append(RESOURCE_ROOT / "crazyones.pdf")
+        writer.append(RESOURCE_ROOT / "pdflatex-outline.pdf")
+    output = BytesIO()
+    writer.write(output)
+    reader = PdfReader(output)
+    expected = [page.extract_text() for page in reader.pages]
+
+    assert reader.extract_text_all(workers=2, executor=executor) == expected
+    assert reader.extract_text_all(workers=1) == expected
+    unordered = dict(reader.iter_extract_text(workers=2, executor=executor, ordered=False))
+    assert [unordered[index] for index in range(len(expected))] == expected
+    layout = reader.extract_text_all(workers=2, executor=executor, extraction_mode="layout")
+    assert layout[1] == reader.pages[1].extract_text(extraction_mode="layout")
+
+
+def test_extract_text_all__reader_options():
+    object_cache = LRUObjectCache(max_entries=5)
+    reader = PdfReader(
+        RESOURCE_ROOT / "pdflatex-outline.pdf", root_object_recovery_limit=None, object_cache=object_cache
+    )
+    expected = [page.extract_text() for page in reader.pages]
+    with mock.patch("pypdf._parallel.PdfReader", wraps=PdfReader) as reader_class:
+        assert reader.extract_text_all(workers=2, executor="thread") == expected
+    kwargs = reader_class.call_args.kwargs
+    assert kwargs["root_object_recovery_limit"] == sys.maxsize
+    assert kwargs["object_cache"].max_entries == 5
+    assert kwargs["object_cache"] is not object_cache
+    assert len(kwargs["object_cache"]) > 0
+
+
+def test_extract_text_all__encrypted():
+    writer = PdfWriter(RESOURCE_ROOT / "pdflatex-outline.pdf")
+    writer.encrypt("asdfzxcv", "owner", algorithm="RC4-128")
+    output = BytesIO()
+    writer.write(output)
+    reader = PdfReader(output)
+    reader.decrypt("asdfzxcv")
+    expected = [page.extract_text() for page in reader.pages]
+    assert reader.extract_text_all(workers=2, executor="thread", password="asdfzxcv") == expected
+    with pytest.raises(FileNotDecryptedError):
+        reader.extract_text_all(workers=2, executor="thread")
+
+    with pytest.raises(ValueError, match=r"^Unknown executor 'fork', expected 'process' or 'thread'$"):
+        reader.extract_text_all(executor="fork")
+
+
+def test_prefetch():
+    path = RESOURCE_ROOT / "GeoBase_NHNC1_Data_Model_UML_EN.pdf"
+    expected = [page.extract_text() for page in PdfReader(path).pages]
+
+    reader = PdfReader(path)
+    reader.prefetch(pages=[0], kinds=["fonts"], workers=2)
+    assert reader.pages[0][PG.CONTENTS].decoded_self is None
+    to_unicode = next(
+        font["/ToUnicode"] for font in reader.pages[0][PG.RESOURCES]["/Font"].values() if "/ToUnicode" in font
+    )
+    assert to_unicode.decoded_self is not None
+
+    reader.prefetch(workers=4)
+    for page in reader.pages:
+        contents = page[PG.CONTENTS]
+        for content in contents if isinstance(contents, ArrayObject) else [contents]:
+            assert content.get_object().decoded_self is not None
+    assert [page.extract_text() for page in reader.pages] == expected
+
+    with pytest.raises(ValueError, match=r"^Unknown kind 'images', expected one of contents, xobjects, fonts$"):
+        reader.prefetch(kinds=["images"])
+
+
+def test_prefetch__object_cache():
+    path = RESOURCE_ROOT / "GeoBase_NHNC1_Data_Model_UML_EN.pdf"
+    expected = [page.extract_text() for page in PdfReader(path).pages]
+
+    object_cache = LRUObjectCache(max_entries=4)
+    reader = PdfReader(path, object_cache=object_cache)
+    for _ in range(3):
+        reader.prefetch(workers=4)
+    assert object_cache.evictions > 0
+    assert [page.extract_text() for page in reader.pages] == expected
+
+
+def test_prefetch__invalid_stream():
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "crazyones.pdf")
+    writer.pages[0].compress_content_streams()
+    writer.pages[0][PG.CONTENTS][NameObject("/Filter")] = NameObject("/UnknownDecode")
+    output = BytesIO()
+    writer.write(output)
+
+    reader = PdfReader(output)
+    reader.prefetch(workers=2)
+    assert reader.pages[0][PG.CONTENTS].decoded_self is None
+    with pytest.raises(NotImplementedError, match=r"^Unsupported filter /UnknownDecode$"):
+        reader.pages[0].extract_text()
@@ -0,0 +1,119 @@
+"""Test the pypdf._serializer module."""
+from io import BytesIO
+from unittest import mock
+
+import pytest
+
+from pypdf import PdfWriter
+from pypdf._serializer import ObjectSerializer
+from pypdf.generic import (
+    ArrayObject,
+    BooleanObject,
+    ByteStringObject,
+    ContentStream,
+    DecodedStreamObject,
+    DictionaryObject,
+    Fit,
+    FloatObject,
+    IndirectObject,
+    NameObject,
+    NullObject,
+    NumberObject,
+    OutlineItem,
+    PdfObject,
+    RectangleObject,
+    TextStringObject,
+)
+
+from . import RESOURCE_ROOT
+
+
+def _write_to_stream(obj: PdfObject) -> bytes:
+    stream = BytesIO()
+    obj.write_to_stream(stream)
+    return stream.getvalue()
+
+
+def _serialize(obj: PdfObject) -> bytes:
+    stream = BytesIO()
+    serializer = ObjectSerializer(stream)
+    serializer.write_object(obj)
+    serializer.flush()
+    return stream.getvalue()
+
+
+def _stream_with_length() -> DecodedStreamObject:
+    stream = DecodedStreamObject()
+    stream[NameObject("/Length")] = NumberObject(1)
+    stream[NameObject("/Filter")] = ArrayObject()
+    stream.set_data(b"some data")
+    return stream
+
+
+def _content_stream() -> ContentStream:
+    stream = ContentStream(None, None)
+    stream.operations = [([NumberObject(1), FloatObject(0.5)], b"Tf")]
+    return stream
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        NullObject(),
+        BooleanObject(True),
+        BooleanObject(False),
+        IndirectObject(12, 3, None),
+        FloatObject(0),
+        FloatObject(-0.0),
+        FloatObject(1 / 3),
+        FloatObject(-123456.789),
+        FloatObject(1e-9),
+        NumberObject(-42),
+        ByteStringObject(b"\x00\xff"),
+        TextStringObject("Hello (World) \\ 1"),
+        TextStringObject("Grüße €"),
+        NameObject("/Name with #/() and ü"),
+        RectangleObject([0, 0, 612.5, 792]),
+        ArrayObject([NameObject("/A"), ArrayObject(), DictionaryObject()]),
+        DictionaryObject({NameObject("/%hidden%"): NullObject(), NameObject("/A"): FloatObject(1.5)}),
+        _stream_with_length(),
+        _content_stream(),
+        OutlineItem("Title", NumberObject(0), Fit.fit()),
+    ],
+)
+def test_same_output_as_write_to_stream(obj):
+    # The stream with a /Length is changed by write_to_stream().
+    assert _serialize(obj) == _write_to_stream(obj)
+
+
+def test_block_size():
+    stream = BytesIO()
+    serializer = ObjectSerializer(stream, block_size=10)
+    serializer.write(b"12345")
+    serializer.write_object(NameObject("/N"))
+    assert stream.getvalue() == b""
+    assert serializer.tell() == 7
+
+    data = DecodedStreamObject()
+    data.set_data(b"0123456789")
+    serializer.write_object(data)
+    # The data of a large stream is written directly after the buffer.
+    assert stream.getvalue() == b"12345/N<<\n/Length 10\n>>\nstream\n0123456789\nendstream"
+    assert serializer.tell() == 51
+    serializer.write(b"%%EOF")
+    assert serializer.pop_buffer() == b"%%EOF"
+    assert serializer.tell() == 56
+    assert len(stream.getvalue()) == 51
+
+
+@pytest.mark.parametrize("use_object_streams", [False, True])
+def test_writer_output(use_object_streams):
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "pdflatex-outline.pdf", use_object_streams=use_object_streams)
+    writer._ID = ArrayObject([ByteStringObject(b"1"), ByteStringObject(b"1")])
+    output = BytesIO()
+    writer.write(output)
+
+    expected = BytesIO()
+    with mock.patch.object(ObjectSerializer, "_write", lambda self, obj: obj.write_to_stream(self)):
+        writer.write(expected)
+    assert output.getvalue() == expected.getvalue()
@@ -1,12 +1,16 @@
 """Test the pypdf._writer module."""
 
+import gc
+import math
 import re
 import shutil
 import subprocess
+import threading
+import weakref
 from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any
+from typing import Any, Optional
 from unittest import mock
 
 import pytest
@@ -29,11 +33,13 @@ from pypdf.generic import (
     DecodedStreamObject,
     Destination,
     DictionaryObject,
+    EncodedStreamObject,
     Fit,
     IndirectObject,
     NameObject,
     NullObject,
     NumberObject,
+    PdfObject,
     RectangleObject,
     StreamObject,
     TextStringObject,
@@ -1675,6 +1681,48 @@ def test_late_iss1654():
     writer.write(b)
 
 
+@pytest.mark.parametrize("workers", [1, 4])
+def test_compress_content_streams(workers):
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "crazyones.pdf")
+    writer.append(RESOURCE_ROOT / "multilang.pdf")
+    # A page with an array of content streams.
+    content = ContentStream(None, writer)
+    content.set_data(b"0 0 m 10 10 l S\n")
+    writer.add_blank_page().replace_contents(ArrayObject([content, ContentStream(None, writer)]))
+    expected_contents = [page.get_contents().get_data() for page in writer.pages]
+
+    stream = DecodedStreamObject()
+    stream.set_data(b"uncompressed " * 100)
+    stream_reference = writer._add_object(stream)
+    metadata = DecodedStreamObject()
+    metadata[NameObject("/Type")] = NameObject("/Metadata")
+    metadata.set_data(b"<x:xmpmeta/>")
+    metadata_reference = writer._add_object(metadata)
+
+    writer.compress_content_streams(workers=workers)
+
+    for page, expected in zip(writer.pages, expected_contents):
+        contents = page["/Contents"]
+        assert isinstance(contents, EncodedStreamObject)
+        assert contents["/Filter"] == "/FlateDecode"
+        assert contents.get_data() == expected
+    assert isinstance(stream_reference.get_object(), EncodedStreamObject)
+    assert stream_reference.get_object().get_data() == b"uncompressed " * 100
+    assert metadata_reference.get_object() is metadata
+
+    reference = PdfWriter(clone_from=RESOURCE_ROOT / "crazyones.pdf")
+    reference.append(RESOURCE_ROOT / "multilang.pdf")
+    for page in reference.pages:
+        page.compress_content_streams()
+    for page, reference_page in zip(writer.pages, reference.pages):
+        assert page["/Contents"].get_data() == reference_page["/Contents"].get_data()
+
+    output = BytesIO()
+    writer.write(output)
+    reader = PdfReader(output)
+    assert reader.pages[-1].get_contents().get_data() == b"0 0 m 10 10 l S\n"
+
+
 @pytest.mark.enable_socket
 def test_iss1723():
     # test of an annotation(link) directly stored in the /Annots in the page
@@ -3402,6 +3450,70 @@ def test_encrypt__incremental():
         writer.encrypt(user_password="dummy")
 
 
+def test_incremental__modification_tracking__unchanged():
+    writer = PdfWriter(RESOURCE_ROOT / "box.pdf", incremental=True)
+    resources = writer.pages[0]["/Resources"]
+    resources.pop("/ProcSet", None)
+    with pytest.raises(KeyError):
+        del resources["/ProcSet"]
+    resources.update({})
+    resources.update(resources)
+    resources |= {NameObject("/XObject"): resources.raw_get("/XObject")}
+    assert writer.list_objects_in_increment() == []
+
+    resources.pop("/ExtGState")
+    assert writer.list_objects_in_increment() == [resources.indirect_reference]
+
+
+def test_incremental__modification_tracking():
+    writer = PdfWriter(RESOURCE_ROOT / "Seige_of_Vicksburg_Sample_OCR-crazyones-merged.pdf", incremental=True)
+    page = writer.pages[0]
+    with mock.patch.object(StreamObject, "hash_bin", side_effect=AssertionError), mock.patch.object(
+        DictionaryObject, "hash_bin", side_effect=AssertionError
+    ), mock.patch.object(PageObject, "hash_bin", side_effect=AssertionError):
+        assert writer.list_objects_in_increment() == []
+
+        # Modifications of direct objects are reported to the object containing them.
+        page["/Resources"]["/Font"][NameObject("/F0")] = page["/Resources"]["/Font"].raw_get("/F0")
+        assert writer.list_objects_in_increment() == []
+        page["/Resources"]["/XObject"].pop("/Im004")
+        assert writer.list_objects_in_increment() == [page.indirect_reference]
+
+        contents = page["/Contents"][1].get_object()
+        contents.set_data(contents.get_data() + b"\n")
+        writer.pages[1]["/MediaBox"].append(NumberObject(0))
+        assert writer.list_objects_in_increment() == sorted(
+            [page.indirect_reference, writer.pages[1].indirect_reference, contents.indirect_reference],
+            key=lambda reference: reference.idnum,
+        )
+
+    # A replaced object is tracked if it equals the original one.
+    writer._replace_object(page.indirect_reference, DictionaryObject(page))
+    assert len(writer.list_objects_in_increment()) == 3
+    copy = writer._replace_object(writer.pages[2].indirect_reference, DictionaryObject(writer.pages[2]))
+    assert writer._tracked_objects[copy.indirect_reference.idnum - 1] is copy
+    assert len(writer.list_objects_in_increment()) == 3
+
+    # Objects sharing a direct object are compared with their original hash.
+    writer = PdfWriter(RESOURCE_ROOT / "crazyones.pdf", incremental=True)
+    shared = ArrayObject([NumberObject(1)])
+    info = writer._info
+    writer.root_object[NameObject("/Shared")] = shared
+    info[NameObject("/Shared")] = shared
+    writer._original_hash[writer.root_object.indirect_reference.idnum - 1] = writer.root_object.hash_bin()
+    writer._original_hash[info.indirect_reference.idnum - 1] = info.hash_bin()
+    writer._track_modifications(writer.root_object.indirect_reference.idnum, writer.root_object)
+    writer._track_modifications(info.indirect_reference.idnum, info)
+    writer._modified_objects.clear()
+    assert writer._tracked_objects[info.indirect_reference.idnum - 1] is None
+    expected = writer.list_objects_in_increment()
+    shared.append(NumberObject(2))
+    assert writer.list_objects_in_increment() == sorted(
+        [*expected, writer.root_object.indirect_reference, info.indirect_reference],
+        key=lambda reference: reference.idnum,
+    )
+
+
 @pytest.mark.timeout(5)
 def test_get_filtered_outline__first__cyclic(caplog) -> None:
     writer = PdfWriter()
@@ -3509,3 +3621,200 @@ def test_add_articles_thread__cyclic() -> None:
             match=r"^Detected cyclic article structure\.$"
     ):
         writer._add_articles_thread(thread=thread, pages={}, reader=reader)
+
+
+@pytest.mark.parametrize("password", [None, "secret"])
+def test_use_object_streams(password):
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "pdflatex-outline.pdf", use_object_streams=True, objects_per_stream=5)
+    unused = writer._add_object(DictionaryObject())
+    writer._objects[unused.idnum - 1] = None
+    if password:
+        writer.encrypt(password, algorithm="AES-128")
+    output = BytesIO()
+    writer.write(output)
+    data = output.getvalue()
+    assert data.startswith(b"%PDF-1.5\n")
+    assert b"/ObjStm" in data
+    assert b"\nxref\n" not in data
+
+    reader = PdfReader(output, strict=True, password=password)
+    expected = PdfReader(RESOURCE_ROOT / "pdflatex-outline.pdf")
+    assert [page.extract_text() for page in reader.pages] == [page.extract_text() for page in expected.pages]
+    assert reader.metadata == writer.metadata
+    assert len(reader.xref_objStm) > 5
+    assert unused.idnum not in reader.xref_objStm
+    assert unused.idnum not in reader.xref[0]
+
+    uncompressed = BytesIO()
+    PdfWriter(clone_from=RESOURCE_ROOT / "pdflatex-outline.pdf").write(uncompressed)
+    assert len(data) < len(uncompressed.getvalue())
+
+
+def test_use_object_streams__invalid_objects_per_stream():
+    with pytest.raises(ValueError, match=r"^objects_per_stream must be at least 1, not 0$"):
+        PdfWriter(use_object_streams=True, objects_per_stream=0)
+
+
+@pytest.mark.parametrize("use_object_streams", [False, True])
+def test_write_workers(use_object_streams):
+    prepare_object = PdfWriter._prepare_object
+    threads = set()
+
+    def record_thread(*args: Any) -> PdfObject:
+        threads.add(threading.get_ident())
+        return prepare_object(*args)
+
+    def write(workers: Optional[int]) -> bytes:
+        writer = PdfWriter(clone_from=RESOURCE_ROOT / "pdflatex-outline.pdf", use_object_streams=use_object_streams)
+        writer.write_workers = workers
+        writer.encrypt("secret", algorithm="RC4-128")
+        output = BytesIO()
+        threads.clear()
+        with mock.patch("pypdf._writer.PARALLEL_WRITE_MIN_SIZE", 0), mock.patch.object(
+            PdfWriter, "_prepare_object", side_effect=record_thread
+        ):
+            writer.write(output)
+        return output.getvalue()
+
+    expected = write(1)
+    assert threads == {threading.get_ident()}
+    # The streams are prepared by other threads, the output is the same.
+    assert write(4) == expected
+    assert threads - {threading.get_ident()}
+    assert write(None) == expected
+    assert PdfWriter().write_workers == 1
+
+    reader = PdfReader(BytesIO(expected), password="secret")
+    assert reader.pages[0].extract_text() == PdfReader(RESOURCE_ROOT / "pdflatex-outline.pdf").pages[0].extract_text()
+
+
+def _check_page_tree(node: DictionaryObject, fanout: int) -> int:
+    kids = node["/Kids"]
+    assert len(kids) <= fanout
+    count = 0
+    for kid in kids:
+        obj = kid.get_object()
+        assert obj.raw_get("/Parent") == node.indirect_reference
+        count += _check_page_tree(obj, fanout) if obj["/Type"] == "/Pages" else 1
+    assert node["/Count"] == count
+    return count
+
+
+def test_page_tree_fanout():
+    writer = PdfWriter(page_tree_fanout=4)
+    for i in range(50):
+        writer.add_blank_page(width=100 + i, height=100)
+    for i in range(10):
+        writer.insert_page(PageObject.create_blank_page(width=200 + i, height=100), 5 * i)
+    del writer.pages[7]
+    del writer.pages[0:12]
+    root = writer.root_object["/Pages"]
+    assert _check_page_tree(root, 4) == 47
+    assert root["/Kids"][0]["/Kids"][0]["/Type"] == "/Pages"
+    widths = [page.mediabox.width for page in writer.pages]
+    assert widths[:6] == [110, 111, 203, 112, 113, 114]
+
+    output = BytesIO()
+    writer.write(output)
+    reader = PdfReader(output)
+    assert [page.mediabox.width for page in reader.pages] == widths
+
+    # The flat page tree of the cloned document is rebuilt when writing.
+    writer = PdfWriter(clone_from=reader, page_tree_fanout=3)
+    writer.root_object["/Pages"][NameObject("/Rotate")] = NumberObject(90)
+    writer.write(output)
+    _check_page_tree(writer.root_object["/Pages"], 3)
+    reader = PdfReader(output)
+    assert [page.mediabox.width for page in reader.pages] == widths
+    assert {page.rotation for page in reader.pages} == {90}
+
+
+def _page_tree_depth(node: DictionaryObject) -> int:
+    kids = [kid.get_object() for kid in node["/Kids"]]
+    return 1 + max((_page_tree_depth(kid) for kid in kids if kid["/Type"] == "/Pages"), default=0)
+
+
+@pytest.mark.parametrize(("fanout", "depth"), [(3, 7), (4, 6), (10, 4)])
+def test_page_tree_fanout__append(fanout, depth):
+    writer = PdfWriter(page_tree_fanout=fanout)
+    for _ in range(2000):
+        writer.add_blank_page(width=100, height=100)
+    root = writer.root_object["/Pages"]
+    assert _check_page_tree(root, fanout) == 2000
+    # The nodes the pages have been appended to are kept full.
+    assert _page_tree_depth(root) == depth == math.ceil(math.log(2000, fanout))
+
+
+def test_page_tree_fanout__invalid():
+    with pytest.raises(ValueError, match=r"^page_tree_fanout must be at least 3, not 2$"):
+        PdfWriter(page_tree_fanout=2)
+
+
+def test_streaming(tmp_path):
+    paths = [
+        RESOURCE_ROOT / "pdflatex-outline.pdf",
+        RESOURCE_ROOT / "crazyones.pdf",
+        RESOURCE_ROOT / "libreoffice-form.pdf",
+    ]
+    expected = PdfWriter()
+    for path in paths:
+        expected.append(path, outline_item=path.name)
+    expected_output = BytesIO()
+    expected.write(expected_output)
+
+    readers = []
+    with PdfWriter.streaming(tmp_path / "out.pdf") as writer:
+        writer.flush()
+        for path in paths:
+            reader = PdfReader(path)
+            readers.append(weakref.ref(reader))
+            writer.append(reader, outline_item=path.name)
+            del reader
+            assert len(writer._streamed_offsets) > 0
+    # The source documents are not kept by the writer.
+    gc.collect()
+    assert [reader() for reader in readers] == [None, None, None]
+
+    reader = PdfReader(tmp_path / "out.pdf", strict=True)
+    expected_reader = PdfReader(expected_output)
+    assert reader.pdf_header == "%PDF-1.3"
+    assert reader.root_object["/Version"] == "/1.5"
+    assert [page.extract_text() for page in reader.pages] == [page.extract_text() for page in expected_reader.pages]
+    assert [item.title for item in reader.outline if not isinstance(item, list)] == [path.name for path in paths]
+    assert reader.get_fields().keys() == expected_reader.get_fields().keys()
+    assert len(reader.xref[0]) == len(expected_reader.xref[0])
+
+
+def test_streaming__append_same_reader(tmp_path):
+    reader = PdfReader(RESOURCE_ROOT / "pdflatex-outline.pdf")
+    assert "/Annots" in reader.pages[0]
+    with PdfWriter.streaming(tmp_path / "out.pdf") as writer:
+        writer.append(reader)
+        writer.append(reader)
+
+    output = PdfReader(tmp_path / "out.pdf", strict=True)
+    assert len(output.pages) == 2 * len(reader.pages)
+    first, second = output.pages[0]["/Annots"], output.pages[len(reader.pages)]["/Annots"]
+    assert len(first) == len(second) == len(reader.pages[0]["/Annots"])
+    assert {annotation.idnum for annotation in first}.isdisjoint(annotation.idnum for annotation in second)
+    assert [annotation["/Subtype"] for annotation in second] == [annotation["/Subtype"] for annotation in first]
+
+
+def test_streaming__errors():
+    writer = PdfWriter.streaming(BytesIO())
+    writer.append(RESOURCE_ROOT / "crazyones.pdf")
+    with pytest.raises(PyPdfError, match=r"^A streaming writer has to be encrypted before objects are written\.$"):
+        writer.encrypt("password")
+    with pytest.raises(PyPdfError, match=r"^A streaming writer writes to its output while it is built"):
+        writer.write(BytesIO())
+    writer.close()
+    writer.close()
+
+    with pytest.raises(PyPdfError, match=r"^Only a writer created by PdfWriter.streaming\(\) can be flushed\.$"):
+        PdfWriter().flush()
+
+    output = BytesIO()
+    with pytest.raises(ValueError, match="failure"), PdfWriter.streaming(output) as writer:
+        writer.append(RESOURCE_ROOT / "crazyones.pdf")
+        raise ValueError("failure")
+    assert b"startxref" not in output.getvalue()